@@ -0,0 +1,34 @@
+"""
+Compare detect_operator called in a loop with the batch detect_operators.
+
+detect_operators is about 4 times faster on these numbers. A single dictionary lookup per number is only about 8
+times faster than the loop in pure Python, so the 10x target is out of reach without a compiled extension.
+
+Usage: python benchmarks/bench_detect_operator.py
+"""
+import os
+import random
+import sys
+import timeit
+
+# run from the repository without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymesomb.utils import detect_operator, detect_operators  # noqa: E402
+
+PREFIXES = ['67', '650', '683', '69', '655', '66', '242', '233', '62', '7']
+
+
+def main(count=100000):
+    rng = random.Random(0)
+    numbers = [rng.choice(['237', '']) + rng.choice(PREFIXES) + ''.join(rng.choices('0123456789', k=7))
+               for _ in range(count)]
+
+    loop = timeit.timeit(lambda: [detect_operator(phone) for phone in numbers], number=1)
+    batch = timeit.timeit(lambda: detect_operators(numbers), number=1)
+    print(f'{count} numbers: detect_operator loop {loop * 1e3:.1f} ms, detect_operators {batch * 1e3:.1f} ms '
+          f'({loop / batch:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Compare the cost of generating nonces with the former RandomGenerator.nonce (random.choice per character) and with
+the providers of pymesomb.nonce, in one thread and shared by several threads.
+
+Usage: python benchmarks/bench_nonce.py
+"""
+import os
+import random
+import string
+import sys
+import threading
+import time
+import timeit
+
+# run from the repository without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymesomb.nonce import RandomNonceProvider, UniqueNonceProvider  # noqa: E402
+
+LETTERS = string.ascii_letters + string.digits
+
+
+def legacy_nonce(length=40):
+    return ''.join(random.choice(LETTERS) for i in range(length))
+
+
+def threaded(function, threads=8, number=20000):
+    def run():
+        for _ in range(number):
+            function()
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return (time.perf_counter() - start) / (threads * number)
+
+
+def main(number=200000):
+    providers = {
+        'RandomGenerator.nonce (former)': legacy_nonce,
+        'RandomNonceProvider': RandomNonceProvider(),
+        'UniqueNonceProvider': UniqueNonceProvider(),
+    }
+
+    legacy = None
+    for name, provider in providers.items():
+        single = timeit.timeit(provider, number=number) / number
+        legacy = legacy or single
+        print(f'{name}: {single * 1e6:.2f} us ({legacy / single:.1f}x), '
+              f'8 threads {threaded(provider) * 1e6:.2f} us per nonce')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Compare the cost of a call returning models and the same call in raw response mode.
+
+The transport is replaced by a function returning a decoded collect response, so only the work of the client is
+measured: building and signing the request, then converting the response.
+
+Usage: python benchmarks/bench_response_mode.py
+"""
+import os
+import sys
+import timeit
+
+# run from the repository without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymesomb.operations import PaymentOperation  # noqa: E402
+
+APPLICATION_KEY = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+ACCESS_KEY = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+SECRET_KEY = 'fe8c2445-810f-4caa-95c9-778d51580163'
+TRANSACTION = {
+    'pk': 'a4bd7d2b-e7ac-40ce-b1e1-9b1b9e5e1a1c', 'status': 'SUCCESS', 'type': 'COLLECT', 'amount': 98, 'fees': 2,
+    'b_party': '237670000000', 'message': None, 'service': 'MTN', 'reference': '1', 'ts': '2025-02-10T10:08:31Z',
+    'country': 'CM', 'currency': 'XAF', 'fin_trx_id': 'MTN1', 'trxamount': 100,
+    'location': {'town': 'Douala', 'region': 'Littoral', 'country': 'CM'},
+    'customer': {'email': 'john@doe.com', 'phone': '+237677550000', 'first_name': 'John', 'last_name': 'Doe'},
+    'products': [{'id': '1', 'name': 'Book', 'category': 'Books', 'quantity': 1, 'amount': 100}],
+}
+RESPONSE = {'success': True, 'message': 'Success', 'redirect': None, 'reference': '1', 'status': 'SUCCESS',
+            'transaction': TRANSACTION}
+TRANSACTIONS = [dict(TRANSACTION, pk=str(i)) for i in range(50)]
+
+
+class OfflinePaymentOperation(PaymentOperation):
+    def execute_request(self, method, endpoint, date, nonce='', body=None, mode=None, timeout=None, deadline=None):
+        self.signer.sign(method, self.build_url(endpoint), date, nonce, {'content-type': 'application/json'},
+                         b'{}')
+        return TRANSACTIONS if endpoint.startswith('payment/transactions/') else RESPONSE
+
+
+def main(number=20000):
+    operation = OfflinePaymentOperation(APPLICATION_KEY, ACCESS_KEY, SECRET_KEY)
+    calls = {
+        'make_collect': lambda op: op.make_collect(amount=100, service='MTN', payer='670000000', trx_id='1'),
+        'get_transactions (50)': lambda op: op.get_transactions([str(i) for i in range(50)]),
+    }
+
+    for name, call in calls.items():
+        results = {}
+        for mode in ('model', 'raw'):
+            view = operation.with_response_mode(mode)
+            results[mode] = timeit.timeit(lambda: call(view), number=number) / number * 1e6
+
+        print(f"{name}: model {results['model']:.2f} us, raw {results['raw']:.2f} us, "
+              f"saved {results['model'] - results['raw']:.2f} us per call ({results['model'] / results['raw']:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Compare the cost of signing a request with Signature.sign_request and with a reusable Signer.
+
+Signature.sign_request is called as the operations did before the Signer: with the body as a dict, serialized by the
+signature. The Signer is called as the operations do now, with the body serialized once by encode_json (the same
+bytes are sent) and the timestamp already computed for the x-mesomb-date header. The POST case is measured with and
+without the serialization of the body.
+
+Usage: python benchmarks/bench_signature.py
+"""
+import os
+import sys
+import timeit
+from datetime import datetime
+
+# run from the repository without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymesomb.signature import Signature, Signer  # noqa: E402
+from pymesomb.utils import encode_json  # noqa: E402
+
+ACCESS_KEY = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+SECRET_KEY = 'fe8c2445-810f-4caa-95c9-778d51580163'
+HOST = 'https://mesomb.hachther.com/api/v1.1'
+BODY = {'amount': 100, 'payer': '670000000', 'fees': True, 'service': 'MTN', 'country': 'CM', 'currency': 'XAF'}
+CASES = {
+    'POST collect': ('POST', f'{HOST}/payment/collect/', {'content-type': 'application/json'}, BODY),
+    'GET check': ('GET', f'{HOST}/payment/transactions/check/?ids=a,b,c&source=MESOMB', None, None),
+}
+
+
+def main(number=50000):
+    date = datetime.now()
+    timestamp = str(int(date.timestamp()))
+    credentials = {'access_key': ACCESS_KEY, 'secret_key': SECRET_KEY}
+    signer = Signer('payment', ACCESS_KEY, SECRET_KEY)
+
+    for name, (method, url, headers, body) in CASES.items():
+        data = encode_json(body) if body is not None else None
+        legacy = timeit.timeit(lambda: Signature.sign_request('payment', method, url, date, 'nonce', credentials,
+                                                              dict(headers or {}), body), number=number)
+        cached = timeit.timeit(lambda: signer.sign(method, url, date, 'nonce', headers, data, timestamp),
+                               number=number)
+
+        print(f'{name}: Signature.sign_request {legacy / number * 1e6:.2f} us, '
+              f'Signer.sign {cached / number * 1e6:.2f} us ({legacy / cached:.1f}x)')
+        if body is not None:
+            encoded = timeit.timeit(lambda: signer.sign(method, url, date, 'nonce', headers, encode_json(body),
+                                                        timestamp), number=number)
+            print(f'{name}: encode_json + Signer.sign {encoded / number * 1e6:.2f} us ({legacy / encoded:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,295 @@
+import asyncio
+import copy
+from collections import deque
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterable, Callable, Awaitable
+
+import httpx
+
+from pymesomb.coalesce import ASYNC_SINGLE_FLIGHT
+from pymesomb.exceptions import DeadlineExceededException
+from pymesomb.models import APaginated, Application, Wallet
+from pymesomb.operations import (PaymentOperation, WalletOperation, FundraisingOperation, Timeout, _get_result,
+                                 _merge_by_ids, _get_field, _ServiceGroups, get_last_page)
+
+
+class AsyncOperationMixin:
+    """
+    Run the operations of a MeSomb service on asyncio.
+
+    The public methods keep the same name and parameters as the blocking operations but return coroutines. Requests
+    are sent with a non-blocking HTTP client owning its own pool of connections, so many operations can be awaited
+    concurrently on the same event loop.
+
+    Args:
+        target: the key of the application, fund or provider
+        access_key: the access key provided by MeSomb
+        secret_key: the secret key provided by MeSomb
+        language: the language of the messages returned by MeSomb (Default value = 'en')
+        client (httpx.AsyncClient, optional): client to use for the requests, it is not closed by the operation
+        max_connections (int): maximum number of concurrent connections (Default value = 100)
+        max_keepalive_connections (int): maximum number of idle connections kept in the pool (Default value = 20)
+        keepalive_expiry (float): time in seconds an idle connection is kept in the pool (Default value = 5.0)
+    """
+
+    def __init__(self, target, access_key, secret_key, language='en', client: Optional[httpx.AsyncClient] = None,
+                 max_connections: int = 100, max_keepalive_connections: int = 20, keepalive_expiry: float = 5.0,
+                 **kwargs):
+        super().__init__(target, access_key, secret_key, language, **kwargs)
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_keepalive_connections,
+                                   keepalive_expiry=keepalive_expiry)
+
+        self._client = client
+        self._owns_client = client is None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        The HTTP client used to send the requests, created on first use
+
+        Returns:
+            httpx.AsyncClient
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(limits=self.limits)
+        return self._client
+
+    def with_response_mode(self, response_mode: str):
+        assert response_mode in ['model', 'raw'], 'Response mode must be model or raw'
+        operation = copy.copy(self)
+        operation.response_mode = response_mode
+        operation._client = self.client
+        operation._owns_client = False
+        return operation
+
+    async def aclose(self):
+        """
+        Close the connections opened by the operation.
+
+        A client given at the creation of the operation is left open since it can be shared with other operations.
+        """
+        if self._client is not None and self._owns_client:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def execute_request(self, method: str, endpoint: str, date: datetime, nonce: str = '',
+                              body: Dict[str, Any] = None, mode: Optional[str] = None,
+                              timeout: Optional[Timeout] = None, deadline: Optional[float] = None):
+        """
+        Execute the request to the MeSomb API
+
+        Args:
+            method (str): the HTTP method to use
+            endpoint (str): the endpoint to use in the request
+            date (datetime): the date of the request
+            nonce (str): the nonce of the request (Default value = '')
+            body (Dict[str, Any]): the body to use in the request (Default value = None)
+            mode (Optional[str]): the mode to use in the request (Default value = None)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of each attempt
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
+
+        Returns:
+            dict: the response of the request
+
+        Raises:
+            ServiceNotFoundException: When the service is not found
+            PermissionDeniedException: When the permission is denied
+            InvalidClientRequestException: When the client request is invalid
+            ServerException: When the server return an error
+            TimeoutException: When MeSomb does not answer in time or the deadline is exceeded
+            httpx.TransportError: When MeSomb can not be reached after the retries
+        """
+        expires_at = self.get_expiry(deadline)
+        url, headers, data = self.prepare_request(method, endpoint, date, nonce, body, mode)
+        policy = self.get_retry_policy(method)
+
+        attempt = 0
+        while True:
+            remaining = self.get_remaining(expires_at)
+            if self.rate_limiter and not await self.rate_limiter.acquire_async(self.target, timeout=remaining):
+                raise DeadlineExceededException('The deadline of the operation is exceeded by the rate limiter', None)
+            connect, read = self.get_timeouts(timeout, expires_at)
+            try:
+                response = await self.client.request(method, url, content=data, headers=headers,
+                                                     timeout=httpx.Timeout(read, connect=connect, pool=connect))
+            except httpx.TransportError as e:
+                backoff = self.get_backoff(policy, attempt, None, expires_at)
+                if backoff is None:
+                    timeout_type = 'connect' if isinstance(e, (httpx.ConnectTimeout, httpx.PoolTimeout)) else \
+                        'read' if isinstance(e, httpx.TimeoutException) else None
+                    expired = policy.can_retry(attempt)
+                    raise self.get_transport_exception(e, timeout_type, expired) from e
+            else:
+                if not policy.is_retryable_status(response.status_code):
+                    return self.process_response(response)
+                backoff = self.get_backoff(policy, attempt, response, expires_at)
+                if backoff is None:
+                    return self.process_response(response)
+
+            await asyncio.sleep(backoff)
+            attempt += 1
+            self.sign_headers(method, url, headers, data, datetime.now())
+
+    async def _request(self, parser, method: str, endpoint: str, nonce: str = '', body: Dict[str, Any] = None,
+                       mode: Optional[str] = None, timeout: Optional[Timeout] = None,
+                       deadline: Optional[float] = None):
+        if method == 'GET' and self.coalesce:
+            return await ASYNC_SINGLE_FLIGHT.do(
+                self.get_coalescing_key(parser, endpoint),
+                lambda: self._send(parser, method, endpoint, nonce, body, mode, timeout, deadline),
+                deadline if deadline is not None else self.deadline,
+            )
+
+        return await self._send(parser, method, endpoint, nonce, body, mode, timeout, deadline)
+
+    async def _send(self, parser, method: str, endpoint: str, nonce: str = '', body: Dict[str, Any] = None,
+                    mode: Optional[str] = None, timeout: Optional[Timeout] = None,
+                    deadline: Optional[float] = None):
+        data = await self.execute_request(method, endpoint, datetime.now(), nonce, body, mode, timeout, deadline)
+
+        return self._parse(parser, data)
+
+    async def _request_ids(self, model, endpoint: str, ids: Iterable[Any], repeat: bool = False,
+                           timeout: Optional[Timeout] = None, deadline: Optional[float] = None):
+        ids, endpoints = self.split_ids(endpoint, ids, repeat)
+        expires_at = self.get_expiry(deadline)
+
+        async def fetch(endpoint):
+            return await self._request(None, 'GET', endpoint, timeout=timeout,
+                                       deadline=self.get_remaining(expires_at))
+
+        results = await asyncio.gather(*[fetch(endpoint) for endpoint in endpoints])
+
+        items = _merge_by_ids(ids, results)
+        return [model(item) for item in items] if model and self.response_mode == 'model' else items
+
+
+class AsyncPaymentOperation(AsyncOperationMixin, PaymentOperation):
+    """
+    Asynchronous version of :PaymentOperation:
+    """
+
+    async def get_status(self, timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> Application:
+        endpoint = 'payment/status/'
+
+        if self.status_cache is None or self.response_mode == 'raw':
+            return await self._request(Application, 'GET', endpoint, timeout=timeout, deadline=deadline)
+
+        return await self.status_cache.get_or_load_async(
+            self.target, lambda: self._request(Application, 'GET', endpoint, timeout=timeout, deadline=deadline))
+
+    async def make_collect_many(self, specs: Iterable[Dict[str, Any]], concurrency: int = 100,
+                                timeout: Optional[Timeout] = None, deadline: Optional[float] = None,
+                                service_concurrency: Optional[int] = None):
+        """
+        Collect money from many accounts concurrently.
+
+        Asynchronous generator working as :PaymentOperation.make_collect_many: with tasks instead of threads.
+
+        Args:
+            specs (Iterable[Dict[str, Any]]): the parameters of :make_collect: for each item
+            concurrency (int): maximum number of collects sent or waiting at the same time (Default value = 100)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of each collect
+            deadline (float, optional): maximum time in seconds of each collect, retries included
+            service_concurrency (int, optional): maximum number of collects of the same service sent at the same time
+
+        Returns:
+            AsyncIterator[Tuple[int, Union[TransactionResponse, Exception]]]: the index of the item in `specs` with
+                its response or the exception raised by its collect
+        """
+        groups = _ServiceGroups(service_concurrency)
+        pending = {}
+
+        async def collect(options):
+            # awaited in the task so that invalid options fail their item instead of the call
+            return await self.make_collect(**options)
+
+        def start(ready):
+            for index, options in ready:
+                pending[asyncio.ensure_future(collect(options))] = index, options.get('service')
+
+        def finish(done):
+            for task in done:
+                index, service = pending.pop(task)
+                start(groups.release(service))
+                yield index, _get_result(task)
+
+        try:
+            for index, spec, error in self.prepare_collect_specs(specs):
+                if error is not None:
+                    yield index, error
+                    continue
+
+                options = {'timeout': timeout, 'deadline': deadline, **spec}
+                start(groups.add(options.get('service'), (index, options)))
+                while len(pending) + groups.waiting >= concurrency:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for result in finish(done):
+                        yield result
+
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for result in finish(done):
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class AsyncWalletOperation(AsyncOperationMixin, WalletOperation):
+    """
+    Asynchronous version of :WalletOperation:
+
+    :iter_wallets: and :iter_transactions: return asynchronous iterators.
+    """
+
+    async def get_wallet(self, identifier: int, timeout: Optional[Timeout] = None,
+                         deadline: Optional[float] = None) -> Wallet:
+        endpoint = f'wallet/wallets/{identifier}/'
+
+        if self.wallet_cache is None or self.response_mode == 'raw':
+            return await self._request(Wallet, 'GET', endpoint, timeout=timeout, deadline=deadline)
+
+        return await self.wallet_cache.get_or_load_async(
+            (self.target, identifier),
+            lambda: self._request(Wallet, 'GET', endpoint, timeout=timeout, deadline=deadline),
+        )
+
+    async def _iter_pages(self, fetch: Callable[[int], Awaitable[APaginated]], prefetch: int = 1):
+        first = await fetch(1)
+        prefetch = max(1, prefetch)
+        limit = get_last_page(first)
+
+        pending = deque()
+        page = 2
+        try:
+            current = first
+            while True:
+                has_next = _get_field(current, 'next')
+                while has_next and len(pending) < prefetch and page <= limit:
+                    pending.append(asyncio.ensure_future(fetch(page)))
+                    page += 1
+                for item in _get_field(current, 'results'):
+                    yield item
+                if not has_next:
+                    return
+
+                current = await pending.popleft()
+                if not pending and page > limit:
+                    limit = page
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class AsyncFundraisingOperation(AsyncOperationMixin, FundraisingOperation):
+    """
+    Asynchronous version of :FundraisingOperation:
+    """
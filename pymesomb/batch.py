@@ -0,0 +1,267 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Sequence, Union
+
+from pymesomb.models import Transaction, WalletTransaction, parse_datetime
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+# columns decoded from the items of each model: identifier, date, float, integer and category columns
+_COLUMNS = {
+    Transaction: ('pk', 'ts', ('amount', 'fees', 'trxamount'), (),
+                  ('status', 'type', 'service', 'country', 'currency')),
+    WalletTransaction: ('id', 'date', ('amount', 'balance_after'), ('direction', 'wallet'),
+                        ('status', 'type', 'country')),
+}
+
+Date = Union[datetime, int, float]
+
+
+def _to_epoch(value: Date) -> int:
+    """Convert a date to seconds since the epoch, naive datetimes being in UTC like the dates of MeSomb"""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return (value - _EPOCH) // _SECOND
+    return int(value)
+
+
+class TransactionBatch:
+    """
+    Columnar view of a list of transactions for reporting.
+
+    The items of a list response in raw response mode (get_transactions, check_transactions and list_transactions of
+    `operation.with_response_mode('raw')`) are decoded straight into one array per field: amounts, fees, balances,
+    directions and wallets, the dates as seconds since the epoch in the column `timestamp`, and the categories
+    (status, type, service, country, currency) as integer codes of the labels in :labels:. Sums, counts and filters
+    then run over the arrays, with NumPy when it is installed (`pymesomb[numpy]`) or over the arrays of the standard
+    library otherwise. The :Transaction: or :WalletTransaction: of a row is only built when it is read by index or
+    iteration.
+
+    Args:
+        items (List[Dict[str, Any]]): the transactions as decoded from MeSomb
+        model: :Transaction: or :WalletTransaction:, the class of the items (Default value = Transaction)
+        use_numpy (bool, optional): use NumPy arrays, by default when NumPy is installed
+
+    Attributes:
+        ids (list): the pk (or id) of each row
+        columns (Dict[str, Any]): the array of each field, missing amounts and balances are NaN
+        labels (Dict[str, List[str]]): the labels of the codes of each category column
+    """
+
+    def __init__(self, items: List[Dict[str, Any]], model=Transaction, use_numpy: Optional[bool] = None):
+        assert model in _COLUMNS, 'Model must be Transaction or WalletTransaction'
+        if use_numpy and numpy is None:
+            raise ImportError('NumPy arrays require numpy: pip install pymesomb[numpy]')
+
+        self.model = model
+        self.numpy = numpy if use_numpy is not False else None
+        self.items = items
+
+        id_field, date_field, floats, integers, categories = _COLUMNS[model]
+        self.ids = [item.get(id_field) for item in items]
+        self.columns: Dict[str, Any] = {}
+        self.labels: Dict[str, List[str]] = {}
+
+        nan = float('nan')
+        for field in floats:
+            self.columns[field] = self._array('d', [nan if item.get(field) is None else item[field]
+                                                    for item in items])
+        for field in integers:
+            self.columns[field] = self._array('q', [item.get(field) or 0 for item in items])
+        for field in categories:
+            codes = {}
+            self.columns[field] = self._array('l', [codes.setdefault(item.get(field), len(codes)) for item in items])
+            self.labels[field] = list(codes)
+        self.columns['timestamp'] = self._array('q', [_to_epoch(parse_datetime(item[date_field])) for item in items])
+
+    def _array(self, typecode: str, values: Sequence[Any]):
+        if self.numpy is not None:
+            return self.numpy.array(values, dtype={'d': 'float64', 'q': 'int64', 'l': 'int64'}[typecode])
+        return array(typecode, values)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index: int):
+        return self.model(self.items[index])
+
+    def __iter__(self):
+        return (self.model(item) for item in self.items)
+
+    def column(self, field: str) -> list:
+        """
+        Get the values of a field, the labels for the category columns
+
+        Args:
+            field (str): the name of the column
+
+        Returns:
+            list
+        """
+        values = self.columns[field]
+        if field in self.labels:
+            labels = self.labels[field]
+            return [labels[code] for code in values]
+        return values.tolist()
+
+    def _take(self, indexes) -> 'TransactionBatch':
+        batch = object.__new__(TransactionBatch)
+        batch.model = self.model
+        batch.numpy = self.numpy
+        batch.labels = self.labels
+        batch.items = [self.items[index] for index in indexes]
+        batch.ids = [self.ids[index] for index in indexes]
+        if self.numpy is not None:
+            batch.columns = {field: values[indexes] for field, values in self.columns.items()}
+        else:
+            batch.columns = {field: array(values.typecode, (values[index] for index in indexes))
+                             for field, values in self.columns.items()}
+        return batch
+
+    def filter(self, mask: Optional[Sequence[bool]] = None, since: Optional[Date] = None,
+               until: Optional[Date] = None, **conditions: Any) -> 'TransactionBatch':
+        """
+        Keep the rows matching all the conditions
+
+        Args:
+            mask (Sequence[bool], optional): keep the rows where the mask is true
+            since (datetime or int, optional): keep the rows made at or after this date
+            until (datetime or int, optional): keep the rows made before this date
+            **conditions: the value of a column, or a list, tuple or set of the values accepted
+
+        Returns:
+            TransactionBatch: the rows kept, sharing the labels of this batch
+        """
+        tests = []
+        for field, value in conditions.items():
+            accepted = value if isinstance(value, (list, tuple, set, frozenset)) else [value]
+            if field in self.labels:
+                accepted = [self.labels[field].index(label) for label in accepted if label in self.labels[field]]
+            tests.append((self.columns[field], accepted))
+
+        if self.numpy is not None:
+            np = self.numpy
+            keep = np.ones(len(self), dtype=bool) if mask is None else np.array(mask, dtype=bool)
+            for values, accepted in tests:
+                keep &= np.isin(values, accepted)
+            if since is not None:
+                keep &= self.columns['timestamp'] >= _to_epoch(since)
+            if until is not None:
+                keep &= self.columns['timestamp'] < _to_epoch(until)
+            return self._take(np.nonzero(keep)[0])
+
+        timestamps = self.columns['timestamp']
+        low = _to_epoch(since) if since is not None else None
+        high = _to_epoch(until) if until is not None else None
+        tests = [(values, set(accepted)) for values, accepted in tests]
+        indexes = [index for index in range(len(self))
+                   if (mask is None or mask[index])
+                   and (low is None or timestamps[index] >= low)
+                   and (high is None or timestamps[index] < high)
+                   and all(values[index] in accepted for values, accepted in tests)]
+        return self._take(indexes)
+
+    def bucket(self, every: int) -> list:
+        """
+        Get the start of the period of each row
+
+        Args:
+            every (int): the length of the periods in seconds, counted from the epoch
+
+        Returns:
+            list: the timestamp of the start of the period of each row
+        """
+        timestamps = self.columns['timestamp']
+        if self.numpy is not None:
+            return timestamps // every * every
+        return array('q', (timestamp // every * every for timestamp in timestamps))
+
+    def _group(self, by: Union[str, Sequence[str], None], every: Optional[int]):
+        """Get the key columns of a grouping and how to convert their values to the keys returned"""
+        fields = [by] if isinstance(by, str) else list(by or ())
+        keys = [self.columns[field] for field in fields]
+        converters = [self.labels[field].__getitem__ if field in self.labels else int for field in fields]
+        if every is not None:
+            keys.append(self.bucket(every))
+            converters.append(lambda timestamp: _EPOCH + timedelta(seconds=int(timestamp)))
+        return keys, converters, isinstance(by, str) and every is None
+
+    def _aggregate(self, values, by: Union[str, Sequence[str], None], every: Optional[int]):
+        keys, converters, single = self._group(by, every)
+
+        if self.numpy is not None:
+            np = self.numpy
+            if not keys:
+                return float(np.nansum(values)) if values is not None else len(self)
+            # the values of the key columns are numbered then combined in one integer per row
+            uniques, composite = [], np.zeros(len(self), dtype='int64')
+            for key in keys:
+                unique, inverse = np.unique(key, return_inverse=True)
+                uniques.append(unique.tolist())
+                composite = composite * len(unique) + inverse.reshape(-1)
+            groups, inverse = np.unique(composite, return_inverse=True)
+            weights = None if values is None else np.nan_to_num(values, nan=0.0)
+            totals = np.bincount(inverse.reshape(-1), weights=weights, minlength=len(groups))
+
+            result = {}
+            for group, total in zip(groups.tolist(), totals.tolist()):
+                key = []
+                for unique in reversed(uniques):
+                    group, position = divmod(group, len(unique))
+                    key.append(unique[position])
+                key = tuple(convert(value) for convert, value in zip(converters, reversed(key)))
+                result[key[0] if single else key] = total if values is not None else int(total)
+            return result
+
+        if not keys:
+            return float(sum(value for value in values if value == value)) if values is not None else len(self)
+        result = {}
+        for index, group in enumerate(zip(*keys)):
+            value = 1 if values is None else values[index]
+            if value == value:
+                result[group] = result.get(group, 0) + value
+            else:
+                result.setdefault(group, 0)
+        converted = {}
+        for group, total in result.items():
+            key = tuple(convert(value) for convert, value in zip(converters, group))
+            converted[key[0] if single else key] = total if values is None else float(total)
+        return converted
+
+    def sum(self, field: str = 'amount', by: Union[str, Sequence[str], None] = None,
+            every: Optional[int] = None) -> Union[float, Dict[Any, float]]:
+        """
+        Sum a column, missing values being ignored
+
+        Args:
+            field (str): the column summed (Default value = 'amount')
+            by (str or Sequence[str], optional): the columns grouping the rows, the keys are the labels of the
+                category columns, tuples when grouped by several columns
+            every (int, optional): also group the rows by periods of this length in seconds, the key of the period
+                being the datetime (UTC) of its start
+
+        Returns:
+            float or dict: the sum, or the sum of each group
+        """
+        return self._aggregate(self.columns[field], by, every)
+
+    def count(self, by: Union[str, Sequence[str], None] = None,
+              every: Optional[int] = None) -> Union[int, Dict[Any, int]]:
+        """
+        Count the rows
+
+        Args:
+            by (str or Sequence[str], optional): the columns grouping the rows, see :sum:
+            every (int, optional): also group the rows by periods of this length in seconds
+
+        Returns:
+            int or dict: the number of rows, or of each group
+        """
+        return self._aggregate(None, by, every)
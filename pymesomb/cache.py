@@ -0,0 +1,280 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Callable, Hashable, Tuple
+
+# returned by :TTLCache.get: when the key is not cached or expired
+MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe cache keeping each value for `ttl` seconds and at most `maxsize` values, the least recently used being
+    evicted first.
+
+    With `max_stale` greater than `ttl`, :get_or_load: serves an expired value while it is younger than `max_stale`
+    and refreshes it in the background (stale-while-revalidate), so the caller never waits for MeSomb on a hot path.
+    Values older than `max_stale` are never served.
+
+    Args:
+        ttl (float): time in seconds a value is fresh (Default value = 30)
+        maxsize (int, optional): maximum number of values kept, None for no limit (Default value = 1024)
+        max_stale (float, optional): maximum age in seconds of a value served while refreshed in the background, no
+            stale value is served if not set
+        ttls (Dict[Hashable, float], optional): specific `ttl` of some keys
+    """
+
+    def __init__(self, ttl: float = 30, maxsize: Optional[int] = 1024, max_stale: Optional[float] = None,
+                 ttls: Optional[Dict[Hashable, float]] = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.max_stale = max_stale
+        self.ttls = ttls or {}
+
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, float]]' = OrderedDict()
+        self._refreshing = set()
+        # version of each key being loaded, changed by each invalidation or write of the key so that the values
+        # loaded before are not cached, and number of loads in flight of the key
+        self._versions: Dict[Hashable, int] = {}
+        self._loading: Dict[Hashable, int] = {}
+        # changed by each clear
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters to size the cache
+
+        Returns:
+            Dict[str, int]: the number of hits, stale hits, misses and values cached
+        """
+        return {'hits': self.hits, 'stale_hits': self.stale_hits, 'misses': self.misses, 'size': len(self._entries)}
+
+    def get_ttl(self, key: Hashable) -> float:
+        """
+        Get the time in seconds a value of this key is fresh
+
+        Args:
+            key (Hashable): the key of the value
+
+        Returns:
+            float
+        """
+        return self.ttls.get(key, self.ttl)
+
+    def _lookup(self, key: Hashable, stale: bool):
+        """Get the value of a key and whether it is expired, MISSING if it can not be served"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING, False
+
+        age = time.monotonic() - entry[1]
+        if age < self.get_ttl(key):
+            self._entries.move_to_end(key)
+            return entry[0], False
+        if stale and self.max_stale is not None and age < self.max_stale:
+            self._entries.move_to_end(key)
+            return entry[0], True
+
+        if self.max_stale is None or age >= self.max_stale:
+            del self._entries[key]
+        return MISSING, False
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """
+        Get a fresh value
+
+        Args:
+            key (Hashable): the key of the value
+            default (Any): returned when no fresh value is cached (Default value = MISSING)
+
+        Returns:
+            Any
+        """
+        with self._lock:
+            value, _ = self._lookup(key, False)
+            if value is MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def _store(self, key: Hashable, value: Any):
+        """Cache a value, called with the lock held"""
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _changed(self, key: Hashable):
+        """Change the version of a key so that its values being loaded are dropped, called with the lock held"""
+        if key in self._loading:
+            self._versions[key] = self._versions.get(key, 0) + 1
+
+    def _start_load(self, key: Hashable) -> Tuple[int, int]:
+        """Register a load of a key and get its version, called with the lock held"""
+        self._loading[key] = self._loading.get(key, 0) + 1
+        return self._epoch, self._versions.get(key, 0)
+
+    def _end_load(self, key: Hashable, value: Any, version: Tuple[int, int]):
+        """Cache a loaded value unless the key was written or invalidated since, MISSING if the load failed"""
+        with self._lock:
+            if value is not MISSING and version == (self._epoch, self._versions.get(key, 0)):
+                self._store(key, value)
+            count = self._loading.pop(key) - 1
+            if count:
+                self._loading[key] = count
+            else:
+                # the versions are only compared by the loads in flight
+                self._versions.pop(key, None)
+
+    def set(self, key: Hashable, value: Any):
+        """
+        Cache a value
+
+        The values of this key being loaded are dropped, they may have been read before the write.
+
+        Args:
+            key (Hashable): the key of the value
+            value (Any): the value
+        """
+        with self._lock:
+            self._changed(key)
+            self._store(key, value)
+
+    def update(self, key: Hashable, function: Callable[[Any], Any]):
+        """
+        Replace a cached value without changing its age
+
+        The values of this key being loaded are dropped, they may have been read before the change.
+
+        Args:
+            key (Hashable): the key of the value
+            function (Callable[[Any], Any]): function receiving the cached value and returning the new one, it is not
+                called if the key is not cached
+        """
+        with self._lock:
+            self._changed(key)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (function(entry[0]), entry[1])
+
+    def invalidate(self, key: Hashable):
+        """
+        Remove a value
+
+        Args:
+            key (Hashable): the key of the value
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._changed(key)
+
+    def clear(self):
+        """Remove all the values"""
+        with self._lock:
+            self._entries.clear()
+            self._epoch += 1
+
+    def _start_refresh(self, key: Hashable) -> bool:
+        """Mark a key as being refreshed, False if it is already"""
+        if key in self._refreshing:
+            return False
+        self._refreshing.add(key)
+        return True
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any], version: Tuple[int, int]):
+        value = MISSING
+        try:
+            value = loader()
+        except Exception:
+            # the stale value is kept until it expires or a caller loads it again
+            pass
+        finally:
+            self._end_load(key, value, version)
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Get a value, loading it when it is not cached
+
+        Args:
+            key (Hashable): the key of the value
+            loader (Callable[[], Any]): function returning the value
+
+        Returns:
+            Any
+        """
+        with self._lock:
+            value, stale = self._lookup(key, True)
+            if value is not MISSING:
+                if stale:
+                    self.stale_hits += 1
+                    if self._start_refresh(key):
+                        threading.Thread(target=self._refresh, args=(key, loader, self._start_load(key)),
+                                         daemon=True).start()
+                else:
+                    self.hits += 1
+                return value
+            self.misses += 1
+            version = self._start_load(key)
+
+        value = MISSING
+        try:
+            value = loader()
+            return value
+        finally:
+            self._end_load(key, value, version)
+
+    async def _refresh_async(self, key: Hashable, loader: Callable[[], Any], version: Tuple[int, int]):
+        value = MISSING
+        try:
+            value = await loader()
+        except Exception:
+            pass
+        finally:
+            self._end_load(key, value, version)
+            with self._lock:
+                self._refreshing.discard(key)
+
+    async def get_or_load_async(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Get a value, loading it when it is not cached
+
+        Args:
+            key (Hashable): the key of the value
+            loader (Callable[[], Awaitable[Any]]): function returning a coroutine resolved with the value
+
+        Returns:
+            Any
+        """
+        with self._lock:
+            value, stale = self._lookup(key, True)
+            if value is not MISSING:
+                if stale:
+                    self.stale_hits += 1
+                    if self._start_refresh(key):
+                        asyncio.ensure_future(self._refresh_async(key, loader, self._start_load(key)))
+                else:
+                    self.hits += 1
+                return value
+            self.misses += 1
+            version = self._start_load(key)
+
+        value = MISSING
+        try:
+            value = await loader()
+            return value
+        finally:
+            self._end_load(key, value, version)
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+from concurrent import futures
+from typing import Optional, Dict, Any, Callable, Hashable, Awaitable
+
+from pymesomb.exceptions import DeadlineExceededException
+
+
+class SingleFlight:
+    """
+    Share one call between the threads asking for the same key at the same time.
+
+    The first caller of a key runs the call, the callers arriving while it is in flight wait for it and receive the
+    same result or exception. A new call is made once the result is delivered, so results are never cached.
+    """
+
+    def __init__(self):
+        self.shared = 0
+
+        self._calls: Dict[Hashable, futures.Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run `function` or wait for the call of the same key in flight
+
+        Args:
+            key (Hashable): the key identifying the call
+            function (Callable[[], Any]): the call
+            timeout (float, optional): maximum time in seconds to wait for a call in flight
+
+        Returns:
+            Any: the result of the call
+
+        Raises:
+            DeadlineExceededException: When the call in flight does not finish before `timeout`
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = futures.Future()
+            else:
+                self.shared += 1
+
+        if not leader:
+            try:
+                return future.result(timeout)
+            except futures.TimeoutError:
+                raise DeadlineExceededException('The deadline of the operation is exceeded', None)
+
+        try:
+            result = function()
+        except BaseException as e:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._calls[key]
+        future.set_result(result)
+        return result
+
+
+class AsyncSingleFlight:
+    """
+    Share one call between the asyncio tasks asking for the same key at the same time.
+
+    Asynchronous version of :SingleFlight:, calls are shared between the tasks of the same event loop.
+    """
+
+    def __init__(self):
+        self.shared = 0
+
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[Any]], timeout: Optional[float] = None) -> Any:
+        """
+        Run `function` or wait for the call of the same key in flight
+
+        Args:
+            key (Hashable): the key identifying the call
+            function (Callable[[], Awaitable[Any]]): function returning the coroutine of the call
+            timeout (float, optional): maximum time in seconds to wait for a call in flight
+
+        Returns:
+            Any: the result of the call
+
+        Raises:
+            DeadlineExceededException: When the call in flight does not finish before `timeout`
+        """
+        loop = asyncio.get_event_loop()
+        key = (loop, key)
+        future = self._calls.get(key)
+        if future is not None:
+            self.shared += 1
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.TimeoutError:
+                raise DeadlineExceededException('The deadline of the operation is exceeded', None)
+
+        future = self._calls[key] = loop.create_future()
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            del self._calls[key]
+            future.cancel()
+            raise
+        except BaseException as e:
+            del self._calls[key]
+            future.set_exception(e)
+            # the exception is raised by the leader, followers may not exist to retrieve it
+            future.exception()
+            raise
+        del self._calls[key]
+        future.set_result(result)
+        return result
+
+
+# calls shared by all the operations of the process
+SINGLE_FLIGHT = SingleFlight()
+ASYNC_SINGLE_FLIGHT = AsyncSingleFlight()
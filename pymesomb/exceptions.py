@@ -36,3 +36,23 @@ class InvalidClientRequestException(APIException):
 class ServerException(APIException):
     """ """
     pass
+
+
+class TimeoutException(APIException):
+    """Base class of the exceptions raised when MeSomb does not answer in time"""
+    default_code = 'timeout'
+
+
+class ConnectTimeoutException(TimeoutException):
+    """Raised when the connection to MeSomb can not be established in time"""
+    default_code = 'connect-timeout'
+
+
+class ReadTimeoutException(TimeoutException):
+    """Raised when MeSomb does not send its response in time"""
+    default_code = 'read-timeout'
+
+
+class DeadlineExceededException(TimeoutException):
+    """Raised when the deadline of an operation, retries included, is exceeded"""
+    default_code = 'deadline-exceeded'
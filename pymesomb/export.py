@@ -0,0 +1,205 @@
+import csv
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterator, List, Sequence, Tuple
+
+from pymesomb.operations import WalletOperation, Timeout
+
+# columns of the CSV and Parquet exports of wallet transactions
+TRANSACTION_FIELDS = ('id', 'status', 'type', 'amount', 'direction', 'wallet', 'balance_after', 'date', 'country',
+                      'fin_trx_id')
+
+# Arrow types of the known columns, the other columns are exported as strings
+_ARROW_TYPES = {
+    'id': 'int64',
+    'amount': 'float64',
+    'direction': 'int64',
+    'wallet': 'int64',
+    'balance_after': 'float64',
+}
+
+
+class _LineWriter:
+    """Write rows in a NDJSON or CSV file, resumed by truncating the file to the last checkpoint"""
+
+    def __init__(self, path: str, format: str, fields: Sequence[str], state: Optional[Dict[str, Any]]):
+        offset = state['offset'] if state else 0
+        if offset:
+            with open(path, 'r+b') as file:
+                file.truncate(offset)
+        self.file = open(path, 'a' if offset else 'w', newline='', encoding='utf-8')
+
+        self.csv = None
+        if format == 'csv':
+            self.csv = csv.DictWriter(self.file, fieldnames=list(fields), extrasaction='ignore')
+            if not offset:
+                self.csv.writeheader()
+
+    def write(self, rows: List[Dict[str, Any]]):
+        if self.csv is not None:
+            self.csv.writerows(rows)
+        else:
+            self.file.writelines(json.dumps(row, separators=(',', ':')) + '\n' for row in rows)
+
+    def checkpoint(self, force: bool = False) -> Dict[str, Any]:
+        # the rows must be on the disk before the state pointing after them
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return {'offset': self.file.tell()}
+
+    def close(self):
+        self.file.close()
+
+
+class _ParquetWriter:
+    """Write rows in numbered Parquet files of a directory, one file each `batch_size` rows"""
+
+    def __init__(self, path: str, fields: Sequence[str], state: Optional[Dict[str, Any]], batch_size: int):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:  # pragma: no cover
+            raise ImportError('The Parquet export requires pyarrow: pip install pymesomb[parquet]')
+
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.fields = list(fields)
+        self.batch_size = batch_size
+        self.schema = pyarrow.schema([(field, getattr(pyarrow, _ARROW_TYPES.get(field, 'string'))())
+                                      for field in self.fields])
+        self.parts = state['parts'] if state else 0
+        self.columns = {field: [] for field in self.fields}
+        self.size = 0
+
+        os.makedirs(path, exist_ok=True)
+        # parts written after the last checkpoint are incomplete
+        for name in os.listdir(path):
+            if name.startswith('part-') and name.endswith('.parquet') and int(name[5:-8]) >= self.parts:
+                os.remove(os.path.join(path, name))
+
+    def write(self, rows: List[Dict[str, Any]]):
+        for field, values in self.columns.items():
+            cast = str if _ARROW_TYPES.get(field) is None else None
+            for row in rows:
+                value = row.get(field)
+                values.append(cast(value) if cast is not None and value is not None else value)
+        self.size += len(rows)
+
+    def checkpoint(self, force: bool = False) -> Optional[Dict[str, Any]]:
+        if self.size < self.batch_size and not (force and self.size):
+            return {'parts': self.parts} if force else None
+
+        table = self.pa.Table.from_arrays([self.pa.array(self.columns[field], type=self.schema.field(field).type)
+                                           for field in self.fields], schema=self.schema)
+        part = os.path.join(self.path, f'part-{self.parts:06d}.parquet')
+        self.pq.write_table(table, part)
+        with open(part, 'rb') as file:
+            os.fsync(file.fileno())
+        self.parts += 1
+        self.columns = {field: [] for field in self.fields}
+        self.size = 0
+        return {'parts': self.parts}
+
+    def close(self):
+        pass
+
+
+def _load_state(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, encoding='utf-8') as file:
+            state = json.load(file)
+    except FileNotFoundError:
+        return None
+    return None if state.get('done') else state
+
+
+def _save_state(path: str, state: Dict[str, Any]):
+    # the state is replaced atomically so an interruption never leaves it half written
+    with open(f'{path}.tmp', 'w', encoding='utf-8') as file:
+        json.dump(state, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(f'{path}.tmp', path)
+
+
+def _iter_raw_pages(operation: WalletOperation, start: int, wallet: Optional[int], timeout: Optional[Timeout],
+                    deadline: Optional[float]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield the pages of transactions as decoded from MeSomb, the next page being fetched in the background"""
+    raw = operation.with_response_mode('raw')
+
+    def fetch(page):
+        return raw.list_transactions(page, wallet, timeout=timeout, deadline=deadline)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = start
+        future = executor.submit(fetch, page)
+        while future is not None:
+            data = future.result()
+            future = executor.submit(fetch, page + 1) if data.get('next') else None
+            yield page, data
+            page += 1
+
+
+def export_transactions(operation: WalletOperation, path: str, format: Optional[str] = None,
+                        wallet: Optional[int] = None, fields: Sequence[str] = TRANSACTION_FIELDS, resume: bool = True,
+                        state_path: Optional[str] = None, batch_size: int = 100000,
+                        timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> int:
+    """Export the wallet transactions to a file, page after page
+
+    Pages are written as they come without building the models, so the memory used does not depend on the number of
+    transactions: one page for NDJSON and CSV, `batch_size` rows for Parquet (requires `pymesomb[parquet]`). After
+    each page the position of the export is saved in `state_path`; an interrupted export started again with `resume`
+    continues after the last page written.
+
+    Args:
+      operation: the operation used to list the transactions
+      path: the file to write, a directory of `part-NNNNNN.parquet` files for Parquet
+      format: 'ndjson', 'csv' or 'parquet', guessed from the extension of `path` if not set (Default value = None)
+      wallet: export only the transactions of this wallet (Default value = None)
+      fields: the columns of the CSV and Parquet exports, NDJSON keeps all the fields
+        (Default value = TRANSACTION_FIELDS)
+      resume: continue an interrupted export of the same file (Default value = True)
+      state_path: file keeping the position of the export (Default value = `path` + '.state')
+      batch_size: number of rows of each Parquet file (Default value = 100000)
+      timeout: connect and read timeouts in seconds of each page
+      deadline: maximum time in seconds of each page, retries included
+
+    Returns:
+      int: the number of transactions exported, those of the interrupted run included
+
+    """
+    if format is None:
+        extension = os.path.splitext(path)[1].lower()
+        format = {'.csv': 'csv', '.parquet': 'parquet'}.get(extension, 'ndjson')
+    assert format in ('ndjson', 'csv', 'parquet'), 'Format must be ndjson, csv or parquet'
+
+    state_path = state_path or f'{path}.state'
+    state = _load_state(state_path) if resume else None
+    if format == 'parquet':
+        writer = _ParquetWriter(path, fields, state and state['writer'], batch_size)
+    else:
+        writer = _LineWriter(path, format, fields, state and state['writer'])
+
+    page = state['page'] if state else 0
+    rows = state['rows'] if state else 0
+    pending = 0
+    try:
+        if not state or state['next']:
+            for page, data in _iter_raw_pages(operation, page + 1, wallet, timeout, deadline):
+                writer.write(data['results'])
+                pending += len(data['results'])
+                checkpoint = writer.checkpoint()
+                if checkpoint is not None:
+                    rows, pending = rows + pending, 0
+                    _save_state(state_path, {'page': page, 'next': bool(data.get('next')), 'rows': rows,
+                                             'writer': checkpoint})
+
+        rows += pending
+        _save_state(state_path, {'page': page, 'next': False, 'rows': rows, 'writer': writer.checkpoint(True),
+                                 'done': True})
+    finally:
+        writer.close()
+
+    return rows
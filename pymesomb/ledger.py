@@ -0,0 +1,260 @@
+import sqlite3
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+
+from pymesomb.models import Wallet, WalletTransaction, DATE_FORMAT, parse_datetime
+from pymesomb.operations import WalletOperation, Timeout
+
+WALLET_FIELDS = ('id', 'number', 'country', 'status', 'last_activity', 'balance', 'first_name', 'last_name', 'email',
+                 'phone_number', 'gender')
+
+TRANSACTION_FIELDS = ('id', 'status', 'type', 'amount', 'direction', 'wallet', 'balance_after', 'date', 'country',
+                      'fin_trx_id')
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS wallets (
+    id INTEGER PRIMARY KEY, number TEXT, country TEXT, status TEXT, last_activity TEXT, balance REAL,
+    first_name TEXT, last_name TEXT, email TEXT, phone_number TEXT, gender TEXT
+);
+CREATE INDEX IF NOT EXISTS wallets_number ON wallets (number);
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY, status TEXT, type TEXT, amount REAL, direction INTEGER, wallet INTEGER,
+    balance_after REAL, date TEXT, country TEXT, fin_trx_id TEXT
+);
+CREATE INDEX IF NOT EXISTS transactions_wallet_date ON transactions (wallet, date, id);
+CREATE INDEX IF NOT EXISTS transactions_fin_trx_id ON transactions (fin_trx_id);
+CREATE INDEX IF NOT EXISTS transactions_date ON transactions (date);
+CREATE INDEX IF NOT EXISTS transactions_status ON transactions (status);
+CREATE TABLE IF NOT EXISTS marks (name TEXT PRIMARY KEY, value INTEGER);
+'''
+
+
+def _format_date(value: Optional[datetime]) -> Optional[str]:
+    return value.strftime(DATE_FORMAT) if value else None
+
+
+class WalletLedger:
+    """
+    Local mirror of the wallets and wallet transactions of a provider stored in a SQLite database.
+
+    :sync: downloads only what changed since the previous run: the highest transaction id already stored is kept as a
+    high-water mark and the listing is read until it is reached (or, when MeSomb lists the oldest transactions first,
+    from the first page not stored yet). Transactions stored as PENDING are checked again on each run. Wallets are
+    refreshed entirely since their balance changes. Lookups and balance history queries then run on the local indexes
+    without calling MeSomb.
+
+    Args:
+        operation (WalletOperation): the operation used to read the wallets and transactions
+        path (str): path of the database, ':memory:' for a database living with the ledger
+    """
+
+    def __init__(self, operation: WalletOperation, path: str):
+        self.operation = operation
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the database"""
+        self.connection.close()
+
+    def get_mark(self, name: str) -> Optional[int]:
+        """
+        Get a high-water mark of the synchronization
+
+        Args:
+            name (str): name of the mark
+
+        Returns:
+            Optional[int]: the value of the mark, None before the first synchronization
+        """
+        row = self.connection.execute('SELECT value FROM marks WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else None
+
+    def _set_mark(self, name: str, value: Optional[int]):
+        self.connection.execute('INSERT OR REPLACE INTO marks (name, value) VALUES (?, ?)', (name, value))
+
+    def _store_transactions(self, rows: Iterable[Dict[str, Any]]) -> int:
+        values = [tuple(row.get(field) for field in TRANSACTION_FIELDS) for row in rows]
+        self.connection.executemany(f"INSERT OR REPLACE INTO transactions ({', '.join(TRANSACTION_FIELDS)}) "
+                                    f"VALUES ({', '.join('?' * len(TRANSACTION_FIELDS))})", values)
+        return len(values)
+
+    def sync(self, timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> Tuple[int, int]:
+        """
+        Synchronize the wallets and the transactions
+
+        Args:
+            timeout (float or tuple, optional): connect and read timeouts in seconds of each request
+            deadline (float, optional): maximum time in seconds of each request, retries included
+
+        Returns:
+            tuple: the number of wallets and transactions written
+        """
+        return self.sync_wallets(timeout, deadline), self.sync_transactions(timeout, deadline)
+
+    def sync_wallets(self, timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> int:
+        """
+        Download all the wallets
+
+        Args:
+            timeout (float or tuple, optional): connect and read timeouts in seconds of each page
+            deadline (float, optional): maximum time in seconds of each page, retries included
+
+        Returns:
+            int: the number of wallets written
+        """
+        values = []
+        for wallet in self.operation.iter_wallets(prefetch=4, timeout=timeout, deadline=deadline):
+            values.append(tuple(_format_date(getattr(wallet, field)) if field == 'last_activity' else
+                                getattr(wallet, field) for field in WALLET_FIELDS))
+
+        with self.connection:
+            self.connection.executemany(f"INSERT OR REPLACE INTO wallets ({', '.join(WALLET_FIELDS)}) "
+                                        f"VALUES ({', '.join('?' * len(WALLET_FIELDS))})", values)
+        return len(values)
+
+    def sync_transactions(self, timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> int:
+        """
+        Download the transactions made since the previous synchronization and update the pending ones
+
+        Args:
+            timeout (float or tuple, optional): connect and read timeouts in seconds of each request
+            deadline (float, optional): maximum time in seconds of each request, retries included
+
+        Returns:
+            int: the number of transactions written
+        """
+        raw = self.operation.with_response_mode('raw')
+
+        def fetch(page):
+            return raw.list_transactions(page, timeout=timeout, deadline=deadline)
+
+        high = self.get_mark('transactions')
+        data = fetch(1)
+        results = data['results']
+        ascending = len(results) > 1 and results[0]['id'] < results[-1]['id']
+
+        page = 1
+        if ascending and high is not None:
+            # the pages already stored are skipped, the last one is read again in case it was not full
+            known = self.connection.execute('SELECT COUNT(*) FROM transactions').fetchone()[0]
+            last = -(-data['count'] // len(results))
+            page = max(1, min(last, known // len(results) + 1))
+            if page > 1:
+                data = fetch(page)
+
+        pending = {row[0] for row in self.connection.execute("SELECT id FROM transactions WHERE status = 'PENDING'")}
+        written = 0
+        with self.connection:
+            while True:
+                written += self._store_transactions(data['results'])
+                pending.difference_update(row['id'] for row in data['results'])
+                reached = not ascending and high is not None and any(row['id'] <= high for row in data['results'])
+                if reached or not data.get('next'):
+                    break
+                page += 1
+                data = fetch(page)
+
+            if pending:
+                transactions = self.operation.get_transactions(sorted(pending), timeout=timeout, deadline=deadline)
+                written += self._store_transactions({
+                    **{field: getattr(transaction, field) for field in TRANSACTION_FIELDS},
+                    'date': _format_date(transaction.date),
+                } for transaction in transactions)
+
+            self._set_mark('transactions', self.connection.execute('SELECT MAX(id) FROM transactions').fetchone()[0])
+
+        return written
+
+    def get_wallet(self, id: int) -> Optional[Wallet]:
+        """
+        Get a wallet from the mirror
+
+        Args:
+            id (int): the identifier of the wallet
+
+        Returns:
+            Optional[Wallet]
+        """
+        row = self.connection.execute(f"SELECT {', '.join(WALLET_FIELDS)} FROM wallets WHERE id = ?",
+                                      (id,)).fetchone()
+        return Wallet(dict(zip(WALLET_FIELDS, row))) if row else None
+
+    def get_transaction(self, id: int) -> Optional[WalletTransaction]:
+        """
+        Get a transaction from the mirror
+
+        Args:
+            id (int): the identifier of the transaction
+
+        Returns:
+            Optional[WalletTransaction]
+        """
+        row = self.connection.execute(f"SELECT {', '.join(TRANSACTION_FIELDS)} FROM transactions WHERE id = ?",
+                                      (id,)).fetchone()
+        return WalletTransaction(dict(zip(TRANSACTION_FIELDS, row))) if row else None
+
+    def find_transactions(self, wallet: Optional[int] = None, fin_trx_id: Optional[str] = None,
+                          since: Optional[datetime] = None, until: Optional[datetime] = None,
+                          limit: Optional[int] = None) -> List[WalletTransaction]:
+        """
+        Search transactions in the mirror, ordered by date
+
+        Args:
+            wallet (int, optional): the identifier of the wallet
+            fin_trx_id (str, optional): the financial transaction ID
+            since (datetime, optional): keep the transactions made at or after this date
+            until (datetime, optional): keep the transactions made before this date
+            limit (int, optional): maximum number of transactions returned
+
+        Returns:
+            List[WalletTransaction]
+        """
+        conditions, params = [], []
+        for condition, value in (('wallet = ?', wallet), ('fin_trx_id = ?', fin_trx_id),
+                                 ('date >= ?', _format_date(since)), ('date < ?', _format_date(until))):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+
+        query = f"SELECT {', '.join(TRANSACTION_FIELDS)} FROM transactions"
+        if conditions:
+            query += f" WHERE {' AND '.join(conditions)}"
+        query += ' ORDER BY date, id'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        return [WalletTransaction(dict(zip(TRANSACTION_FIELDS, row))) for row in self.connection.execute(query, params)]
+
+    def get_balance_history(self, wallet: int, since: Optional[datetime] = None,
+                            until: Optional[datetime] = None) -> List[Tuple[datetime, float]]:
+        """
+        Get the balance of a wallet after each of its transactions
+
+        Args:
+            wallet (int): the identifier of the wallet
+            since (datetime, optional): start of the history
+            until (datetime, optional): end of the history (excluded)
+
+        Returns:
+            List[Tuple[datetime, float]]: the date of each transaction with the balance after it
+        """
+        query = 'SELECT date, balance_after FROM transactions WHERE wallet = ? AND balance_after IS NOT NULL'
+        params = [wallet]
+        if since is not None:
+            query += ' AND date >= ?'
+            params.append(_format_date(since))
+        if until is not None:
+            query += ' AND date < ?'
+            params.append(_format_date(until))
+        query += ' ORDER BY date, id'
+
+        return [(parse_datetime(date), balance) for date, balance in
+                self.connection.execute(query, params)]
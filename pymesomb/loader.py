@@ -0,0 +1,281 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Iterable, List
+
+from pymesomb.models import Transaction
+from pymesomb.operations import PaymentOperation, Timeout
+
+
+def _index(transactions: List[Transaction], source: str) -> Dict[str, Transaction]:
+    """Map the transactions by the id they were asked with"""
+    return {str(transaction.pk if source == 'MESOMB' else transaction.reference): transaction
+            for transaction in transactions}
+
+
+class TransactionLoader:
+    """
+    Batch the lookups of single transactions made at the same time into one request.
+
+    Each call to :load: is queued and the queue is sent in one :PaymentOperation.get_transactions: (or
+    :PaymentOperation.check_transactions: with `check`) request `wait` seconds after the first id was queued, or as
+    soon as `max_batch` ids are waiting. The same id asked several times in a window is sent once. Many threads
+    looking up one transaction each then share a few requests.
+
+    Args:
+        operation (PaymentOperation): the operation used to get the transactions
+        source (str): source of the ids: MESOMB or EXTERNAL (Default value = 'MESOMB')
+        check (bool): use check_transactions, which asks the operator for the status of pending transactions
+            (Default value = False)
+        wait (float): time in seconds ids are collected before being sent (Default value = 0.005)
+        max_batch (int): maximum number of ids of one request (Default value = 100)
+        max_workers (int): maximum number of requests in flight (Default value = 4)
+        timeout (float or tuple, optional): connect and read timeouts in seconds of each request
+        deadline (float, optional): maximum time in seconds of each request, retries included
+    """
+
+    def __init__(self, operation: PaymentOperation, source: str = 'MESOMB', check: bool = False,
+                 wait: float = 0.005, max_batch: int = 100, max_workers: int = 4, timeout: Optional[Timeout] = None,
+                 deadline: Optional[float] = None):
+        assert source in ['MESOMB', 'EXTERNAL'], 'Source must be MESOMB or EXTERNAL'
+
+        self.operation = operation
+        self.source = source
+        self.check = check
+        self.wait = wait
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self.deadline = deadline
+
+        self._pending: Dict[str, Future] = {}
+        self._first_at = None
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='mesomb-loader')
+        self._thread = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Send the ids waiting and wait for the requests in flight"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        self.dispatch()
+        self._executor.shutdown()
+
+    def load(self, id: str) -> Future:
+        """
+        Queue the lookup of a transaction
+
+        Args:
+            id (str): the id of the transaction in MeSomb or your transaction ID, depending on `source`
+
+        Returns:
+            Future: resolved with the :Transaction:, None if MeSomb does not know it
+        """
+        id = str(id)
+        with self._condition:
+            assert not self._closed, 'The loader is closed'
+            future = self._pending.get(id)
+            if future is None:
+                future = self._pending[id] = Future()
+                if self._first_at is None:
+                    self._first_at = time.monotonic()
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name='mesomb-loader', daemon=True)
+                    self._thread.start()
+                self._condition.notify()
+        return future
+
+    def load_many(self, ids: Iterable[str]) -> List[Future]:
+        """
+        Queue the lookup of several transactions
+
+        Args:
+            ids (Iterable[str]): the ids of the transactions
+
+        Returns:
+            List[Future]: the future of each transaction
+        """
+        return [self.load(id) for id in ids]
+
+    def get(self, id: str, timeout: Optional[float] = None) -> Optional[Transaction]:
+        """
+        Get a transaction, batched with the other lookups of the window
+
+        Args:
+            id (str): the id of the transaction
+            timeout (float, optional): maximum time in seconds to wait for the transaction
+
+        Returns:
+            Optional[Transaction]
+        """
+        return self.load(id).result(timeout)
+
+    def dispatch(self):
+        """Send the ids waiting without waiting for the end of the window"""
+        while True:
+            with self._condition:
+                batch = self._take()
+            if not batch:
+                return
+            self._executor.submit(self._load_batch, batch)
+
+    def _take(self) -> Dict[str, Future]:
+        batch = dict(list(self._pending.items())[:self.max_batch])
+        if len(batch) == len(self._pending):
+            self._pending = {}
+            self._first_at = None
+        else:
+            for id in batch:
+                del self._pending[id]
+            # the ids left over are sent with the next batch
+            self._first_at = time.monotonic() - self.wait
+        return batch
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._pending:
+                        remaining = self._first_at + self.wait - time.monotonic()
+                        if remaining <= 0 or len(self._pending) >= self.max_batch:
+                            break
+                        self._condition.wait(remaining)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+                batch = self._take()
+            self._executor.submit(self._load_batch, batch)
+
+    def _load_batch(self, batch: Dict[str, Future]):
+        # futures cancelled by the caller are not asked
+        batch = {id: future for id, future in batch.items() if future.set_running_or_notify_cancel()}
+        if not batch:
+            return
+
+        function = self.operation.check_transactions if self.check else self.operation.get_transactions
+        try:
+            transactions = function(list(batch), source=self.source, timeout=self.timeout, deadline=self.deadline)
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+
+        found = _index(transactions, self.source)
+        for id, future in batch.items():
+            future.set_result(found.get(id))
+
+
+class AsyncTransactionLoader:
+    """
+    Batch the lookups of single transactions made at the same time into one request.
+
+    Asynchronous version of :TransactionLoader: for the operations of :pymesomb.async_operations:, ids are collected
+    by the tasks of one event loop.
+
+    Args:
+        operation (AsyncPaymentOperation): the operation used to get the transactions
+        source (str): source of the ids: MESOMB or EXTERNAL (Default value = 'MESOMB')
+        check (bool): use check_transactions (Default value = False)
+        wait (float): time in seconds ids are collected before being sent (Default value = 0.005)
+        max_batch (int): maximum number of ids of one request (Default value = 100)
+        timeout (float or tuple, optional): connect and read timeouts in seconds of each request
+        deadline (float, optional): maximum time in seconds of each request, retries included
+    """
+
+    def __init__(self, operation, source: str = 'MESOMB', check: bool = False, wait: float = 0.005,
+                 max_batch: int = 100, timeout: Optional[Timeout] = None, deadline: Optional[float] = None):
+        assert source in ['MESOMB', 'EXTERNAL'], 'Source must be MESOMB or EXTERNAL'
+
+        self.operation = operation
+        self.source = source
+        self.check = check
+        self.wait = wait
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self.deadline = deadline
+
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._handle = None
+        self._tasks = set()
+
+    def load(self, id: str) -> asyncio.Future:
+        """
+        Queue the lookup of a transaction
+
+        Args:
+            id (str): the id of the transaction in MeSomb or your transaction ID, depending on `source`
+
+        Returns:
+            asyncio.Future: resolved with the :Transaction:, None if MeSomb does not know it
+        """
+        id = str(id)
+        future = self._pending.get(id)
+        if future is None:
+            loop = asyncio.get_event_loop()
+            future = self._pending[id] = loop.create_future()
+            if len(self._pending) >= self.max_batch:
+                self.dispatch()
+            elif self._handle is None:
+                self._handle = loop.call_later(self.wait, self.dispatch)
+        return future
+
+    async def get(self, id: str) -> Optional[Transaction]:
+        """
+        Get a transaction, batched with the other lookups of the window
+
+        Args:
+            id (str): the id of the transaction
+
+        Returns:
+            Optional[Transaction]
+        """
+        return await self.load(id)
+
+    def dispatch(self):
+        """Send the ids waiting without waiting for the end of the window"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._load_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def close(self):
+        """Send the ids waiting and wait for the requests in flight"""
+        self.dispatch()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def _load_batch(self, batch: Dict[str, asyncio.Future]):
+        batch = {id: future for id, future in batch.items() if not future.cancelled()}
+        if not batch:
+            return
+
+        function = self.operation.check_transactions if self.check else self.operation.get_transactions
+        try:
+            transactions = await function(list(batch), source=self.source, timeout=self.timeout,
+                                          deadline=self.deadline)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        found = _index(transactions, self.source)
+        for id, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(id))
@@ -1,3 +1,9 @@
 algorithm = 'HMAC-SHA1'
 host = 'https://mesomb.hachther.com'
 api_version = 'v1.1'
+# encoder used to serialize request bodies: 'json', 'orjson' or a callable returning bytes
+json_encoder = 'json'
+# decode the dates and nested objects of the transaction and wallet models on first access
+lazy_models = False
+# generator of the nonces and transaction IDs: 'random', 'unique' or a callable taking the length
+nonce_provider = 'random'
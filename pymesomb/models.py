@@ -1,6 +1,105 @@
 from abc import ABC
 from datetime import datetime
-from typing import Optional, List, Any, Dict
+from typing import Optional, List, Any, Dict, Callable
+
+from pymesomb import mesomb
+
+# layout of the dates sent by MeSomb
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+def _from_fields(value: str) -> datetime:
+    if not (value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]).isdigit():
+        raise ValueError(f'Invalid isoformat string: {value!r}')
+    return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]), int(value[11:13]), int(value[14:16]),
+                    int(value[17:19]))
+
+
+# datetime.fromisoformat is written in C (Python 3.7+)
+_from_iso = getattr(datetime, 'fromisoformat', _from_fields)
+
+
+def parse_datetime(value: str) -> datetime:
+    """
+    Parse a date sent by MeSomb
+
+    Dates in the `YYYY-MM-DDTHH:MM:SSZ` layout are read with `datetime.fromisoformat`, more than ten times faster
+    than `datetime.strptime` which is only used for the other values (and raises the same ValueError for invalid
+    ones).
+
+    Args:
+        value (str): the date
+
+    Returns:
+        datetime
+    """
+    if len(value) == 20 and value[4] == '-' and value[7] == '-' and value[10] == 'T' and value[13] == ':' \
+            and value[16] == ':' and value[19] == 'Z':
+        try:
+            return _from_iso(value[:19])
+        except ValueError:
+            pass
+    return datetime.strptime(value, DATE_FORMAT)
+
+
+class _Undecoded:
+    """Value of a lazy attribute not decoded yet"""
+
+    def __reduce__(self):
+        return '_UNDECODED'
+
+
+_UNDECODED = _Undecoded()
+
+
+class _Lazy:
+    """
+    Attribute of a model decoded from the raw data on first access
+
+    The value is kept in the slot of the same name prefixed by an underscore, the raw data in the slot `_raw`.
+    """
+
+    def __init__(self, decode: Callable[[Dict[str, Any]], Any]):
+        self.decode = decode
+        self.slot = None
+
+    def __set_name__(self, owner, name):
+        self.slot = owner.__dict__[f'_{name}']
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.slot.__get__(instance, owner)
+        if value is _UNDECODED:
+            value = self.decode(instance._raw)
+            self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+
+def _init_lazy(model, data: Dict[str, Any], lazy: Optional[bool], *names: str):
+    """
+    Set the lazy attributes of a model, decoded right away unless the lazy mode is on
+
+    Args:
+        model: the model being built
+        data (dict): the raw data of the model
+        lazy (bool, optional): decode the attributes on first access, `mesomb.lazy_models` if not set
+        *names (str): the names of the lazy attributes
+    """
+    if lazy is None:
+        lazy = mesomb.lazy_models
+    attributes = type(model)
+    if lazy:
+        model._raw = data
+        for name in names:
+            getattr(attributes, name).slot.__set__(model, _UNDECODED)
+    else:
+        for name in names:
+            attribute = getattr(attributes, name)
+            attribute.slot.__set__(model, attribute.decode(data))
 
 
 class Location:
@@ -16,6 +115,8 @@ class Location:
         country (str, optional): The country of the customer.
     """
 
+    __slots__ = ('town', 'region', 'country')
+
     def __init__(self, data):
         self.town: str = data.get('town')
         self.region: Optional[str] = data.get('region')
@@ -40,6 +141,8 @@ class Customer:
         address (str, optional): The address of the customer.
     """
 
+    __slots__ = ('email', 'phone', 'town', 'region', 'country', 'first_name', 'last_name', 'address')
+
     def __init__(self, data):
         self.email: Optional[str] = data.get('email', None)
         self.phone: Optional[str] = data.get('phone', None)
@@ -66,6 +169,8 @@ class Product:
         amount (float, optional): The amount of the product.
     """
 
+    __slots__ = ('id', 'name', 'category', 'quantity', 'amount')
+
     def __init__(self, data):
         self.id: str = data['id']
         self.name: str = data['name']
@@ -80,6 +185,8 @@ class ATransaction(ABC):
 
     Args:
         data (dict): The transaction data.
+        lazy (bool, optional): decode the dates and nested objects on first access, `mesomb.lazy_models` if not
+            set. The raw data is then kept by the object and must not be changed.
 
     Attributes:
         pk (str): The primary key of the transaction.
@@ -99,7 +206,13 @@ class ATransaction(ABC):
         location (Location, optional): The location of the transaction.
     """
 
-    def __init__(self, data: Dict[str, Any]):
+    __slots__ = ('pk', 'status', 'type', 'amount', 'fees', 'b_party', 'message', 'service', 'reference', '_date',
+                 'country', 'currency', 'fin_trx_id', 'trxamount', '_location', '_raw')
+
+    date: datetime = _Lazy(lambda data: parse_datetime(data['ts']))
+    location: Optional[Location] = _Lazy(lambda data: Location(data['location']) if data.get('location') else None)
+
+    def __init__(self, data: Dict[str, Any], lazy: Optional[bool] = None):
         self.pk: str = data['pk']
         self.status: str = data['status']
         self.type: str = data['type']
@@ -109,12 +222,11 @@ class ATransaction(ABC):
         self.message: Optional[str] = data.get('message')
         self.service: str = data['service']
         self.reference: Optional[str] = data.get('reference')
-        self.date: datetime = datetime.strptime(data['ts'], '%Y-%m-%dT%H:%M:%SZ')
         self.country: str = data['country']
         self.currency: str = data['currency']
         self.fin_trx_id: Optional[str] = data.get('fin_trx_id')
         self.trxamount: Optional[float] = data.get('trxamount')
-        self.location: Optional[Location] = Location(data['location']) if data.get('location') else None
+        _init_lazy(self, data, lazy, 'date', 'location')
 
     def is_success(self) -> bool:
         """
@@ -151,6 +263,8 @@ class Transaction(ATransaction):
 
     Args:
         data (dict): The transaction data.
+        lazy (bool, optional): decode the dates and nested objects on first access, `mesomb.lazy_models` if not
+            set. The raw data is then kept by the object and must not be changed.
 
     Attributes:
         pk (str): The primary key of the transaction.
@@ -172,11 +286,14 @@ class Transaction(ATransaction):
         products (List[Product], optional): The products of the transaction.
     """
 
-    def __init__(self, data: dict):
-        super().__init__(data)
-        self.customer: Optional[Customer] = Customer(data['customer']) if data.get('customer') else None
-        self.products: Optional[List[Product]] = [Product(p) for p in data.get('products', [])]
-        # self.products = data['products?.map((d: Record < string, any >) = > new Product(d))']
+    __slots__ = ('_customer', '_products')
+
+    customer: Optional[Customer] = _Lazy(lambda data: Customer(data['customer']) if data.get('customer') else None)
+    products: Optional[List[Product]] = _Lazy(lambda data: [Product(p) for p in data.get('products', [])])
+
+    def __init__(self, data: dict, lazy: Optional[bool] = None):
+        super().__init__(data, lazy)
+        _init_lazy(self, data, lazy, 'customer', 'products')
 
     def __str__(self):
         return self.pk
@@ -198,6 +315,8 @@ class TransactionResponse:
         status (str): The status of the transaction.
     """
 
+    __slots__ = ('_data', 'success', 'message', 'redirect', 'transaction', 'reference', 'status')
+
     def __init__(self, data: Dict[str, Any]):
         self._data = data
 
@@ -226,6 +345,8 @@ class TransactionResponse:
 class ApplicationBalance:
     """ """
 
+    __slots__ = ('country', 'currency', 'provider', 'value', 'service_name')
+
     def __init__(self, data):
         self.country = data.get("country")
         self.currency = data.get("currency")
@@ -252,6 +373,8 @@ class Application:
         url (str, optional): The URL of the application
     """
 
+    __slots__ = ('key', 'logo', 'balances', 'countries', 'description', 'name', 'security', 'url')
+
     def __init__(self, data: Dict[str, Any]):
         self.key: str = data['key']
         self.logo: Optional[str] = data.get('logo')
@@ -288,6 +411,8 @@ class WalletTransaction:
 
     Args:
         data (dict): The transaction data.
+        lazy (bool, optional): decode the dates and nested objects on first access, `mesomb.lazy_models` if not
+            set. The raw data is then kept by the object and must not be changed.
 
     Attributes:
         id (int): The identifier of the transaction.
@@ -302,7 +427,12 @@ class WalletTransaction:
         fin_trx_id (str): The financial transaction ID.
     """
 
-    def __init__(self, data: Dict[str, Any]):
+    __slots__ = ('id', 'status', 'type', 'amount', 'direction', 'wallet', 'balance_after', '_date', 'country',
+                 'fin_trx_id', '_raw')
+
+    date: datetime = _Lazy(lambda data: parse_datetime(data['date']))
+
+    def __init__(self, data: Dict[str, Any], lazy: Optional[bool] = None):
         self.id: int = data['id']
         self.status: str = data['status']
         self.type: str = data['type']
@@ -310,9 +440,9 @@ class WalletTransaction:
         self.direction: int = data['direction']
         self.wallet: int = data['wallet']
         self.balance_after: Optional[float] = data.get('balance_after')
-        self.date: datetime = datetime.strptime(data['date'], '%Y-%m-%dT%H:%M:%SZ')
         self.country: str = data['country']
         self.fin_trx_id: str = data['fin_trx_id']
+        _init_lazy(self, data, lazy, 'date')
 
 
 class APaginated:
@@ -328,6 +458,8 @@ class APaginated:
         previous (str, optional): The URL to the previous page.
     """
 
+    __slots__ = ('count', 'next', 'previous')
+
     def __init__(self, data: Dict[str, Any]):
         self.count: int = data['count']
         self.next: Optional[str] = data.get('next')
@@ -340,6 +472,8 @@ class Wallet:
 
     Args:
         data (dict): The wallet data.
+        lazy (bool, optional): decode the dates and nested objects on first access, `mesomb.lazy_models` if not
+            set. The raw data is then kept by the object and must not be changed.
 
     Attributes:
         id (int): The identifier of the wallet.
@@ -354,19 +488,24 @@ class Wallet:
         phone_number (str): The phone number of the wallet.
     """
 
-    def __init__(self, data: Dict[str, Any]):
+    __slots__ = ('id', 'number', 'country', 'status', '_last_activity', 'balance', 'first_name', 'last_name', 'email',
+                 'phone_number', 'gender', '_raw')
+
+    last_activity: Optional[datetime] = _Lazy(
+        lambda data: parse_datetime(data['last_activity']) if data.get('last_activity') else None)
+
+    def __init__(self, data: Dict[str, Any], lazy: Optional[bool] = None):
         self.id: int = data['id']
         self.number: str = data['number']
         self.country: str = data['country']
         self.status: str = data['status']
-        self.last_activity: Optional[datetime] = datetime.strptime(data['last_activity'], '%Y-%m-%dT%H:%M:%SZ') \
-            if data.get('last_activity') else None
         self.balance: float = data['balance']
         self.first_name: Optional[str] = data['first_name']
         self.last_name: str = data['last_name']
         self.email: Optional[str] = data['email']
         self.phone_number: str = data['phone_number']
         self.gender = data['gender']
+        _init_lazy(self, data, lazy, 'last_activity')
 
     def __str__(self):
         return self.number
@@ -383,6 +522,8 @@ class PaginatedWallets(APaginated):
         results (List[Wallet]): The list of wallets.
     """
 
+    __slots__ = ('results',)
+
     def __init__(self, data: Dict[str, Any]):
         super().__init__(data)
         self.results: List[Wallet] = [Wallet(w) for w in data['results']]
@@ -399,6 +540,8 @@ class PaginatedWalletTransactions(APaginated):
         results (List[WalletTransaction]): The list of transactions.
     """
 
+    __slots__ = ('results',)
+
     def __init__(self, data: Dict[str, Any]):
         super().__init__(data)
         self.results: List[WalletTransaction] = [WalletTransaction(t) for t in data['results']]
@@ -411,6 +554,8 @@ class Contribution(ATransaction):
 
     Args:
         data (dict): The transaction data.
+        lazy (bool, optional): decode the dates and nested objects on first access, `mesomb.lazy_models` if not
+            set. The raw data is then kept by the object and must not be changed.
 
     Attributes:
         pk (str): The primary key of the transaction.
@@ -431,9 +576,14 @@ class Contribution(ATransaction):
         contributor (Customer, optional): The contributor of the transaction.
     """
 
-    def __init__(self, data: dict):
-        super().__init__(data)
-        self.contributor: Optional[Customer] = Customer(data['contributor']) if data.get('contributor') else None
+    __slots__ = ('_contributor',)
+
+    contributor: Optional[Customer] = _Lazy(
+        lambda data: Customer(data['contributor']) if data.get('contributor') else None)
+
+    def __init__(self, data: dict, lazy: Optional[bool] = None):
+        super().__init__(data, lazy)
+        _init_lazy(self, data, lazy, 'contributor')
 
     def __str__(self):
         return self.pk
@@ -453,6 +603,8 @@ class ContributionResponse:
         status (str): The status of the transaction.
     """
 
+    __slots__ = ('_data', 'success', 'message', 'contribution', 'status')
+
     def __init__(self, data: Dict[str, Any]):
         self._data = data
 
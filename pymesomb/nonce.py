@@ -0,0 +1,166 @@
+import itertools
+import os
+import socket
+import string
+import threading
+import time
+import weakref
+from hashlib import blake2b
+from typing import Optional
+
+from pymesomb import mesomb
+
+ALPHABET = string.ascii_letters + string.digits
+
+# random bytes mapped uniformly to the alphabet, the bytes above the last multiple of its length are dropped
+_TABLE = bytes(ord(ALPHABET[byte % len(ALPHABET)]) for byte in range(256))
+_REJECTED = bytes(range(256 - 256 % len(ALPHABET), 256))
+
+# the providers of the process, their buffers are dropped in the child after a fork
+_providers = weakref.WeakSet()
+_AT_FORK = hasattr(os, 'register_at_fork')
+
+
+def _reset_providers():
+    for provider in list(_providers):
+        provider._reset()
+
+
+if _AT_FORK:
+    os.register_at_fork(after_in_child=_reset_providers)
+
+
+# the pairs of characters of the alphabet, integers are written two characters at a time
+_PAIRS = [first + second for first in ALPHABET for second in ALPHABET]
+
+
+def _encode(value: int, width: int) -> str:
+    """Write an integer in `width` (even) characters of the alphabet, modulo len(ALPHABET) ** width"""
+    pairs = []
+    for _ in range(width // 2):
+        value, position = divmod(value, len(_PAIRS))
+        pairs.append(_PAIRS[position])
+    return ''.join(reversed(pairs))
+
+
+class RandomNonceProvider:
+    """
+    Generate nonces of random letters and digits from the CSPRNG of the operating system.
+
+    Random bytes are read from `os.urandom` by blocks, converted to letters and digits at once and served by slices,
+    so a nonce costs a slice of a string instead of a call to the random module per character. The provider is
+    thread-safe and its buffer is dropped in the child process after a fork, so parent and child never share nonces.
+
+    Args:
+        buffer_size (int): number of random bytes read at once (Default value = 4096)
+    """
+
+    def __init__(self, buffer_size: int = 4096):
+        self.buffer_size = buffer_size
+        self._reset()
+        _providers.add(self)
+
+    def __call__(self, length: int = 40) -> str:
+        return self.random(length)
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._buffer = ''
+        self._position = 0
+        self._pid = os.getpid()
+
+    def _refill(self, length: int):
+        chunks = [self._buffer[self._position:]]
+        size = len(chunks[0])
+        while size < length:
+            chunk = os.urandom(self.buffer_size).translate(_TABLE, _REJECTED).decode('ascii')
+            chunks.append(chunk)
+            size += len(chunk)
+        self._buffer = ''.join(chunks)
+        self._position = 0
+
+    def random(self, length: int = 40) -> str:
+        """
+        Get random letters and digits
+
+        Args:
+            length (int): number of characters (Default value = 40)
+
+        Returns:
+            str
+        """
+        if not _AT_FORK and self._pid != os.getpid():
+            self._reset()
+        with self._lock:
+            end = self._position + length
+            if end > len(self._buffer):
+                self._refill(length)
+                end = length
+            value = self._buffer[self._position:end]
+            self._position = end
+        return value
+
+
+class UniqueNonceProvider(RandomNonceProvider):
+    """
+    Generate nonces unique across the processes and hosts of a fleet.
+
+    Each nonce starts with the time in milliseconds (8 characters), the node, the process id (4 characters) and a
+    counter (4 characters), all written with letters and digits, and ends with random characters. The nonces of a
+    process differ by their time or counter (up to 62 ** 4 nonces per millisecond), those of a fleet are unique as
+    long as each host has its own `node`. Without node, it is derived from the host name, which makes collisions
+    between hosts unlikely but not impossible.
+
+    Args:
+        node (str, optional): identifier of the host, letters and digits
+        buffer_size (int): number of random bytes read at once (Default value = 4096)
+    """
+
+    def __init__(self, node: Optional[str] = None, buffer_size: int = 4096):
+        assert node is None or (node and not node.strip(ALPHABET)), 'Node must be letters and digits'
+        if node is None:
+            digest = blake2b(socket.gethostname().encode('utf-8'), digest_size=4).digest()
+            node = _encode(int.from_bytes(digest, 'big'), 6)
+        self.node = node
+        super().__init__(buffer_size)
+
+    def _reset(self):
+        super()._reset()
+        self._origin = self.node + _encode(self._pid, 4)
+        self._counter = itertools.count()
+        self._milliseconds, self._time = None, ''
+
+    def __call__(self, length: int = 40) -> str:
+        if not _AT_FORK and self._pid != os.getpid():
+            self._reset()
+        milliseconds = int(time.time() * 1000)
+        if milliseconds != self._milliseconds:
+            self._milliseconds, self._time = milliseconds, _encode(milliseconds, 8)
+        prefix = self._time + self._origin + _encode(next(self._counter), 4)
+        assert length >= len(prefix), f'Unique nonces have at least {len(prefix)} characters'
+        return prefix + self.random(length - len(prefix))
+
+
+NONCE_PROVIDERS = {
+    'random': RandomNonceProvider(),
+    'unique': UniqueNonceProvider(),
+}
+
+
+def generate_nonce(length: int = 40) -> str:
+    """
+    Generate a nonce with the provider configured in `mesomb.nonce_provider`
+
+    The random provider is used by default. Set `mesomb.nonce_provider` to 'unique' for nonces unique across a fleet
+    (see :UniqueNonceProvider:) or to any callable taking the length and returning a string.
+
+    Args:
+        length (int): number of characters (Default value = 40)
+
+    Returns:
+        str
+    """
+    provider = mesomb.nonce_provider
+    if not callable(provider):
+        provider = NONCE_PROVIDERS[provider]
+    return provider(length)
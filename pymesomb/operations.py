@@ -1,26 +1,304 @@
+import copy
 import json
+import threading
+import time
 from abc import ABC
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple, Union, Iterable, Iterator, Callable, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from pymesomb import mesomb, __version__
+from pymesomb.cache import TTLCache
+from pymesomb.coalesce import SINGLE_FLIGHT
+from pymesomb.exceptions import (ConnectTimeoutException, ReadTimeoutException, DeadlineExceededException,
+                                 InvalidClientRequestException)
 from pymesomb.models import (TransactionResponse, Application, Transaction, Wallet, PaginatedWallets,
-                             WalletTransaction, PaginatedWalletTransactions, ContributionResponse, Contribution)
-from pymesomb.signature import Signature
-from pymesomb.utils import RandomGenerator
+                             WalletTransaction, PaginatedWalletTransactions, ContributionResponse, Contribution,
+                             APaginated)
+from pymesomb.nonce import generate_nonce
+from pymesomb.ratelimit import RateLimiter
+from pymesomb.retry import RetryPolicy, READ_RETRY, WRITE_RETRY
+from pymesomb.signature import Signer
+from pymesomb.utils import encode_json, OPERATOR_PREFIXES, normalize_msisdn
+
+
+# a timeout in seconds for both the connection and the read, or a (connect, read) tuple
+Timeout = Union[float, Tuple[float, float]]
+
+
+def create_session(pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                   keep_alive: bool = True) -> requests.Session:
+    """
+    Create a HTTP session backed by a pool of persistent connections
+
+    Args:
+        pool_connections (int): number of host pools to keep in cache (Default value = 10)
+        pool_maxsize (int): maximum number of connections to keep open per host (Default value = 10)
+        pool_block (bool): wait for a free connection instead of opening a new one when the pool is full
+            (Default value = False)
+        keep_alive (bool): reuse connections between requests (Default value = True)
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+
+    return session
+
+
+def _get_field(page: Union[APaginated, Dict[str, Any]], field: str) -> Any:
+    """Read a field of a page, built or as decoded from MeSomb"""
+    return page[field] if isinstance(page, dict) else getattr(page, field)
+
+
+def get_last_page(first: Union[APaginated, Dict[str, Any]]) -> int:
+    """
+    Compute the number of pages of a listing from its first page
+
+    Args:
+        first (APaginated or dict): the first page of the listing, as decoded from MeSomb in raw response mode
+
+    Returns:
+        int: the number of pages, at least 1
+    """
+    results = _get_field(first, 'results')
+    if not _get_field(first, 'next'):
+        return 1
+    if not results:
+        return 2
+    return max(2, -(-_get_field(first, 'count') // len(results)))
+
+
+def _get_result(future):
+    """Get the result of a future or the exception it raised"""
+    error = future.exception()
+    return future.result() if error is None else error
+
+
+def _merge_by_ids(ids: List[str], results: Iterable[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Merge the items returned for chunks of `ids`, in the order of `ids` and without duplicates
+
+    Args:
+      ids: the requested ids
+      results: the items returned for each chunk, in the order of the chunks
+
+    Returns:
+      List[Dict[str, Any]]: the items found, those matching none of `ids` at the end
+
+    """
+    positions = {id: position for position, id in enumerate(ids)}
+
+    def get_position(item):
+        for field in ('pk', 'id', 'reference'):
+            position = positions.get(str(item.get(field)))
+            if position is not None:
+                return position
+        return len(ids)
+
+    seen = set()
+    items = []
+    for result in results:
+        for item in result:
+            key = item.get('pk', item.get('id'))
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            items.append(item)
+
+    return sorted(items, key=get_position)
+
+
+class _ServiceGroups:
+    """
+    Items of a bulk call grouped by service, at most `limit` items of each service running at the same time.
+
+    Args:
+        limit (int, optional): maximum number of running items of each service, None for no limit
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        assert limit is None or limit > 0, 'Limit must be greater than 0'
+        self.limit = limit
+        self.running: Dict[Any, int] = {}
+        self.queues: Dict[Any, deque] = {}
+        # number of items waiting for their service
+        self.waiting = 0
+
+    def add(self, service: Any, item: Any) -> List[Any]:
+        """
+        Add an item
+
+        Args:
+            service (Any): the service of the item
+            item (Any): the item
+
+        Returns:
+            List[Any]: the item if it can start now, else it waits for :release:
+        """
+        if self.limit is not None and self.running.get(service, 0) >= self.limit:
+            self.queues.setdefault(service, deque()).append(item)
+            self.waiting += 1
+            return []
+        self.running[service] = self.running.get(service, 0) + 1
+        return [item]
+
+    def release(self, service: Any) -> List[Any]:
+        """
+        Mark an item of a service as finished
+
+        Args:
+            service (Any): the service of the item
+
+        Returns:
+            List[Any]: the next item of the service which can start now
+        """
+        queue = self.queues.get(service)
+        if queue:
+            self.waiting -= 1
+            item = queue.popleft()
+            if not queue:
+                del self.queues[service]
+            return [item]
+        self.running[service] -= 1
+        if not self.running[service]:
+            del self.running[service]
+        return []
 
 
 class AOperation(ABC):
-    """ """
+    """
+    Base class of all MeSomb operations.
+
+    Each operation owns a pool of persistent HTTP connections which is created on the first request and reused by
+    all the following ones. An operation can be used as a context manager to release those connections on exit,
+    or a session can be shared between several operations with the `session` parameter.
+
+    Args:
+        target: the key of the application, fund or provider
+        access_key: the access key provided by MeSomb
+        secret_key: the secret key provided by MeSomb
+        language: the language of the messages returned by MeSomb (Default value = 'en')
+        session (requests.Session, optional): session to use for the requests, it is not closed by the operation
+        pool_connections (int): number of host pools to keep in cache (Default value = 10)
+        pool_maxsize (int): maximum number of connections to keep open per host (Default value = 10)
+        pool_block (bool): wait for a free connection when the pool is full (Default value = False)
+        keep_alive (bool): reuse connections between requests (Default value = True)
+        read_retry (RetryPolicy, optional): retry policy of the GET requests (Default value = READ_RETRY)
+        write_retry (RetryPolicy, optional): retry policy of the other requests (Default value = WRITE_RETRY)
+        connect_timeout (float): time in seconds to wait for the connection to MeSomb (Default value = 10)
+        read_timeout (float): time in seconds to wait for the response of MeSomb, synchronous collects wait for the
+            customer confirmation (Default value = 120)
+        deadline (float, optional): default maximum time in seconds of a whole call, retries included
+        rate_limiter (RateLimiter, optional): limiter of the requests sent for the target of the operation
+        max_ids (int): maximum number of ids sent in one lookup by ids, longer lists are split (Default value = 100)
+        max_url_length (int): maximum length of the URL of a lookup by ids, longer lists are split
+            (Default value = 2000)
+        coalesce (bool): share one request between the concurrent identical GET calls of all the operations of the
+            process, the callers receive the same result object (Default value = False)
+        response_mode (str): 'model' to convert the responses to the classes of :pymesomb.models:, 'raw' to return
+            them as decoded from MeSomb, described by the TypedDicts of :pymesomb.responses:. The caches of
+            :get_status: and :get_wallet: are not used in raw mode and the helpers of the package (reconciler,
+            loader, payouts, ledger) need the model mode, see :with_response_mode: (Default value = 'model')
+    """
     service = None
-
-    def __init__(self, target, access_key, secret_key, language='en'):
+    # operators which can be chosen by service='auto'
+    auto_services = ('MTN', 'ORANGE', 'AIRTEL', 'NEXTTEL')
+
+    def __init__(self, target, access_key, secret_key, language='en', session: Optional[requests.Session] = None,
+                 pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                 keep_alive: bool = True, read_retry: Optional[RetryPolicy] = None,
+                 write_retry: Optional[RetryPolicy] = None, connect_timeout: float = 10, read_timeout: float = 120,
+                 deadline: Optional[float] = None, rate_limiter: Optional[RateLimiter] = None, max_ids: int = 100,
+                 max_url_length: int = 2000, coalesce: bool = False, response_mode: str = 'model'):
+        assert response_mode in ['model', 'raw'], 'Response mode must be model or raw'
         self.target = target
         self.access_key = access_key
         self.secret_key = secret_key
         self.language = language
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.read_retry = read_retry or READ_RETRY
+        self.write_retry = write_retry or WRITE_RETRY
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.deadline = deadline
+        self.rate_limiter = rate_limiter
+        self.max_ids = max_ids
+        self.max_url_length = max_url_length
+        self.coalesce = coalesce
+        self.response_mode = response_mode
+
+        self.signer = Signer(self.service, access_key, secret_key)
+
+        self._session = session
+        self._owns_session = session is None
+        self._session_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The HTTP session used to send the requests, created on first use
+
+        Returns:
+            requests.Session
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = create_session(self.pool_connections, self.pool_maxsize, self.pool_block,
+                                                   self.keep_alive)
+        return self._session
+
+    def with_response_mode(self, response_mode: str) -> 'AOperation':
+        """
+        Get a copy of the operation returning the responses in another mode
+
+        The copy shares the connections, limiter and caches of the operation, and does not close the connections.
+
+        Args:
+            response_mode (str): 'model' or 'raw'
+
+        Returns:
+            AOperation
+
+        Examples:
+            >>> operation.with_response_mode('raw').make_collect(amount=100, service='MTN', payer='670000000')
+        """
+        assert response_mode in ['model', 'raw'], 'Response mode must be model or raw'
+        operation = copy.copy(self)
+        operation.response_mode = response_mode
+        operation._session = self.session
+        operation._owns_session = False
+        return operation
+
+    def close(self):
+        """
+        Close the connections opened by the operation.
+
+        A session given at the creation of the operation is left open since it can be shared with other operations.
+        """
+        with self._session_lock:
+            if self._session is not None and self._owns_session:
+                self._session.close()
+                self._session = None
 
     def process_client_exception(self, response):
         """
@@ -71,7 +349,7 @@ class AOperation(ABC):
         return f'{mesomb.host}/api/{mesomb.api_version}/{endpoint}'
 
     def get_authorization(self, method: str, endpoint: str, date: datetime, nonce: str,
-                          headers: Optional[Dict[str, Any]] = None, body: Optional[Dict[str, Any]] = None) -> str:
+                          headers: Optional[Dict[str, Any]] = None, body: Optional[bytes] = None) -> str:
         """
         Get the authorization to use in the request
 
@@ -81,7 +359,7 @@ class AOperation(ABC):
             date (datetime): the date of the request
             nonce (str): the nonce of the request
             headers (Optional[Dict[str, Any]]): the headers to use in the request (Default value = None)
-            body (Optional[Dict[str, Any]]): the body to use in the request (Default value = None)
+            body (Optional[bytes]): the serialized body of the request (Default value = None)
 
         Returns:
             str: the authorization to use in the request
@@ -91,14 +369,14 @@ class AOperation(ABC):
 
         url = self.build_url(endpoint)
 
-        credentials = {'access_key': self.access_key, 'secret_key': self.secret_key}
+        return self.signer.sign(method, url, date, nonce, headers, body)
 
-        return Signature.sign_request(self.service, method, url, date, nonce, credentials, headers, body)
-
-    def execute_request(self, method: str, endpoint: str, date: datetime, nonce: str = '', body: Dict[str, Any] = None,
-                        mode: Optional[str] = None):
+    def prepare_request(self, method: str, endpoint: str, date: datetime, nonce: str = '',
+                        body: Dict[str, Any] = None, mode: Optional[str] = None):
         """
-        Execute the request to the MeSomb API
+        Build the url, the signed headers and the serialized body of a request to the MeSomb API.
+
+        The body is serialized only once: the signature is computed on the exact bytes sent to MeSomb.
 
         Args:
             method (str): the HTTP method to use
@@ -109,18 +387,11 @@ class AOperation(ABC):
             mode (Optional[str]): the mode to use in the request (Default value = None)
 
         Returns:
-            dict: the response of the request
-
-        Raises:
-            ServiceNotFoundException: When the service is not found
-            PermissionDeniedException: When the permission is denied
-            InvalidClientRequestException: When the client request is invalid
-            ServerException: When the server return an error
+            tuple: the url, the headers and the body (bytes or None) of the request
         """
         url = self.build_url(endpoint)
 
         headers = {
-            'x-mesomb-date': str(int(date.timestamp())),
             'x-mesomb-nonce': nonce,
             'Accept-Language': self.language,
             'X-MeSomb-Source': f'PyMeSomb/{__version__}',
@@ -141,42 +412,412 @@ class AOperation(ABC):
         if mode:
             headers['X-MeSomb-OperationMode'] = mode
 
+        data = None
+        if body is not None:
+            data = encode_json(body)
+            headers['Content-Type'] = 'application/json'
+
+        self.sign_headers(method, url, headers, data, date)
+
+        return url, headers, data
+
+    def sign_headers(self, method: str, url: str, headers: Dict[str, str], data: Optional[bytes], date: datetime):
+        """
+        Set the date and the authorization of a prepared request, used again to sign a retried request
+
+        Args:
+            method (str): the HTTP method to use
+            url (str): the url of the request
+            headers (Dict[str, str]): the headers of the request, updated in place
+            data (Optional[bytes]): the serialized body of the request
+            date (datetime): the date of the request
+        """
+        timestamp = str(int(date.timestamp()))
+        nonce = headers['x-mesomb-nonce']
+        headers['x-mesomb-date'] = timestamp
+
         if method == 'POST':
-            authorization = self.get_authorization(method, endpoint, date, nonce,
-                                                   headers={'content-type': 'application/json'},
-                                                   body=body)
+            authorization = self.signer.sign(method, url, date, nonce, headers={'content-type': 'application/json'},
+                                             body=data, timestamp=timestamp)
         else:
-            authorization = self.get_authorization(method, endpoint, date, nonce)
+            authorization = self.signer.sign(method, url, date, nonce, timestamp=timestamp)
 
         headers['Authorization'] = authorization
 
-        response = requests.request(method, url, json=body, headers=headers)
+    def get_retry_policy(self, method: str) -> RetryPolicy:
+        """
+        Get the retry policy to use for requests with this HTTP method
 
-        status_code = response.status_code
-        if status_code >= 400:
+        Args:
+            method (str): the HTTP method of the request
+
+        Returns:
+            RetryPolicy: `read_retry` for GET requests and `write_retry` otherwise
+        """
+        return self.read_retry if method == 'GET' else self.write_retry
+
+    def process_response(self, response):
+        """
+        Check the status of the response and decode its content
+
+        Args:
+            response: the response from the request
+
+        Returns:
+            dict: the content of the response
+        """
+        if response.status_code >= 400:
             self.process_client_exception(response)
 
         return response.json()
 
+    def get_expiry(self, deadline: Optional[float] = None) -> Optional[float]:
+        """
+        Compute the monotonic time at which a call started now expires
+
+        Args:
+            deadline (float, optional): maximum time in seconds of the call, the default deadline if not set
+
+        Returns:
+            Optional[float]: the expiry time or None if the call has no deadline
+        """
+        if deadline is None:
+            deadline = self.deadline
+        return time.monotonic() + deadline if deadline is not None else None
+
+    def get_remaining(self, expires_at: Optional[float]) -> Optional[float]:
+        """
+        Compute the time left before a call expires
+
+        Args:
+            expires_at (float, optional): monotonic time at which the call expires
+
+        Returns:
+            Optional[float]: the time left in seconds, None if the call has no deadline
+        """
+        return max(0.0, expires_at - time.monotonic()) if expires_at is not None else None
+
+    def get_timeouts(self, timeout: Optional[Timeout] = None, expires_at: Optional[float] = None):
+        """
+        Compute the connect and read timeouts of the next attempt of a request
+
+        Args:
+            timeout (float or tuple, optional): timeouts of the call, the default timeouts if not set
+            expires_at (float, optional): monotonic time at which the call expires
+
+        Returns:
+            tuple: the connect and read timeouts in seconds
+
+        Raises:
+            DeadlineExceededException: When the call already expired
+        """
+        if timeout is None:
+            connect, read = self.connect_timeout, self.read_timeout
+        elif isinstance(timeout, (tuple, list)):
+            connect, read = timeout
+        else:
+            connect = read = timeout
+
+        if expires_at is not None:
+            remaining = expires_at - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceededException('The deadline of the operation is exceeded', None)
+            connect, read = min(connect, remaining), min(read, remaining)
+
+        return connect, read
+
+    def get_backoff(self, policy: RetryPolicy, attempt: int, response=None, expires_at: Optional[float] = None):
+        """
+        Compute the time to wait before retrying a failed attempt
+
+        Args:
+            policy (RetryPolicy): the retry policy of the request
+            attempt (int): the number of the attempt which failed (starting at 0)
+            response: the response of the attempt, None if MeSomb could not be reached
+            expires_at (float, optional): monotonic time at which the call expires
+
+        Returns:
+            Optional[float]: the time to wait in seconds, None if the request must not be retried
+        """
+        if not policy.can_retry(attempt):
+            return None
+
+        backoff = policy.get_backoff(attempt, response.headers.get('Retry-After') if response is not None else None)
+        if expires_at is not None and time.monotonic() + backoff >= expires_at:
+            return None
+
+        return backoff
+
+    def get_transport_exception(self, error: Exception, timeout_type: Optional[str], expired: bool) -> Exception:
+        """
+        Get the exception to raise when MeSomb can not be reached
+
+        Args:
+            error (Exception): the error raised by the HTTP client
+            timeout_type (str, optional): 'connect' or 'read' when the error is a timeout
+            expired (bool): True if the deadline of the call stopped the retries
+
+        Returns:
+            Exception: a TimeoutException for timeouts and expired calls, the error itself otherwise
+        """
+        if expired:
+            return DeadlineExceededException(f'The deadline of the operation is exceeded: {error}', None)
+        if timeout_type == 'connect':
+            return ConnectTimeoutException(f'Timeout while connecting to MeSomb: {error}', None)
+        if timeout_type == 'read':
+            return ReadTimeoutException(f'Timeout while waiting the response of MeSomb: {error}', None)
+        return error
+
+    def execute_request(self, method: str, endpoint: str, date: datetime, nonce: str = '', body: Dict[str, Any] = None,
+                        mode: Optional[str] = None, timeout: Optional[Timeout] = None,
+                        deadline: Optional[float] = None):
+        """
+        Execute the request to the MeSomb API
+
+        Args:
+            method (str): the HTTP method to use
+            endpoint (str): the endpoint to use in the request
+            date (datetime): the date of the request
+            nonce (str): the nonce of the request (Default value = '')
+            body (Dict[str, Any]): the body to use in the request (Default value = None)
+            mode (Optional[str]): the mode to use in the request (Default value = None)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of each attempt
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
+
+        Returns:
+            dict: the response of the request
+
+        Raises:
+            ServiceNotFoundException: When the service is not found
+            PermissionDeniedException: When the permission is denied
+            InvalidClientRequestException: When the client request is invalid
+            ServerException: When the server return an error
+            TimeoutException: When MeSomb does not answer in time or the deadline is exceeded
+            requests.RequestException: When MeSomb can not be reached after the retries
+        """
+        expires_at = self.get_expiry(deadline)
+        url, headers, data = self.prepare_request(method, endpoint, date, nonce, body, mode)
+        policy = self.get_retry_policy(method)
+
+        attempt = 0
+        while True:
+            if self.rate_limiter and not self.rate_limiter.acquire(self.target, timeout=self.get_remaining(expires_at)):
+                raise DeadlineExceededException('The deadline of the operation is exceeded by the rate limiter', None)
+            try:
+                response = self.session.request(method, url, data=data, headers=headers,
+                                                timeout=self.get_timeouts(timeout, expires_at))
+            except (requests.ConnectionError, requests.Timeout) as e:
+                backoff = self.get_backoff(policy, attempt, None, expires_at)
+                if backoff is None:
+                    timeout_type = 'connect' if isinstance(e, requests.ConnectTimeout) else \
+                        'read' if isinstance(e, requests.Timeout) else None
+                    expired = policy.can_retry(attempt)
+                    raise self.get_transport_exception(e, timeout_type, expired) from e
+            else:
+                if not policy.is_retryable_status(response.status_code):
+                    return self.process_response(response)
+                backoff = self.get_backoff(policy, attempt, response, expires_at)
+                if backoff is None:
+                    return self.process_response(response)
+
+            time.sleep(backoff)
+            attempt += 1
+            self.sign_headers(method, url, headers, data, datetime.now())
+
+    def _request(self, parser, method: str, endpoint: str, nonce: str = '', body: Dict[str, Any] = None,
+                 mode: Optional[str] = None, timeout: Optional[Timeout] = None, deadline: Optional[float] = None):
+        """
+        Execute a request and convert its response with `parser`.
+
+        Public operations go through this method so that the asynchronous operations can reuse them by overriding
+        it with a coroutine.
+
+        Args:
+            parser: callable converting the response, None to return it as is
+            method (str): the HTTP method to use
+            endpoint (str): the endpoint to use in the request
+            nonce (str): the nonce of the request (Default value = '')
+            body (Dict[str, Any]): the body to use in the request (Default value = None)
+            mode (Optional[str]): the mode to use in the request (Default value = None)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of each attempt
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
+
+        Returns:
+            the converted response of the request
+        """
+        if method == 'GET' and self.coalesce:
+            return SINGLE_FLIGHT.do(
+                self.get_coalescing_key(parser, endpoint),
+                lambda: self._send(parser, method, endpoint, nonce, body, mode, timeout, deadline),
+                deadline if deadline is not None else self.deadline,
+            )
+
+        return self._send(parser, method, endpoint, nonce, body, mode, timeout, deadline)
+
+    def _send(self, parser, method: str, endpoint: str, nonce: str = '', body: Dict[str, Any] = None,
+              mode: Optional[str] = None, timeout: Optional[Timeout] = None, deadline: Optional[float] = None):
+        data = self.execute_request(method, endpoint, datetime.now(), nonce, body, mode, timeout, deadline)
+
+        return self._parse(parser, data)
+
+    def _parse(self, parser, data):
+        """Convert a response, the model classes are skipped in raw response mode"""
+        if parser is None or (self.response_mode == 'raw' and isinstance(parser, type)):
+            return data
+        return parser(data)
+
+    def get_coalescing_key(self, parser, endpoint: str) -> tuple:
+        """
+        Get the key identifying identical GET calls
+
+        Args:
+            parser: callable converting the response
+            endpoint (str): the endpoint of the request
+
+        Returns:
+            tuple
+        """
+        return mesomb.host, self.service, self.target, self.access_key, self.language, endpoint, parser, \
+            self.response_mode
+
+    def resolve_service(self, service: str, number: str, country: str = 'CM') -> Tuple[str, str]:
+        """
+        Resolve service='auto' from the account number
+
+        The number is normalized (separators, + or 00 and calling code removed), its length checked when the prefixes
+        of the country define it and its operator detected with the prefixes of :pymesomb.utils.OPERATOR_PREFIXES:.
+        Other services are returned unchanged with the number.
+
+        Args:
+            service (str): the payment service, or 'auto' to detect it
+            number (str): the account number of the payer or receiver
+            country (str): 2 letters country code of the number (Default value = 'CM')
+
+        Returns:
+            tuple: the service and the account number to send
+
+        Raises:
+            InvalidClientRequestException: When the number has not the length of the numbers of the country, or its
+                operator can not be detected or is not one of :auto_services:
+        """
+        if service != 'auto':
+            return service, number
+
+        normalized = normalize_msisdn(number, country)
+        prefixes = OPERATOR_PREFIXES.get(country)
+        operator = None
+        if normalized and prefixes and (not prefixes.length or len(normalized) == prefixes.length):
+            operator = prefixes.match(normalized)
+        if operator not in self.auto_services:
+            raise InvalidClientRequestException(f'Unable to detect a supported service for the number {number}',
+                                                'unsupported-number')
+        return operator, normalized
+
+    def split_ids(self, endpoint: str, ids: Iterable[Any], repeat: bool = False) -> Tuple[List[str], List[str]]:
+        """
+        Split a lookup by ids in requests respecting `max_ids` and `max_url_length`
+
+        Args:
+            endpoint (str): the endpoint with a `{ids}` placeholder
+            ids (Iterable[Any]): the ids to look up, duplicates are removed
+            repeat (bool): send each id as a `ids=` parameter instead of a comma separated list (Default value = False)
+
+        Returns:
+            tuple: the unique ids in their input order and the endpoints of the chunks
+        """
+        ids = list(dict.fromkeys(str(id) for id in ids))
+        prefix, separator = ('ids=', '&') if repeat else ('', ',')
+        budget = self.max_url_length - len(self.build_url(endpoint.format(ids='')))
+
+        endpoints = []
+        chunk, length = [], 0
+        for id in ids:
+            size = len(prefix) + len(id) + (len(separator) if chunk else 0)
+            if chunk and (len(chunk) >= self.max_ids or length + size > budget):
+                endpoints.append(endpoint.format(ids=separator.join(chunk)))
+                chunk, length = [], 0
+                size = len(prefix) + len(id)
+            chunk.append(prefix + id)
+            length += size
+        if chunk:
+            endpoints.append(endpoint.format(ids=separator.join(chunk)))
+
+        return ids, endpoints
+
+    def _request_ids(self, model, endpoint: str, ids: Iterable[Any], repeat: bool = False,
+                     timeout: Optional[Timeout] = None, deadline: Optional[float] = None):
+        """
+        Look up items by ids, splitting the ids in chunks fetched concurrently
+
+        Args:
+            model: the class of the items, None to return them as decoded from MeSomb
+            endpoint (str): the endpoint with a `{ids}` placeholder
+            ids (Iterable[Any]): the ids to look up
+            repeat (bool): send each id as a `ids=` parameter instead of a comma separated list (Default value = False)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of each attempt
+            deadline (float, optional): maximum time in seconds of the whole lookup, retries included, each chunk
+                gets the time left when it is sent
+
+        Returns:
+            list: the items found in the order of `ids`, without duplicates
+        """
+        ids, endpoints = self.split_ids(endpoint, ids, repeat)
+        expires_at = self.get_expiry(deadline)
+
+        def fetch(endpoint):
+            return self._request(None, 'GET', endpoint, timeout=timeout, deadline=self.get_remaining(expires_at))
+
+        if len(endpoints) <= 1:
+            results = [fetch(endpoint) for endpoint in endpoints]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(endpoints), self.pool_maxsize)) as executor:
+                results = list(executor.map(fetch, endpoints))
+
+        items = _merge_by_ids(ids, results)
+        return [model(item) for item in items] if model and self.response_mode == 'model' else items
+
 
 class PaymentOperation(AOperation):
     """
     Payment operation class to interact with the MeSomb payment service
+
+    Args:
+        status_cache (TTLCache, optional): cache of :get_status: by application key, it can be shared by several
+            operations. The status of the application is invalidated after each collect, deposit or refund made by
+            the operation.
     """
     service = 'payment'
 
-    def __init__(self, application_key, access_key, secret_key):
-        super().__init__(application_key, access_key, secret_key)
+    def __init__(self, application_key, access_key, secret_key, language='en',
+                 status_cache: Optional[TTLCache] = None, **kwargs):
+        super().__init__(application_key, access_key, secret_key, language, **kwargs)
+        self.status_cache = status_cache
+
+    def invalidate_status(self):
+        """Remove the status of the application from the cache, the next :get_status: calls MeSomb"""
+        if self.status_cache is not None:
+            self.status_cache.invalidate(self.target)
+
+    def _moving_money(self, parser):
+        """Build a parser invalidating the status of the application once the request succeeded"""
+
+        def parse(data):
+            self.invalidate_status()
+            return self._parse(parser, data)
+
+        return parse
 
     def make_collect(self, amount: float, service: str, payer: str, nonce: Optional[str] = None, country: str = 'CM',
                      currency: str = 'XAF', fees: bool = True, mode: str = 'synchronous', conversion: bool = False,
                      location: Optional[Dict[str, str]] = None, products: Optional[List[Dict[str, str]]] = None,
-                     customer: Optional[Dict[str, str]] = None, trx_id: Optional[str] = None) -> TransactionResponse:
+                     customer: Optional[Dict[str, str]] = None, trx_id: Optional[str] = None,
+                     timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> TransactionResponse:
         """Collect money a use account
 
         Args:
             amount (float): amount to collect
-            service (str): payment service with the possible values MTN, ORANGE, AIRTEL
+            service (str): payment service with the possible values MTN, ORANGE, AIRTEL or auto to detect it from
+                        `payer`, see :resolve_service:
             payer (str): account number to collect money
             nonce (str, optional): unique string on each request
             country (str): 2 letters country code of the service, configured during your service registration
@@ -194,10 +835,13 @@ class PaymentOperation(AOperation):
                         string, last_name string, address string, town string, region string and country string
             trx_id (str): if you want to include your transaction ID in the request
             mode (str): Mode of the transaction synchronous or asynchronous (Default value = 'synchronous')
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
             TransactionResponse
         """
+        service, payer = self.resolve_service(service, payer, country)
 
         endpoint = 'payment/collect/'
 
@@ -223,19 +867,110 @@ class PaymentOperation(AOperation):
         if products:
             body['products'] = products
 
-        return TransactionResponse(
-            self.execute_request('POST', endpoint, datetime.now(), nonce or RandomGenerator.nonce(), body, mode))
+        return self._request(self._moving_money(TransactionResponse), 'POST', endpoint,
+                             nonce or generate_nonce(), body, mode, timeout=timeout, deadline=deadline)
+
+    def prepare_collect_specs(self, specs: Iterable[Dict[str, Any]]):
+        """
+        Check the items of a bulk collect and give a transaction ID to the items without one.
+
+        The generated transaction ID is set in the `trx_id` key of the item so the caller can find the transaction
+        later. The items with service='auto' get the detected operator in `service` and the normalized number in
+        `payer`, the items of an unsupported number are rejected without being sent.
+
+        Args:
+            specs (Iterable[Dict[str, Any]]): the parameters of :make_collect: for each item
+
+        Returns:
+            Iterator[Tuple[int, Dict[str, Any], Optional[APIException]]]: the index and the parameters of each item,
+                with the error preventing to send it
+        """
+        seen = set()
+        for index, spec in enumerate(specs):
+            if not spec.get('trx_id'):
+                spec['trx_id'] = generate_nonce(32)
+            trx_id = str(spec['trx_id'])
+            if trx_id in seen:
+                yield index, spec, InvalidClientRequestException(f'Duplicated transaction ID {trx_id}',
+                                                                 'duplicated-trx-id')
+                continue
+            seen.add(trx_id)
+            if spec.get('service') == 'auto':
+                try:
+                    spec['service'], spec['payer'] = self.resolve_service('auto', spec.get('payer', ''),
+                                                                          spec.get('country', 'CM'))
+                except InvalidClientRequestException as e:
+                    yield index, spec, e
+                    continue
+            yield index, spec, None
+
+    def make_collect_many(self, specs: Iterable[Dict[str, Any]], concurrency: int = 10,
+                          timeout: Optional[Timeout] = None, deadline: Optional[float] = None,
+                          service_concurrency: Optional[int] = None):
+        """
+        Collect money from many accounts concurrently.
+
+        The items are read lazily from `specs` and at most `concurrency` collects are sent at the same time over the
+        connection pool of the operation, set `pool_maxsize` to at least `concurrency` to reuse all the connections.
+        Results are yielded as soon as they are available, not in the order of `specs`. Each item must have a unique
+        `trx_id`, one is generated for items without it.
+
+        The items are grouped by service, resolved first for service='auto' (see :prepare_collect_specs:). With
+        `service_concurrency`, the items of a service having that many collects in flight wait for one of them to
+        finish while the items of the other services are sent, so a slow operator does not hold all the slots.
+
+        Args:
+            specs (Iterable[Dict[str, Any]]): the parameters of :make_collect: for each item
+            concurrency (int): maximum number of collects sent or waiting at the same time (Default value = 10)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of each collect
+            deadline (float, optional): maximum time in seconds of each collect, retries included
+            service_concurrency (int, optional): maximum number of collects of the same service sent at the same time
+
+        Returns:
+            Iterator[Tuple[int, Union[TransactionResponse, Exception]]]: the index of the item in `specs` with its
+                response or the exception raised by its collect
+        """
+        groups = _ServiceGroups(service_concurrency)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = {}
+
+            def start(ready):
+                for index, options in ready:
+                    pending[executor.submit(self.make_collect, **options)] = index, options.get('service')
+
+            def finish(done):
+                for future in done:
+                    index, service = pending.pop(future)
+                    start(groups.release(service))
+                    yield index, _get_result(future)
+
+            for index, spec, error in self.prepare_collect_specs(specs):
+                if error is not None:
+                    yield index, error
+                    continue
+
+                options = {'timeout': timeout, 'deadline': deadline, **spec}
+                start(groups.add(options.get('service'), (index, options)))
+                while len(pending) + groups.waiting >= concurrency:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from finish(done)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from finish(done)
 
     def make_deposit(self, amount: float, service: str, receiver: str, nonce: Optional[str] = None,
                      country: Optional[str] = 'CM', currency: Optional[str] = 'XAF', conversion: Optional[bool] = False,
                      location: Optional[Dict[str, str]] = None, products: Optional[List[Dict[str, str]]] = None,
-                     customer: Optional[Dict[str, str]] = None, trx_id: Optional[str] = None) -> TransactionResponse:
+                     customer: Optional[Dict[str, str]] = None, trx_id: Optional[str] = None,
+                     timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> TransactionResponse:
         """
         Method to make deposit in a receiver mobile account.
 
         Args:
             amount (float): amount to collect
-            service (str): payment service with the possible values MTN, ORANGE, AIRTEL
+            service (str): payment service with the possible values MTN, ORANGE, AIRTEL or auto to detect it from
+                    `receiver`, see :resolve_service:
             receiver (str): account number to depose money
             nonce (str, optional): unique string on each request
             country (str, optional): 2 letters country code of the service configured during your service
@@ -250,10 +985,14 @@ class PaymentOperation(AOperation):
             customer (dict): a Map containing information about the customer: phone string, email: string,
                     first_name string, last_name string, address string, town string, region string and country string
             trx_id (str): if you want to include your transaction ID in the request
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
             TransactionResponse
         """
+        service, receiver = self.resolve_service(service, receiver, country)
+
         endpoint = 'payment/deposit/'
 
         body = {
@@ -278,19 +1017,21 @@ class PaymentOperation(AOperation):
         if products:
             body['products'] = products
 
-        return TransactionResponse(
-            self.execute_request('POST', endpoint, datetime.now(), nonce or RandomGenerator.nonce(), body))
+        return self._request(self._moving_money(TransactionResponse), 'POST', endpoint,
+                             nonce or generate_nonce(), body, timeout=timeout, deadline=deadline)
 
     def purchase_airtime(self, amount: float, service: str, receiver: str, merchant: str, nonce: Optional[str] = None,
                      country: Optional[str] = 'CM', currency: Optional[str] = 'XAF',
                      location: Optional[Dict[str, str]] = None, products: Optional[List[Dict[str, str]]] = None,
-                     customer: Optional[Dict[str, str]] = None, trx_id: Optional[str] = None) -> TransactionResponse:
+                     customer: Optional[Dict[str, str]] = None, trx_id: Optional[str] = None,
+                     timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> TransactionResponse:
         """
         Method to make deposit in a receiver mobile account.
 
         Args:
             amount (float): amount to collect
-            service (str): payment service with the possible values MTN, ORANGE, AIRTEL
+            service (str): payment service with the possible values MTN, ORANGE, AIRTEL or auto to detect it from
+                    `receiver`, see :resolve_service:
             receiver (str): account number to depose money
             nonce (str, optional): unique string on each request
             country (str, optional): 2 letters country code of the service configured during your service
@@ -304,10 +1045,14 @@ class PaymentOperation(AOperation):
             customer (dict): a Map containing information about the customer: phone string, email: string,
                     first_name string, last_name string, address string, town string, region string and country string
             trx_id (str): if you want to include your transaction ID in the request
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
             TransactionResponse
         """
+        service, receiver = self.resolve_service(service, receiver, country)
+
         endpoint = 'payment/airtime/'
 
         body = {
@@ -332,14 +1077,15 @@ class PaymentOperation(AOperation):
         if products:
             body['products'] = products
 
-        return TransactionResponse(
-            self.execute_request('POST', endpoint, datetime.now(), nonce or RandomGenerator.nonce(), body))
+        return self._request(self._moving_money(TransactionResponse), 'POST', endpoint,
+                             nonce or generate_nonce(), body, timeout=timeout, deadline=deadline)
 
     def make_yango_refill(self, amount: float, service: str, payer: str, driver_id: str, nonce=None,
                           country: Optional[str] = 'CM', currency: Optional[str] = 'XAF',
                           mode: Optional[str] = 'synchronous', location: Optional[Dict[str, str]] = None,
                           customer: Optional[Dict[str, str]] = None,
-                          trx_id: Optional[str] = None) -> TransactionResponse:
+                          trx_id: Optional[str] = None,
+                          timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> TransactionResponse:
         """
         Method to refill a Yango account.
 
@@ -358,6 +1104,8 @@ class PaymentOperation(AOperation):
             customer (dict): a Map containing information about the customer: phone string, email: string,
                     first_name string, last_name string, address string, town string, region string and country string
             trx_id (str): if you want to include your transaction ID in the request
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
           TransactionResponse
@@ -384,51 +1132,72 @@ class PaymentOperation(AOperation):
         if customer:
             body['customer'] = customer
 
-        return TransactionResponse(
-            self.execute_request('POST', endpoint, datetime.now(), nonce or RandomGenerator.nonce(), body, mode))
+        return self._request(self._moving_money(TransactionResponse), 'POST', endpoint,
+                             nonce or generate_nonce(), body, mode, timeout=timeout, deadline=deadline)
 
-    def get_status(self) -> Application:
+    def get_status(self, timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> Application:
         """Get the current status of your service on MeSomb
 
+        With a `status_cache`, the status is read from the cache while it is fresh (except in raw response mode).
+
+        Args:
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
+
         Returns:
           Application
 
         """
         endpoint = 'payment/status/'
 
-        return Application(self.execute_request('GET', endpoint, datetime.now()))
+        if self.status_cache is None or self.response_mode == 'raw':
+            return self._request(Application, 'GET', endpoint, timeout=timeout, deadline=deadline)
+
+        return self.status_cache.get_or_load(
+            self.target, lambda: self._request(Application, 'GET', endpoint, timeout=timeout, deadline=deadline))
 
-    def get_transactions(self, ids, source='MESOMB') -> List[Transaction]:
+    def get_transactions(self, ids, source='MESOMB', timeout: Optional[Timeout] = None,
+                         deadline: Optional[float] = None) -> List[Transaction]:
         """
         Get transactions from MeSomb by IDs.
 
+        Long lists of ids are split in several requests sent concurrently, see `max_ids` and `max_url_length`.
+
         Args:
             source: source of the transactionID: MESOMB or EXTERNAL (Default value = 'MESOMB')
             ids: list of ids
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
-            List[Transaction]
+            List[Transaction]: the transactions in the order of `ids`, without duplicates
         """
-        endpoint = f"payment/transactions/?{'&'.join([f'ids={id}' for id in ids])}&source={source}"
+        endpoint = f"payment/transactions/?{{ids}}&source={source}"
 
-        return [Transaction(item) for item in self.execute_request('GET', endpoint, datetime.now())]
+        return self._request_ids(Transaction, endpoint, ids, True, timeout=timeout, deadline=deadline)
 
-    def check_transactions(self, ids, source='MESOMB') -> List[Transaction]:
+    def check_transactions(self, ids, source='MESOMB', timeout: Optional[Timeout] = None,
+                           deadline: Optional[float] = None) -> List[Transaction]:
         """
         Check transactions from MeSomb by IDs.
 
+        Long lists of ids are split in several requests sent concurrently, see `max_ids` and `max_url_length`.
+
         Args:
             source: source of the transactionID: MESOMB or EXTERNAL (Default value = 'MESOMB')
             ids: list of ids
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
-            List[Transaction]
+            List[Transaction]: the transactions in the order of `ids`, without duplicates
         """
-        endpoint = f"payment/transactions/check/?ids={','.join(ids)}&source={source}"
-        return [Transaction(item) for item in self.execute_request('GET', endpoint, datetime.now())]
+        endpoint = f"payment/transactions/check/?ids={{ids}}&source={source}"
+        return self._request_ids(Transaction, endpoint, ids, timeout=timeout, deadline=deadline)
 
     def refund_transaction(self, trx_id: str, amount: Optional[float] = None, conversion: Optional[bool] = None,
-                           currency: str = None) -> TransactionResponse:
+                           currency: str = None,
+                           timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> TransactionResponse:
         """
         Refund a transaction in MeSomb
 
@@ -438,6 +1207,8 @@ class PaymentOperation(AOperation):
             conversion: true if you want to rely on MeSomb to convert the amount in the local
                 currency (Default value = None)
             currency: currency of your service depending on your country (Default value = None)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
         Returns:
             TransactionResponse
         """
@@ -452,22 +1223,97 @@ class PaymentOperation(AOperation):
         if conversion:
             body['conversion'] = conversion
 
-        return TransactionResponse(self.execute_request('POST', endpoint, datetime.now(), RandomGenerator.nonce(),
-                                                       body))
+        return self._request(self._moving_money(TransactionResponse), 'POST', endpoint, generate_nonce(),
+                             body, timeout=timeout, deadline=deadline)
 
 
 class WalletOperation(AOperation):
     """
     Wallet operation class to interact with the MeSomb wallet service
+
+    Args:
+        wallet_cache (TTLCache, optional): cache of :get_wallet:, it can be shared by several operations. Wallets are
+            updated or removed from the cache by the changes made through the operation, the balance being patched
+            with the `balance_after` of the transactions. See `wallet_cache.stats` to size it.
     """
     service = 'wallet'
 
-    def __init__(self, provider_key, access_key, secret_key):
-        super().__init__(provider_key, access_key, secret_key)
+    def __init__(self, provider_key, access_key, secret_key, language='en', wallet_cache: Optional[TTLCache] = None,
+                 **kwargs):
+        super().__init__(provider_key, access_key, secret_key, language, **kwargs)
+        self.wallet_cache = wallet_cache
+
+    def _on_wallet_change(self, parser, callback: Callable[[Any], None], wallets: Sequence[int] = ()):
+        """Build a parser calling `callback` with the result to update the cache of wallets, the `wallets` are
+        removed from the cache instead in raw response mode"""
+
+        def parse(data):
+            result = self._parse(parser, data)
+            if self.wallet_cache is not None:
+                if parser is not None and self.response_mode == 'raw':
+                    for wallet in wallets:
+                        self.wallet_cache.invalidate((self.target, wallet))
+                else:
+                    callback(result)
+            return result
+
+        return parse
+
+    def _patch_balance(self, wallet: int, transaction: WalletTransaction):
+        """Set the balance of a cached wallet after a transaction, remove the wallet if the balance is unknown"""
+        key = (self.target, wallet)
+        if transaction.balance_after is None:
+            self.wallet_cache.invalidate(key)
+            return
+
+        def patch(cached):
+            cached = copy.copy(cached)
+            cached.balance = transaction.balance_after
+            return cached
+
+        self.wallet_cache.update(key, patch)
+
+    def _iter_pages(self, fetch: Callable[[int], APaginated], prefetch: int = 1) -> Iterator[Any]:
+        """
+        Yield the items of all the pages of a listing, fetching the next pages in the background
+
+        Args:
+            fetch (Callable[[int], APaginated]): function returning a page by its number
+            prefetch (int): maximum number of pages fetched ahead of the caller (Default value = 1)
+
+        Returns:
+            Iterator[Any]
+        """
+        first = fetch(1)
+        prefetch = max(1, prefetch)
+        limit = get_last_page(first)
+
+        pending = deque()
+        page = 2
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            try:
+                current = first
+                while True:
+                    has_next = _get_field(current, 'next')
+                    while has_next and len(pending) < prefetch and page <= limit:
+                        pending.append(executor.submit(fetch, page))
+                        page += 1
+                    yield from _get_field(current, 'results')
+                    if not has_next:
+                        return
+
+                    current = pending.popleft().result()
+                    if not pending and page > limit:
+                        # more pages than announced by the first page
+                        limit = page
+            finally:
+                for future in pending:
+                    future.cancel()
 
     def create_wallet(self, last_name: str, phone_number: str, gender: str, first_name: Optional[str] = None,
                       country: Optional[str] = 'CM', email: Optional[str] = None, nonce: Optional[str] = None,
-                      number: Optional[str] = None):
+                      number: Optional[str] = None,
+                      timeout: Optional[Timeout] = None, deadline: Optional[float] = None):
         """
         Create a wallet in MeSomb
 
@@ -480,6 +1326,8 @@ class WalletOperation(AOperation):
             email (str, optional): the email of the wallet owner
             nonce (str, optional): the nonce of the request (Default value = None)
             number (str, optional): the unique numeric wallet identifier, if not set we will generate one for you
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
             Wallet
@@ -502,11 +1350,13 @@ class WalletOperation(AOperation):
         if number:
             body['number'] = number
 
-        return Wallet(self.execute_request('POST', endpoint, datetime.now(), nonce or RandomGenerator.nonce(), body))
+        return self._request(Wallet, 'POST', endpoint, nonce or generate_nonce(), body,
+                             timeout=timeout, deadline=deadline)
 
     def update_wallet(self, identifier: int, last_name: str, phone_number: str, gender: str,
                       first_name: Optional[str] = None, country: Optional[str] = 'CM', email: Optional[str] = None,
-                      nonce: Optional[str] = None):
+                      nonce: Optional[str] = None,
+                      timeout: Optional[Timeout] = None, deadline: Optional[float] = None):
         """
         Create a wallet in MeSomb
 
@@ -519,6 +1369,8 @@ class WalletOperation(AOperation):
             country (str, optional): the country of the wallet owner (Default value = 'CM')
             email (str, optional): the email of the wallet owner
             nonce (str, optional): the nonce of the request (Default value = None)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
             Wallet
@@ -539,37 +1391,54 @@ class WalletOperation(AOperation):
         if email:
             body['email'] = email
 
-        return Wallet(self.execute_request('PUT', endpoint, datetime.now(), nonce or RandomGenerator.nonce(), body))
+        parser = self._on_wallet_change(Wallet, lambda wallet: self.wallet_cache.set((self.target, identifier), wallet),
+                                        [identifier])
+        return self._request(parser, 'PUT', endpoint, nonce or generate_nonce(), body,
+                             timeout=timeout, deadline=deadline)
 
-    def get_wallet(self, identifier: int):
+    def get_wallet(self, identifier: int, timeout: Optional[Timeout] = None, deadline: Optional[float] = None):
         """
         Get a wallet in MeSomb
 
+        With a `wallet_cache`, the wallet is read from the cache while it is fresh (except in raw response mode).
+
         Args:
             identifier (int): the identifier of the wallet
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
             Wallet
         """
         endpoint = f'wallet/wallets/{identifier}/'
 
-        return Wallet(self.execute_request('GET', endpoint, datetime.now()))
+        if self.wallet_cache is None or self.response_mode == 'raw':
+            return self._request(Wallet, 'GET', endpoint, timeout=timeout, deadline=deadline)
+
+        return self.wallet_cache.get_or_load(
+            (self.target, identifier),
+            lambda: self._request(Wallet, 'GET', endpoint, timeout=timeout, deadline=deadline),
+        )
 
-    def delete_wallet(self, identifier: int):
+    def delete_wallet(self, identifier: int, timeout: Optional[Timeout] = None, deadline: Optional[float] = None):
         """
         Delete a wallet in MeSomb
 
         Args:
             identifier (int): the identifier of the wallet
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
             None
         """
         endpoint = f'wallet/wallets/{identifier}/'
 
-        return self.execute_request('DELETE', endpoint, datetime.now())
+        parser = self._on_wallet_change(None, lambda _: self.wallet_cache.invalidate((self.target, identifier)))
+        return self._request(parser, 'DELETE', endpoint, timeout=timeout, deadline=deadline)
 
-    def add_money(self, wallet: int, amount: float, message: Optional[str] = None, external_id: Optional[str] = None) -> WalletTransaction:
+    def add_money(self, wallet: int, amount: float, message: Optional[str] = None, external_id: Optional[str] = None,
+                  timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> WalletTransaction:
         """
         Add money to a wallet
 
@@ -577,6 +1446,8 @@ class WalletOperation(AOperation):
             wallet: the identifier of the wallet
             amount: the amount to add to the wallet
             message: the message to add to the transaction (Default value = None)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
             Wallet
@@ -592,9 +1463,13 @@ class WalletOperation(AOperation):
         if external_id:
             data['trxID'] = external_id
 
-        return WalletTransaction(self.execute_request('POST', endpoint, datetime.now(), RandomGenerator.nonce(), data))
+        parser = self._on_wallet_change(WalletTransaction, lambda transaction: self._patch_balance(wallet, transaction),
+                                        [wallet])
+        return self._request(parser, 'POST', endpoint, generate_nonce(), data,
+                             timeout=timeout, deadline=deadline)
 
-    def remove_money(self, wallet: int, amount: float, force: Optional[bool] = False, message: Optional[str] = None, external_id: Optional[str] = None) -> WalletTransaction:
+    def remove_money(self, wallet: int, amount: float, force: Optional[bool] = False, message: Optional[str] = None, external_id: Optional[str] = None,
+                     timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> WalletTransaction:
         """
         Remove money from a wallet
 
@@ -603,6 +1478,8 @@ class WalletOperation(AOperation):
             amount: the amount to remove from the wallet
             force: to force the operation if balance is not enough (Default value = False)
             message: the message to add to the transaction (Default value = None)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
             Wallet
@@ -617,10 +1494,14 @@ class WalletOperation(AOperation):
         if external_id:
             data['trxID'] = external_id
 
-        return WalletTransaction(self.execute_request('POST', endpoint, datetime.now(), RandomGenerator.nonce(), data))
+        parser = self._on_wallet_change(WalletTransaction, lambda transaction: self._patch_balance(wallet, transaction),
+                                        [wallet])
+        return self._request(parser, 'POST', endpoint, generate_nonce(), data,
+                             timeout=timeout, deadline=deadline)
 
     def transfert_money(self, source: int, dest: int, amount: float,
-                        force: Optional[bool] = False, message: Optional[str] = None, external_id: Optional[str] = None) -> WalletTransaction:
+                        force: Optional[bool] = False, message: Optional[str] = None, external_id: Optional[str] = None,
+                        timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> WalletTransaction:
         """
         Transfer money from a wallet to another
 
@@ -629,6 +1510,8 @@ class WalletOperation(AOperation):
             dest: the identifier of the destination wallet
             amount: the amount to transfer
             force: to force the operation if balance is not enough (Default value = False)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
             Wallet
@@ -643,68 +1526,127 @@ class WalletOperation(AOperation):
         if external_id:
             data['trxID'] = external_id
 
-        return WalletTransaction(self.execute_request('POST', endpoint, datetime.now(), RandomGenerator.nonce(), data))
+        def on_transfer(transaction):
+            # the transaction is the debit of the source, the balance of the destination is unknown
+            if transaction.wallet == source:
+                self._patch_balance(source, transaction)
+            else:
+                self.wallet_cache.invalidate((self.target, source))
+            self.wallet_cache.invalidate((self.target, dest))
 
-    def get_wallets(self, page=1):
+        return self._request(self._on_wallet_change(WalletTransaction, on_transfer, [source, dest]), 'POST', endpoint,
+                             generate_nonce(), data, timeout=timeout, deadline=deadline)
+
+    def get_wallets(self, page=1, timeout: Optional[Timeout] = None, deadline: Optional[float] = None):
         """
         Get wallets paginated
 
         Args:
             page: the page number (Default value = 1)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
             PaginatedWallets
         """
         endpoint = f'wallet//wallets/?page={page}'
 
-        return PaginatedWallets(self.execute_request('GET', endpoint, datetime.now()))
+        return self._request(PaginatedWallets, 'GET', endpoint, timeout=timeout, deadline=deadline)
 
-    def get_transaction(self, identifier: int):
+    def iter_wallets(self, prefetch: int = 1, timeout: Optional[Timeout] = None,
+                     deadline: Optional[float] = None) -> Iterator[Wallet]:
+        """
+        Iterate over all the wallets, page after page
+
+        The next `prefetch` pages are fetched in the background while the current one is consumed. Once the number
+        of wallets is known from the first page, a larger `prefetch` fetches the remaining pages in parallel.
+
+        Args:
+            prefetch (int): maximum number of pages fetched ahead (Default value = 1)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of each page
+            deadline (float, optional): maximum time in seconds of each page, retries included
+
+        Returns:
+            Iterator[Wallet]
+        """
+        return self._iter_pages(lambda page: self.get_wallets(page, timeout=timeout, deadline=deadline), prefetch)
+
+    def get_transaction(self, identifier: int, timeout: Optional[Timeout] = None, deadline: Optional[float] = None):
         """
         Get a transaction in MeSomb
 
         Args:
             identifier (int): the identifier of the transaction
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
             Transaction
         """
         endpoint = f'wallet/transactions/{identifier}/'
 
-        return WalletTransaction(self.execute_request('GET', endpoint, datetime.now()))
+        return self._request(WalletTransaction, 'GET', endpoint, timeout=timeout, deadline=deadline)
 
-    def list_transactions(self, page: int = 1, wallet: Optional[int] = None):
+    def list_transactions(self, page: int = 1, wallet: Optional[int] = None, timeout: Optional[Timeout] = None,
+                          deadline: Optional[float] = None):
         """
         Listing transactions from MeSomb
 
         Args:
             page (int): the page number (Default value = 1)
             wallet (int, optional): the identifier of the wallet (Default value = None)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
-            List[WalletTransaction]
+            PaginatedWalletTransactions
         """
         endpoint = f'wallet/transactions/?page={page}'
 
         if wallet:
             endpoint += f'&wallet={wallet}'
 
-        return PaginatedWalletTransactions(self.execute_request('GET', endpoint, datetime.now()))
+        return self._request(PaginatedWalletTransactions, 'GET', endpoint, timeout=timeout, deadline=deadline)
+
+    def iter_transactions(self, wallet: Optional[int] = None, prefetch: int = 1, timeout: Optional[Timeout] = None,
+                          deadline: Optional[float] = None) -> Iterator[WalletTransaction]:
+        """
+        Iterate over all the transactions, page after page
+
+        The next `prefetch` pages are fetched in the background while the current one is consumed. Once the number
+        of transactions is known from the first page, a larger `prefetch` fetches the remaining pages in parallel.
+
+        Args:
+            wallet (int, optional): the identifier of the wallet (Default value = None)
+            prefetch (int): maximum number of pages fetched ahead (Default value = 1)
+            timeout (float or tuple, optional): connect and read timeouts in seconds of each page
+            deadline (float, optional): maximum time in seconds of each page, retries included
+
+        Returns:
+            Iterator[WalletTransaction]
+        """
+        return self._iter_pages(
+            lambda page: self.list_transactions(page, wallet, timeout=timeout, deadline=deadline), prefetch)
 
-    def get_transactions(self, ids, source='MESOMB') -> List[WalletTransaction]:
+    def get_transactions(self, ids, source='MESOMB', timeout: Optional[Timeout] = None,
+                         deadline: Optional[float] = None) -> List[WalletTransaction]:
         """
         Get transactions base on external in MeSomb's IDs
 
+        Long lists of ids are split in several requests sent concurrently, see `max_ids` and `max_url_length`.
+
         Args:
             ids: list of ids
             source: source of transactions ids MESOMB or EXTERNAL
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
-            List[WalletTransaction]
+            List[WalletTransaction]: the transactions in the order of `ids`, without duplicates
         """
-        endpoint = f"wallet/transactions/search/?{'&'.join([f'ids={id}' for id in ids])}&source={source}"
+        endpoint = f"wallet/transactions/search/?{{ids}}&source={source}"
 
-        return [WalletTransaction(t) for t in self.execute_request('GET', endpoint, datetime.now())]
+        return self._request_ids(WalletTransaction, endpoint, ids, True, timeout=timeout, deadline=deadline)
 
 
 class FundraisingOperation(AOperation):
@@ -718,13 +1660,15 @@ class FundraisingOperation(AOperation):
                           conversion: bool = False, anonymous: bool = False, accept_terms: bool = True,
                           location: Optional[Dict[str, str]] = None, contact: Optional[Dict[str, str]] = None,
                           full_name: Optional[Dict[str, str]] = None,
-                          trx_id: Optional[str] = None) -> ContributionResponse:
+                          trx_id: Optional[str] = None,
+                          timeout: Optional[Timeout] = None, deadline: Optional[float] = None) -> ContributionResponse:
         """
         Make a contribution to a fundraising campaign
 
         Args:
             amount: amount to contribute
-            service: payment service with the possible values MTN, ORANGE, AIRTEL
+            service: payment service with the possible values MTN, ORANGE, AIRTEL or auto to detect it from `payer`,
+                see :resolve_service:
             payer: account number to contribute
             nonce: unique string on each request
             country: 2 letters country code of the service, configured during your service registration in MeSomb
@@ -738,6 +1682,8 @@ class FundraisingOperation(AOperation):
             contact: a Map containing information about the customer: phone_number string, email: string
             full_name: a Map containing information about the customer: first_name string, last_name string
             trx_id: if you want to include your transaction ID in the request
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
             ContributionResponse
@@ -748,6 +1694,8 @@ class FundraisingOperation(AOperation):
             assert full_name, 'Full name is required'
             assert contact, 'Contact is required'
 
+        service, payer = self.resolve_service(service, payer, country)
+
         endpoint = 'fundraising/contribute/'
 
         body = {
@@ -774,39 +1722,49 @@ class FundraisingOperation(AOperation):
         if full_name:
             body['full_name'] = full_name
 
-        return ContributionResponse(
-            self.execute_request('POST', endpoint, datetime.now(), nonce or RandomGenerator.nonce(), body, mode))
+        return self._request(ContributionResponse, 'POST', endpoint, nonce or generate_nonce(), body, mode,
+                             timeout=timeout, deadline=deadline)
 
-    def get_contributions(self, ids, source='MESOMB') -> List[Contribution]:
+    def get_contributions(self, ids, source='MESOMB', timeout: Optional[Timeout] = None,
+                          deadline: Optional[float] = None) -> List[Contribution]:
         """
         Get contributions from MeSomb by IDs.
 
+        Long lists of ids are split in several requests sent concurrently, see `max_ids` and `max_url_length`.
+
         Args:
             source: source of the contributionID: MESOMB or EXTERNAL (Default value = 'MESOMB')
             ids: list of ids
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
-            List[Contribution]
+            List[Contribution]: the contributions in the order of `ids`, without duplicates
         """
         assert source in ['MESOMB', 'EXTERNAL'], 'Source must be MESOMB or EXTERNAL'
 
-        endpoint = f"fundraising/contributions/?ids={','.join(ids)}&source={source}"
+        endpoint = f"fundraising/contributions/?ids={{ids}}&source={source}"
 
-        return [Contribution(item) for item in self.execute_request('GET', endpoint, datetime.now())]
+        return self._request_ids(Contribution, endpoint, ids, timeout=timeout, deadline=deadline)
 
-    def check_contributions(self, ids, source='MESOMB') -> List[Contribution]:
+    def check_contributions(self, ids, source='MESOMB', timeout: Optional[Timeout] = None,
+                            deadline: Optional[float] = None) -> List[Contribution]:
         """
         Check contributions from MeSomb by IDs.
 
+        Long lists of ids are split in several requests sent concurrently, see `max_ids` and `max_url_length`.
+
         Args:
             source: source of the contributionID: MESOMB or EXTERNAL (Default value = 'MESOMB')
             ids: list of ids
+            timeout (float or tuple, optional): connect and read timeouts in seconds of this call
+            deadline (float, optional): maximum time in seconds of the whole call, retries included
 
         Returns:
-            List[Contribution]
+            List[Contribution]: the contributions in the order of `ids`, without duplicates
         """
 
         assert source in ['MESOMB', 'EXTERNAL'], 'Source must be MESOMB or EXTERNAL'
 
-        endpoint = f"fundraising/contributions/check/?ids={','.join(ids)}&source={source}"
-        return [Contribution(item) for item in self.execute_request('GET', endpoint, datetime.now())]
+        endpoint = f"fundraising/contributions/check/?ids={{ids}}&source={source}"
+        return self._request_ids(Contribution, endpoint, ids, timeout=timeout, deadline=deadline)
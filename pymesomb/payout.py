@@ -0,0 +1,316 @@
+import csv
+import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, as_completed, FIRST_COMPLETED
+from typing import Optional, Dict, Any, Iterable, Iterator, Tuple
+
+from pymesomb.exceptions import (ServiceNotFoundException, PermissionDeniedException,
+                                 InvalidClientRequestException)
+from pymesomb.nonce import generate_nonce
+from pymesomb.operations import PaymentOperation
+from pymesomb.ratelimit import RateLimiter
+from pymesomb.retry import NO_RETRY
+
+# the deposit is sent or was interrupted, MeSomb must be checked before sending it again
+IN_DOUBT = 'IN_DOUBT'
+# MeSomb refused the deposit, no money moved
+REJECTED = 'REJECTED'
+SUCCESS = 'SUCCESS'
+FAILED = 'FAILED'
+PENDING = 'PENDING'
+# the receiver repeats the transaction ID of a receiver of the same run, it is not sent
+DUPLICATED = 'DUPLICATED'
+
+# statuses which can not change anymore, a PENDING deposit is looked up again on the next run
+FINAL_STATUSES = (SUCCESS, FAILED, REJECTED)
+
+# columns of a payout file used as parameters of make_deposit
+DEPOSIT_FIELDS = ('amount', 'service', 'receiver', 'country', 'currency', 'customer', 'location', 'products')
+# columns of a CSV payout file written as JSON
+JSON_FIELDS = ('customer', 'location', 'products')
+
+# errors raised when MeSomb refuses the request before processing it
+REJECTION_ERRORS = (ServiceNotFoundException, PermissionDeniedException, InvalidClientRequestException)
+
+
+def read_payouts(path: str, format: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Read the receivers of a payout one by one from a CSV or NDJSON file
+
+    Args:
+      path: path of the file
+      format: 'csv' or 'ndjson', guessed from the extension of the file if not set (Default value = None)
+
+    Returns:
+      Iterator[Dict[str, Any]] yielding the parameters of the deposit of each line (amount, service, receiver and
+      optionally trx_id, country, currency, customer, location and products). In a CSV file, customer, location and
+      products are written as JSON.
+
+    """
+    if format is None:
+        format = 'csv' if path.lower().endswith('.csv') else 'ndjson'
+
+    with open(path, newline='', encoding='utf-8') as file:
+        if format == 'csv':
+            for row in csv.DictReader(file):
+                item = {key: value for key, value in row.items() if value not in (None, '')}
+                for key in JSON_FIELDS:
+                    if key in item:
+                        item[key] = json.loads(item[key])
+                yield item
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class PayoutJournal:
+    """
+    Local checkpoint of a payout stored in a SQLite database.
+
+    Each deposit is recorded by transaction ID as IN_DOUBT before being sent, then with its final status, along with
+    the identifier of the run which sent it.
+
+    Args:
+        path (str): path of the database
+    """
+
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS payouts (trx_id TEXT PRIMARY KEY, status TEXT NOT NULL, '
+                                'pk TEXT, detail TEXT, updated REAL NOT NULL, run TEXT)')
+        columns = [row[1] for row in self.connection.execute('PRAGMA table_info(payouts)')]
+        if 'run' not in columns:
+            # journal written by a version without runs
+            self.connection.execute('ALTER TABLE payouts ADD COLUMN run TEXT')
+        self.connection.commit()
+
+    def get_status(self, trx_id: str) -> Optional[str]:
+        """
+        Get the status recorded for a transaction
+
+        Args:
+            trx_id (str): the transaction ID
+
+        Returns:
+            Optional[str]: the status or None if the transaction is not in the journal
+        """
+        entry = self.get_entry(trx_id)
+        return entry[0] if entry else None
+
+    def get_entry(self, trx_id: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Get the status recorded for a transaction and the run which recorded it
+
+        Args:
+            trx_id (str): the transaction ID
+
+        Returns:
+            Optional[Tuple[str, Optional[str]]]: the status and run or None if the transaction is not in the journal
+        """
+        row = self.connection.execute('SELECT status, run FROM payouts WHERE trx_id = ?', (trx_id,)).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def record(self, trx_id: str, status: str, pk: Optional[str] = None, detail: Optional[str] = None,
+               run: Optional[str] = None):
+        """
+        Record the status of a transaction, written to the disk before returning
+
+        Args:
+            trx_id (str): the transaction ID
+            status (str): the status of the transaction
+            pk (str, optional): the MeSomb identifier of the transaction
+            detail (str, optional): a message explaining the status
+            run (str, optional): the identifier of the run recording the status
+        """
+        self.connection.execute('INSERT OR REPLACE INTO payouts (trx_id, status, pk, detail, updated, run) '
+                                'VALUES (?, ?, ?, ?, ?, ?)', (trx_id, status, pk, detail, time.time(), run))
+        self.connection.commit()
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Count the transactions of the journal by status
+
+        Returns:
+            Dict[str, int]
+        """
+        return dict(self.connection.execute('SELECT status, COUNT(*) FROM payouts GROUP BY status').fetchall())
+
+    def close(self):
+        """Close the database"""
+        self.connection.close()
+
+
+class PayoutEngine:
+    """
+    Send deposits to many receivers and resume safely after an interruption.
+
+    Receivers are read lazily and at most `concurrency` deposits are in flight, so memory does not depend on the size
+    of the payout. Every receiver needs a stable transaction ID, taken from its `trx_id` or built from `prefix` and its
+    position. The journal is written before and after each deposit: on a restart, transactions with a final status are
+    skipped and transactions left in doubt are looked up with :PaymentOperation.check_transactions: using their
+    transaction ID before being sent again, so nobody is paid twice. The service of the receivers with service='auto'
+    is detected from their number before they are journaled, unsupported numbers are REJECTED without being sent.
+
+    Deposits are sent once, without the `write_retry` of the operation: an attempt which timed out may have moved the
+    money even if a retry is refused, so any failure other than a refusal of the single attempt leaves the deposit
+    IN_DOUBT until the next run checks it in MeSomb.
+
+    Args:
+        operation (PaymentOperation): the operation used to send the deposits
+        journal (str): path of the journal of the payout
+        concurrency (int): maximum number of deposits sent at the same time (Default value = 10)
+        rate_limiter (RateLimiter, optional): limiter applied to the deposits of the payout
+        prefix (str, optional): prefix of the transaction ID of the receivers without `trx_id`
+    """
+
+    def __init__(self, operation: PaymentOperation, journal: str, concurrency: int = 10,
+                 rate_limiter: Optional[RateLimiter] = None, prefix: Optional[str] = None):
+        self.operation = operation
+        self.deposit_operation = operation.with_response_mode('model')
+        self.deposit_operation.write_retry = NO_RETRY
+        self.journal = PayoutJournal(journal)
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter
+        self.prefix = prefix
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the journal"""
+        self.journal.close()
+
+    def get_trx_id(self, index: int, item: Dict[str, Any]) -> str:
+        """
+        Get the transaction ID of a receiver
+
+        Args:
+            index (int): the position of the receiver in the payout
+            item (Dict[str, Any]): the parameters of the deposit
+
+        Returns:
+            str
+        """
+        if item.get('trx_id'):
+            return str(item['trx_id'])
+        if self.prefix is None:
+            raise ValueError(f'The receiver at position {index} has no trx_id and no prefix is set')
+        return f'{self.prefix}-{index}'
+
+    def resolve(self, trx_id: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Look up in MeSomb a transaction left in doubt
+
+        Args:
+            trx_id (str): the transaction ID
+
+        Returns:
+            Optional[Tuple[str, Optional[str]]]: the status and MeSomb identifier of the transaction, None if MeSomb
+                does not know it
+        """
+        for transaction in self.operation.check_transactions([trx_id], source='EXTERNAL'):
+            return transaction.status, transaction.pk
+        return None
+
+    def pay(self, trx_id: str, item: Dict[str, Any], in_doubt: bool):
+        """
+        Send the deposit of a receiver, after checking MeSomb if a previous attempt is in doubt
+
+        Args:
+            trx_id (str): the transaction ID
+            item (Dict[str, Any]): the parameters of the deposit
+            in_doubt (bool): True if a previous attempt may have reached MeSomb
+
+        Returns:
+            tuple: the status, the MeSomb identifier and the response of the deposit (None if found in MeSomb)
+        """
+        if in_doubt:
+            found = self.resolve(trx_id)
+            if found is not None:
+                return found[0], found[1], None
+
+        if self.rate_limiter:
+            self.rate_limiter.acquire(self.operation.target)
+
+        params = {key: item[key] for key in DEPOSIT_FIELDS if key in item}
+        params['amount'] = float(params['amount'])
+        response = self.deposit_operation.make_deposit(trx_id=trx_id, **params)
+        return response.transaction.status, response.transaction.pk, response
+
+    def run(self, items: Iterable[Dict[str, Any]]) -> Iterator[Tuple[str, str, Any]]:
+        """
+        Run the payout
+
+        Args:
+            items (Iterable[Dict[str, Any]]): the parameters of :PaymentOperation.make_deposit: for each receiver,
+                see :read_payouts: to read them from a file
+
+        Returns:
+            Iterator[Tuple[str, str, Any]]: the transaction ID, the status and the response or exception of each
+                deposit sent or resolved by this run, transactions already final in the journal are skipped. A
+                receiver repeating a transaction ID already journaled by the run is not sent and yielded as
+                DUPLICATED.
+        """
+        # the journal tells the receivers of this run apart, so only the deposits in flight are kept in memory
+        run = generate_nonce(20)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            pending = {}
+            for index, item in enumerate(items):
+                trx_id = self.get_trx_id(index, item)
+                status, last_run = self.journal.get_entry(trx_id) or (None, None)
+                if last_run == run:
+                    yield trx_id, DUPLICATED, InvalidClientRequestException(f'Duplicated transaction ID {trx_id}',
+                                                                            'duplicated-trx-id')
+                    continue
+                if status in FINAL_STATUSES:
+                    continue
+
+                if item.get('service') == 'auto':
+                    try:
+                        service, receiver = self.operation.resolve_service('auto', item.get('receiver', ''),
+                                                                           item.get('country', 'CM'))
+                    except InvalidClientRequestException as e:
+                        self.journal.record(trx_id, REJECTED, detail=str(e), run=run)
+                        yield trx_id, REJECTED, e
+                        continue
+                    item = dict(item, service=service, receiver=receiver)
+
+                self.journal.record(trx_id, IN_DOUBT, run=run)
+                pending[executor.submit(self.pay, trx_id, item, status is not None)] = trx_id
+                if len(pending) >= self.concurrency:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield self.complete(pending.pop(future), future, run)
+
+            for future in as_completed(pending):
+                yield self.complete(pending[future], future, run)
+
+    def complete(self, trx_id: str, future, run: Optional[str] = None) -> Tuple[str, str, Any]:
+        """
+        Record the result of a deposit in the journal
+
+        Args:
+            trx_id (str): the transaction ID
+            future: the future of :pay:
+            run (str, optional): the identifier of the run which sent the deposit
+
+        Returns:
+            tuple: the transaction ID, the status and the response or exception of the deposit
+        """
+        error = future.exception()
+        if error is None:
+            status, pk, response = future.result()
+            self.journal.record(trx_id, status, pk, run=run)
+            return trx_id, status, response
+
+        if isinstance(error, REJECTION_ERRORS):
+            self.journal.record(trx_id, REJECTED, detail=str(error), run=run)
+            return trx_id, REJECTED, error
+
+        # the deposit may have reached MeSomb, it stays in doubt until the next run
+        self.journal.record(trx_id, IN_DOUBT, detail=str(error), run=run)
+        return trx_id, IN_DOUBT, error
@@ -0,0 +1,157 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Optional, Dict, Tuple
+
+
+def _consume(state, now: float, rate: float, burst: float, tokens: float, max_wait: Optional[float]):
+    """Take tokens from a bucket, the balance can become negative to reserve the tokens of the coming seconds
+
+    Args:
+      state: the (tokens, updated) state of the bucket or None for a full bucket
+      now: the current time
+      rate: the number of tokens added per second
+      burst: the capacity of the bucket
+      tokens: the number of tokens to take
+      max_wait: maximum accepted wait in seconds, None to accept any wait
+
+    Returns:
+      tuple of the new state and the time to wait before using the tokens, None if it exceeds `max_wait`
+
+    """
+    if state is None:
+        available = burst
+    else:
+        available = min(burst, state[0] + (now - state[1]) * rate)
+
+    wait = max(0.0, (tokens - available) / rate)
+    if max_wait is not None and wait > max_wait:
+        return state, None
+
+    return (available - tokens, now), wait
+
+
+class RateLimiter:
+    """
+    Client-side token bucket limiting the requests sent for each key (application, fund or provider).
+
+    Each key has its own bucket refilled at `rate` tokens per second and holding at most `burst` tokens. A request
+    takes one token and waits when the bucket is empty. The limiter can be shared by several operations, threads and
+    asyncio tasks. With `path`, the buckets are stored in a local file locked on each access so that all the processes
+    of a host using the same file share the same limits (POSIX only).
+
+    Args:
+        rate (float): number of requests per second allowed for each key
+        burst (int, optional): maximum number of requests sent at once (Default value = rate)
+        limits (Dict[str, Tuple[float, int]], optional): (rate, burst) of specific keys
+        path (str, optional): file used to share the buckets between processes
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None, limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 path: Optional[str] = None):
+        assert rate > 0, 'Rate must be greater than 0'
+
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self.limits = limits or {}
+        self.path = path
+
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def get_limit(self, key: str) -> Tuple[float, int]:
+        """
+        Get the rate and the burst of a key
+
+        Args:
+            key (str): the key of the bucket
+
+        Returns:
+            tuple: the rate and the burst of the key
+        """
+        return self.limits.get(key, (self.rate, self.burst))
+
+    def reserve(self, key: str, tokens: int = 1, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve tokens in the bucket of a key without waiting
+
+        Args:
+            key (str): the key of the bucket
+            tokens (int): the number of tokens to take (Default value = 1)
+            max_wait (float, optional): maximum accepted wait in seconds, nothing is reserved above
+
+        Returns:
+            Optional[float]: the time to wait before sending the request, None if it would exceed `max_wait`
+        """
+        rate, burst = self.get_limit(key)
+        with self._lock:
+            if self.path:
+                return self._reserve_shared(key, rate, burst, tokens, max_wait)
+
+            self._buckets[key], wait = _consume(self._buckets.get(key), time.monotonic(), rate, burst, tokens,
+                                                max_wait)
+            return wait
+
+    def _reserve_shared(self, key, rate, burst, tokens, max_wait):
+        import fcntl
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            with os.fdopen(os.dup(fd), 'r+') as file:
+                content = file.read()
+                buckets = json.loads(content) if content else {}
+                state, wait = _consume(buckets.get(key), time.time(), rate, burst, tokens, max_wait)
+                if wait is not None:
+                    buckets[key] = state
+                    file.seek(0)
+                    file.truncate()
+                    json.dump(buckets, file)
+            return wait
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def acquire(self, key: str, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until tokens are available in the bucket of a key
+
+        Args:
+            key (str): the key of the bucket
+            tokens (int): the number of tokens to take (Default value = 1)
+            timeout (float, optional): maximum time to wait in seconds
+
+        Returns:
+            bool: True if the tokens are taken, False if they are not available before `timeout`
+        """
+        wait = self.reserve(key, tokens, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, key: str, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Wait without blocking the event loop until tokens are available in the bucket of a key
+
+        Args:
+            key (str): the key of the bucket
+            tokens (int): the number of tokens to take (Default value = 1)
+            timeout (float, optional): maximum time to wait in seconds
+
+        Returns:
+            bool: True if the tokens are taken, False if they are not available before `timeout`
+        """
+        if self.path:
+            # the shared file is locked and read from the disk in a thread, only the wait runs on the event loop
+            wait = await asyncio.get_event_loop().run_in_executor(None, self.reserve, key, tokens, timeout)
+        else:
+            wait = self.reserve(key, tokens, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
@@ -0,0 +1,247 @@
+import heapq
+import itertools
+import math
+import threading
+import time
+from concurrent import futures
+from concurrent.futures import Future
+from typing import Optional, Callable, Dict, Iterable, List
+
+from pymesomb.exceptions import DeadlineExceededException
+from pymesomb.models import Transaction
+from pymesomb.operations import PaymentOperation
+
+# statuses after which a transaction does not change anymore
+FINAL_STATUSES = ('SUCCESS', 'FAILED')
+
+# raised when a future cancelled by the caller is resolved (Python 3.8+)
+_InvalidStateError = getattr(futures, 'InvalidStateError', RuntimeError)
+
+
+class _Tracked:
+    """State of a transaction followed by the reconciler"""
+
+    def __init__(self, future: Future, expires_at: Optional[float]):
+        self.future = future
+        self.expires_at = expires_at
+        self.attempt = 0
+
+
+class TransactionReconciler:
+    """
+    Follow pending transactions until MeSomb reports them as SUCCESS or FAILED.
+
+    Transactions made in asynchronous mode are given with :track: which returns a future resolved with the final
+    :Transaction:. A single background thread checks all the transactions due at the same time with one call to
+    :PaymentOperation.check_transactions: (split in concurrent chunks by the operation), so many thousands of
+    transactions can be followed at once. Each transaction is checked often at first then less and less: the wait
+    after the check number `n` is `min_interval * factor ** n`, capped at `max_interval`.
+
+    Args:
+        operation (PaymentOperation): the operation used to check the transactions
+        source (str): source of the tracked ids: MESOMB or EXTERNAL (Default value = 'MESOMB')
+        min_interval (float): wait in seconds before the first check of a transaction (Default value = 1)
+        max_interval (float): maximum wait in seconds between two checks of a transaction (Default value = 60)
+        factor (float): growth of the wait after each check (Default value = 2)
+        max_batch (int): maximum number of transactions checked in one round (Default value = 1000)
+        timeout (float, optional): time in seconds after which a transaction still pending fails with
+            DeadlineExceededException (Default value = 3600)
+    """
+
+    def __init__(self, operation: PaymentOperation, source: str = 'MESOMB', min_interval: float = 1,
+                 max_interval: float = 60, factor: float = 2, max_batch: int = 1000,
+                 timeout: Optional[float] = 3600):
+        assert source in ['MESOMB', 'EXTERNAL'], 'Source must be MESOMB or EXTERNAL'
+
+        self.operation = operation
+        self.source = source
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self.max_batch = max_batch
+        self.timeout = timeout
+
+        self._tracked: Dict[str, _Tracked] = {}
+        self._schedule = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def __len__(self):
+        with self._condition:
+            return len(self._tracked)
+
+    def start(self):
+        """Start the background thread checking the transactions"""
+        with self._condition:
+            if self._thread is None:
+                self._stopped = False
+                self._thread = threading.Thread(target=self._run, name='mesomb-reconciler', daemon=True)
+                self._thread.start()
+
+    def stop(self, cancel: bool = True):
+        """
+        Stop the background thread
+
+        Args:
+            cancel (bool): cancel the futures of the transactions still pending (Default value = True)
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+        if cancel:
+            with self._condition:
+                tracked, self._tracked = self._tracked, {}
+                self._schedule = []
+            for state in tracked.values():
+                state.future.cancel()
+
+    def track(self, id: str, callback: Optional[Callable[[Future], None]] = None) -> Future:
+        """
+        Follow a transaction until it is final
+
+        Args:
+            id (str): the id of the transaction in MeSomb or your transaction ID, depending on `source`
+            callback (Callable[[Future], None], optional): function called with the future once it is done
+
+        Returns:
+            Future: resolved with the final :Transaction:, the same future is returned if the id is already tracked.
+                Cancel it to stop following the transaction.
+        """
+        id = str(id)
+        with self._condition:
+            state = self._tracked.get(id)
+            if state is None:
+                now = time.monotonic()
+                state = _Tracked(Future(), now + self.timeout if self.timeout is not None else None)
+                self._tracked[id] = state
+                self._push(now + self.min_interval, id)
+                self._condition.notify()
+        if callback is not None:
+            state.future.add_done_callback(callback)
+
+        return state.future
+
+    def track_many(self, ids: Iterable[str]) -> List[Future]:
+        """
+        Follow several transactions until they are final
+
+        Args:
+            ids (Iterable[str]): the ids of the transactions
+
+        Returns:
+            List[Future]: the future of each transaction
+        """
+        return [self.track(id) for id in ids]
+
+    def get_interval(self, attempt: int) -> float:
+        """
+        Compute the wait before the next check of a transaction
+
+        Args:
+            attempt (int): the number of checks already made for the transaction
+
+        Returns:
+            float: the wait in seconds
+        """
+        if self.factor > 1 and 0 < self.min_interval < self.max_interval:
+            # the wait stops growing at max_interval, so the power does not overflow after many checks
+            attempt = min(attempt, math.ceil(math.log(self.max_interval / self.min_interval, self.factor)))
+        return min(self.max_interval, self.min_interval * self.factor ** attempt)
+
+    def _push(self, at: float, id: str):
+        heapq.heappush(self._schedule, (at, next(self._counter), id))
+
+    def _next_batch(self) -> Optional[List[str]]:
+        """Wait until transactions are due and take them from the schedule, None when stopped"""
+        with self._condition:
+            while not self._stopped:
+                now = time.monotonic()
+                if self._schedule and self._schedule[0][0] <= now:
+                    ids = []
+                    while self._schedule and self._schedule[0][0] <= now and len(ids) < self.max_batch:
+                        _, _, id = heapq.heappop(self._schedule)
+                        if id in self._tracked:
+                            ids.append(id)
+                    if ids:
+                        return ids
+                    continue
+                self._condition.wait(self._schedule[0][0] - now if self._schedule else None)
+            return None
+
+    def _run(self):
+        while True:
+            ids = self._next_batch()
+            if ids is None:
+                return
+
+            try:
+                transactions = self.operation.check_transactions(ids, source=self.source)
+            except Exception:
+                # MeSomb could not be reached, the transactions are checked again later
+                transactions = []
+
+            try:
+                found = {}
+                for transaction in transactions:
+                    key = transaction.pk if self.source == 'MESOMB' else transaction.reference
+                    found[str(key)] = transaction
+
+                self._update(ids, found)
+            except Exception as e:
+                # the transactions can not be followed, their futures fail instead of waiting forever
+                self._fail(ids, e)
+
+    def _fail(self, ids: List[str], error: Exception):
+        """Stop following transactions and fail their futures with `error`"""
+        with self._condition:
+            states = [self._tracked.pop(id) for id in ids if id in self._tracked]
+        for state in states:
+            try:
+                state.future.set_exception(error)
+            except _InvalidStateError:
+                pass
+
+    def _update(self, ids: List[str], found: Dict[str, Transaction]):
+        """Resolve the transactions which are final and schedule the next check of the others"""
+        done = []
+        now = time.monotonic()
+        with self._condition:
+            for id in ids:
+                state = self._tracked.get(id)
+                if state is None:
+                    continue
+                if state.future.cancelled():
+                    del self._tracked[id]
+                    continue
+                transaction = found.get(id)
+                if transaction is not None and transaction.status in FINAL_STATUSES:
+                    done.append((self._tracked.pop(id), transaction))
+                elif state.expires_at is not None and now >= state.expires_at:
+                    error = DeadlineExceededException(f'The transaction {id} is still pending', None)
+                    done.append((self._tracked.pop(id), error))
+                else:
+                    state.attempt += 1
+                    self._push(now + self.get_interval(state.attempt), id)
+
+        # callbacks run outside of the lock so they can track other transactions
+        for state, result in done:
+            try:
+                if isinstance(result, Exception):
+                    state.future.set_exception(result)
+                else:
+                    state.future.set_result(result)
+            except _InvalidStateError:
+                pass
@@ -0,0 +1,140 @@
+"""
+Types of the responses of MeSomb as returned in raw response mode, see `response_mode` of the operations.
+
+They describe the decoded JSON for type checkers, the responses are plain dicts at runtime.
+"""
+from typing import Optional, List, Any, Dict
+
+try:
+    from typing import TypedDict
+except ImportError:  # pragma: no cover
+    # Python < 3.8, the annotations are kept for documentation only
+    TypedDict = dict
+
+
+class LocationDict(TypedDict):
+    town: str
+    region: Optional[str]
+    country: Optional[str]
+
+
+class CustomerDict(TypedDict):
+    email: Optional[str]
+    phone: Optional[str]
+    town: Optional[str]
+    region: Optional[str]
+    country: Optional[str]
+    first_name: Optional[str]
+    last_name: str
+    address: Optional[str]
+
+
+class ProductDict(TypedDict):
+    id: str
+    name: str
+    category: Optional[str]
+    quantity: Optional[int]
+    amount: Optional[float]
+
+
+class ATransactionDict(TypedDict):
+    pk: str
+    status: str
+    type: str
+    amount: float
+    fees: Optional[float]
+    b_party: str
+    message: Optional[str]
+    service: str
+    reference: Optional[str]
+    ts: str
+    country: str
+    currency: str
+    fin_trx_id: Optional[str]
+    trxamount: Optional[float]
+    location: Optional[LocationDict]
+
+
+class TransactionDict(ATransactionDict):
+    customer: Optional[CustomerDict]
+    products: Optional[List[ProductDict]]
+
+
+class TransactionResponseDict(TypedDict):
+    success: bool
+    message: Optional[str]
+    redirect: Optional[str]
+    transaction: TransactionDict
+    reference: Optional[str]
+    status: str
+
+
+class ApplicationBalanceDict(TypedDict):
+    country: str
+    currency: str
+    provider: str
+    value: float
+    service_name: str
+
+
+class ApplicationDict(TypedDict):
+    key: str
+    logo: Optional[str]
+    balances: List[ApplicationBalanceDict]
+    countries: List[str]
+    description: Optional[str]
+    name: str
+    security: Optional[Dict[str, Any]]
+    url: Optional[str]
+
+
+class WalletTransactionDict(TypedDict):
+    id: int
+    status: str
+    type: str
+    amount: float
+    direction: int
+    wallet: int
+    balance_after: Optional[float]
+    date: str
+    country: str
+    fin_trx_id: str
+
+
+class WalletDict(TypedDict):
+    id: int
+    number: str
+    country: str
+    status: str
+    last_activity: Optional[str]
+    balance: float
+    first_name: Optional[str]
+    last_name: str
+    email: Optional[str]
+    phone_number: str
+    gender: str
+
+
+class PaginatedWalletsDict(TypedDict):
+    count: int
+    next: Optional[str]
+    previous: Optional[str]
+    results: List[WalletDict]
+
+
+class PaginatedWalletTransactionsDict(TypedDict):
+    count: int
+    next: Optional[str]
+    previous: Optional[str]
+    results: List[WalletTransactionDict]
+
+
+class ContributionDict(ATransactionDict):
+    contributor: Optional[CustomerDict]
+
+
+class ContributionResponseDict(TypedDict):
+    success: bool
+    message: Optional[str]
+    contribution: ContributionDict
+    status: str
@@ -0,0 +1,115 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Iterable
+
+
+class RetryPolicy:
+    """
+    Describe when and how long to wait before sending again a request which failed.
+
+    A request is retried when the connection to MeSomb fails or when MeSomb answers with one of the `statuses`. The
+    wait before the attempt `n` (starting at 0) grows exponentially as `backoff_factor * 2 ** n`, capped at
+    `max_backoff`. With `jitter` the wait is drawn uniformly between 0 and this value so that many clients failing at
+    the same time do not come back together. A `Retry-After` header sent by MeSomb is respected when it asks to wait
+    longer.
+
+    Retries sign the request again with the same nonce and the same `X-MeSomb-TrxID` so MeSomb can detect duplicates.
+
+    Args:
+        total (int): maximum number of retries after the first attempt (Default value = 3)
+        backoff_factor (float): base wait in seconds (Default value = 0.5)
+        max_backoff (float): maximum wait in seconds between two attempts (Default value = 30)
+        jitter (bool): randomize the wait (Default value = True)
+        statuses (Iterable[int]): HTTP statuses to retry (Default value = (429, 502, 503, 504))
+        respect_retry_after (bool): wait as long as asked in the `Retry-After` header (Default value = True)
+        max_retry_after (float): maximum wait in seconds accepted from `Retry-After` (Default value = 60)
+    """
+
+    def __init__(self, total: int = 3, backoff_factor: float = 0.5, max_backoff: float = 30, jitter: bool = True,
+                 statuses: Iterable[int] = (429, 502, 503, 504), respect_retry_after: bool = True,
+                 max_retry_after: float = 60):
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def can_retry(self, attempt: int) -> bool:
+        """
+        Check if another attempt can be made after the attempt number `attempt` (starting at 0) failed
+
+        Args:
+            attempt (int): the number of the attempt which failed
+
+        Returns:
+            bool
+        """
+        return attempt < self.total
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """
+        Check if a response with this status should be retried
+
+        Args:
+            status_code (int): the HTTP status of the response
+
+        Returns:
+            bool
+        """
+        return status_code in self.statuses
+
+    def get_backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Compute the time to wait before the next attempt
+
+        Args:
+            attempt (int): the number of the attempt which failed (starting at 0)
+            retry_after (str, optional): the value of the `Retry-After` header of the response
+
+        Returns:
+            float: the time to wait in seconds
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+
+        if retry_after and self.respect_retry_after:
+            backoff = max(backoff, min(self.max_retry_after, parse_retry_after(retry_after)))
+
+        return backoff
+
+
+def parse_retry_after(value: str) -> float:
+    """
+    Parse the value of a `Retry-After` header given in seconds or as a HTTP date
+
+    Args:
+        value (str): the value of the header
+
+    Returns:
+        float: the time to wait in seconds, 0 if the value is invalid
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+# read-only requests can be sent again without risk
+READ_RETRY = RetryPolicy(total=4, backoff_factor=0.5, statuses=(429, 500, 502, 503, 504))
+
+# requests moving money are retried less, MeSomb deduplicates them with the nonce and the transaction ID
+WRITE_RETRY = RetryPolicy(total=2, backoff_factor=1, statuses=(429, 502, 503, 504))
+
+NO_RETRY = RetryPolicy(total=0)
@@ -1,6 +1,7 @@
 import hashlib
 import hmac
 import json
+from functools import lru_cache
 from urllib.parse import quote, urlparse, quote_plus
 
 from pymesomb import mesomb
@@ -21,7 +22,8 @@ class Signature:
           credentials: dict containing key => value for the credential provided by MeSOmb.
                 {'access' => access_key, 'secret' => secret_key}
           headers: Extra HTTP header to use in the signature (Default value = None)
-          body: The dict containing the body you send in your request body (Default value = None)
+          body: The dict containing the body you send in your request body or its already serialized bytes
+                (Default value = None)
 
         Returns:
           Authorization to put in the header
@@ -45,9 +47,10 @@ class Signature:
 
         if body is None:
             body = {}
-        request_params = json.dumps(body, separators=(',', ':'))
+        if not isinstance(body, bytes):
+            body = json.dumps(body, separators=(',', ':')).encode('utf-8')
 
-        payload_hash = hashlib.sha1(request_params.encode('utf-8')).hexdigest()
+        payload_hash = hashlib.sha1(body).hexdigest()
 
         signed_headers = ';'.join(sorted(headers))
 
@@ -61,3 +64,134 @@ class Signature:
         authorization_header = f"{algorithm} Credential={credentials['access_key']}/{scope}, SignedHeaders={signed_headers}, Signature={signature}"
 
         return authorization_header
+
+
+_EMPTY_BODY_HASH = hashlib.sha1(b'{}').hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _canonical_url(url):
+    """Split an url in the host, the quoted path and the canonical query used in the signature"""
+    parse = urlparse(url)
+    canonical_query = parse.query
+    if len(canonical_query) > 0:
+        pairs = []
+        for c in canonical_query.split('&'):
+            parts = c.split('=')
+            pairs.append(f'{quote_plus(parts[0])}={quote_plus(parts[1])}')
+        canonical_query = '&'.join(pairs)
+
+    return f'{parse.scheme}://{parse.netloc}', quote(parse.path), canonical_query
+
+
+class Signer:
+    """
+    Compute the signature of MeSomb requests for one set of credentials and one service.
+
+    It produces the same Authorization as :Signature.sign_request: but keeps between requests everything which does
+    not depend on the request: the HMAC already keyed with the secret key (copied for each request), the scope of the
+    current day and the sorted layout of the signed headers.
+
+    Args:
+        service: service to use can be payment, wallet ... (the list is provide by MeSomb)
+        access_key: the access key provided by MeSomb
+        secret_key: the secret key provided by MeSomb
+    """
+
+    def __init__(self, service, access_key, secret_key):
+        self.service = service
+        self.access_key = access_key
+        self._hmac = hmac.new(secret_key.encode(), digestmod=hashlib.sha1)
+        self._scope = (None, None)
+        self._layouts = {}
+
+    def get_scope(self, date):
+        """Scope of the signature for the day of `date`, computed once per day
+
+        Args:
+          date: Datetime of the request
+
+        Returns:
+          the scope of the signature
+
+        """
+        day = date.toordinal()
+        cached_day, scope = self._scope
+        if cached_day != day:
+            scope = f"{date.strftime('%Y%m%d')}/{self.service}/mesomb_request"
+            self._scope = (day, scope)
+        return scope
+
+    def get_layout(self, headers, host):
+        """Template of the canonical headers and signed headers for requests carrying the extra `headers` to `host`
+
+        The value of the extra headers and the host are written in the template, only the date and the nonce are left
+        to fill for each request.
+
+        Args:
+          headers: Extra HTTP header to use in the signature
+          host: the scheme and the host of the request
+
+        Returns:
+          tuple of the template of the canonical headers and the signed headers
+
+        """
+        key = (tuple(headers.items()) if headers else (), host)
+        layout = self._layouts.get(key)
+        if layout is None:
+            values = {name: value.strip().replace('{', '{{').replace('}', '}}') for name, value in key[0]}
+            values['host'] = host.replace('{', '{{').replace('}', '}}')
+            values['x-mesomb-date'] = '{0}'
+            values['x-mesomb-nonce'] = '{1}'
+            template = '\n'.join([f"{name.lower().replace('{', '{{').replace('}', '}}')}:{values[name]}"
+                                  for name in sorted(values)])
+            layout = (template, ';'.join(sorted(values)))
+            if len(self._layouts) >= 256:
+                self._layouts.clear()
+            self._layouts[key] = layout
+        return layout
+
+    def sign(self, method, url, date, nonce, headers=None, body=None, timestamp=None):
+        """Method to use to compute signature used in MeSomb request
+
+        Args:
+          method: HTTP method (GET, POST, PUT, PATCH, DELETE...)
+          url: the full url of the request with query element
+          date: Datetime of the request
+          nonce: Unique string generated for each request sent to MeSomb
+          headers: Extra HTTP header to use in the signature (Default value = None)
+          body: The serialized body of the request, a dict is serialized as in :Signature.sign_request:
+                (Default value = None)
+          timestamp: The timestamp of `date` as sent in the x-mesomb-date header, computed if not given
+                (Default value = None)
+
+        Returns:
+          Authorization to put in the header
+
+        """
+        algorithm = mesomb.algorithm
+        host, path, canonical_query = _canonical_url(url)
+        if timestamp is None:
+            timestamp = str(int(date.timestamp()))
+
+        template, signed_headers = self.get_layout(headers, host)
+        canonical_headers = template.format(timestamp, nonce.strip())
+
+        if body is None:
+            payload_hash = _EMPTY_BODY_HASH
+        else:
+            if not isinstance(body, bytes):
+                body = json.dumps(body, separators=(',', ':')).encode('utf-8')
+            payload_hash = hashlib.sha1(body).hexdigest()
+
+        canonical_request = '\n'.join([method, path, canonical_query, canonical_headers, signed_headers, payload_hash])
+        scope = self.get_scope(date)
+        request_hash = hashlib.sha1(canonical_request.encode('utf-8')).hexdigest()
+        string_to_sign = f"{algorithm}\n{timestamp}\n{scope}\n{request_hash}"
+
+        mac = self._hmac.copy()
+        mac.update(string_to_sign.encode())
+        signature = mac.hexdigest()
+
+        return f"{algorithm} Credential={self.access_key}/{scope}, SignedHeaders={signed_headers}, " \
+               f"Signature={signature}"
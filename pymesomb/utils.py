@@ -1,42 +1,274 @@
-import random
-import re
+import json
 import string
+from typing import Optional, Dict, Iterable, List, Sequence, Tuple
+
+from pymesomb import mesomb
+from pymesomb.nonce import generate_nonce
 
 
 class RandomGenerator:
     """ """
     @staticmethod
     def nonce(length=40):
-        """
+        """Generate a nonce with the provider configured in `mesomb.nonce_provider`, see `pymesomb.nonce`
 
         Args:
           length:  (Default value = 40)
 
         Returns:
+          str
 
         """
-        letters = string.ascii_letters + string.digits
-        return ''.join(random.choice(letters) for i in range(length))
+        return generate_nonce(length)
+
+
+_SEPARATORS = str.maketrans('', '', ' -.()')
+
+
+def _strip_msisdn(phone: str) -> Optional[Tuple[bool, str]]:
+    """Remove the separators and the international prefix of a phone number, None if it is not a number"""
+    number = str(phone).translate(_SEPARATORS)
+    international = number[:1] == '+' or number[:2] == '00'
+    if international:
+        number = number[1:] if number[0] == '+' else number[2:]
+    # only ASCII digits are left
+    if not number or number.strip(string.digits):
+        return None
+    return international, number
+
+
+class OperatorPrefixes:
+    """
+    Prefixes of the phone numbers of the operators of a country, indexed to detect the operator of a number with a
+    few dictionary lookups.
+
+    A number matches a prefix when it starts with it, with or without the calling code of the country. When numbers
+    match the prefixes of several operators, the first operator listed wins.
+
+    Args:
+        code (str): the calling code of the country, optional in front of the numbers
+        operators (Sequence[Tuple[str, Sequence[str]]]): the operators with their prefixes, in order of precedence
+        national (Sequence[Tuple[str, Sequence[str]]]): operators with prefixes never preceded by the calling code,
+            checked after `operators` (Default value = ())
+        length (int, optional): number of digits of the numbers without the calling code, used by :normalize: to
+            remove a calling code written without + or 00
+    """
+
+    def __init__(self, code: str, operators: Sequence[Tuple[str, Sequence[str]]],
+                 national: Sequence[Tuple[str, Sequence[str]]] = (), length: Optional[int] = None):
+        self.code = code
+        self.length = length
+        self.operators = list(operators)
+        self.national = list(national)
+
+        self._entries: Dict[str, Tuple[int, str]] = {}
+        tables = [(operator, prefixes, True) for operator, prefixes in self.operators]
+        tables += [(operator, prefixes, False) for operator, prefixes in self.national]
+        for precedence, (operator, prefixes, with_code) in enumerate(tables):
+            for prefix in prefixes:
+                for key in (prefix, code + prefix) if with_code else (prefix,):
+                    self._entries.setdefault(key, (precedence, operator))
+        self._lengths = sorted({len(key) for key in self._entries})
+        # the operator of a number only depends on its first `size` characters
+        self.size = self._lengths[-1] if self._lengths else 0
+        # beginnings of numbers which do not decide the operator yet
+        self._partial = {key[:length] for key in self._entries for length in range(len(key))}
+
+    def normalize(self, phone: str) -> Optional[str]:
+        """
+        Normalize a phone number to its national form
+
+        Spaces, dashes, dots and parentheses are removed, as well as the calling code when the number starts with +
+        or 00, or when it is followed by `length` digits.
+
+        Args:
+            phone (str): the phone number as written by the customer
+
+        Returns:
+            Optional[str]: the digits of the number without the calling code, None if it is not a number of the
+                country
+        """
+        number = _strip_msisdn(phone)
+        if number is None:
+            return None
+        international, number = number
+        if international:
+            return number[len(self.code):] or None if number.startswith(self.code) else None
+        if self.length and len(number) == len(self.code) + self.length and number.startswith(self.code):
+            return number[len(self.code):]
+        return number
+
+    def match(self, phone: str) -> Optional[str]:
+        """
+        Detect the operator of a phone number
+
+        Args:
+            phone (str): the phone number, with or without the calling code
+
+        Returns:
+            Optional[str]: the operator, None if no prefix matches
+        """
+        found = None
+        for length in self._lengths:
+            if length > len(phone):
+                break
+            entry = self._entries.get(phone[:length])
+            if entry is not None and (found is None or entry < found):
+                found = entry
+        return found[1] if found else None
+
+    def match_many(self, numbers: Iterable[str]) -> List[Optional[str]]:
+        """
+        Detect the operators of many phone numbers
+
+        The operators are remembered by beginning of number: first the beginnings as long as the calling code, most
+        national numbers being decided there, then the first `size` characters.
+
+        Args:
+            numbers (Iterable[str]): the phone numbers
+
+        Returns:
+            List[Optional[str]]: the operator of each number
+        """
+        size = self.size
+        short = min(len(self.code), size) or size
+        partial = self._partial
+        match = self.match
+        short_heads, heads = {}, {}
+        missing, undecided = object(), object()
+        operators = []
+        append = operators.append
+        for phone in numbers:
+            head = phone[:short]
+            operator = short_heads.get(head, missing)
+            if operator is missing:
+                operator = short_heads[head] = match(head) if len(head) < short or head not in partial else undecided
+            if operator is undecided:
+                head = phone[:size]
+                operator = heads.get(head, missing)
+                if operator is missing:
+                    operator = heads[head] = match(head)
+            append(operator)
+        return operators
+
+
+OPERATOR_PREFIXES: Dict[str, OperatorPrefixes] = {
+    'CM': OperatorPrefixes('237', [
+        ('MTN', ('67', '650', '651', '652', '653', '654', '680', '681', '682', '683')),
+        ('ORANGE', ('69', '655', '656', '657', '658', '659')),
+        ('NEXTTEL', ('66',)),
+        ('YOOMEE', ('242',)),
+        ('CAMTEL', ('233', '222', '243', '62')),
+    ], national=[('MESOMB', ('7',))], length=9),
+}
+
+
+def register_operator_prefixes(country: str, prefixes: OperatorPrefixes):
+    """Set the prefixes used to detect the operators of a country
+
+    Args:
+      country: 2 letters country code
+      prefixes: the prefixes of the operators of the country
+
+    """
+    OPERATOR_PREFIXES[country] = prefixes
 
 
 def detect_operator(phone, country='CM'):
-    """Detect the operator of a phone number in a country (only cameroon is supported for now)
+    """Detect the operator of a phone number in a country
+
+    Args:
+      phone: the phone number, with or without the calling code of the country
+      country: 2 letters country code, see `OPERATOR_PREFIXES` (Default value = 'CM')
+
+    Returns:
+      Optional[str]: the operator, None if it is unknown or the country has no prefixes
+
+    """
+    prefixes = OPERATOR_PREFIXES.get(country)
+    return prefixes.match(phone) if prefixes else None
+
+
+def normalize_msisdn(phone, country='CM'):
+    """Normalize a phone number of a country to the national form
+
+    Args:
+      phone: the phone number, with or without the calling code, spaces, dashes, dots and parentheses
+      country: 2 letters country code, see `OPERATOR_PREFIXES` (Default value = 'CM')
+
+    Returns:
+      Optional[str]: the digits of the number without the calling code, None if it is not a number of the country.
+      Only the separators and the + or 00 are removed for a country without prefixes.
+
+    """
+    prefixes = OPERATOR_PREFIXES.get(country)
+    if prefixes:
+        return prefixes.normalize(phone)
+    number = _strip_msisdn(phone)
+    return number[1] if number else None
+
+
+def detect_operators(numbers, country='CM'):
+    """Detect the operators of many phone numbers of a country
+
+    Numbers starting the same way are looked up once, which makes it about 4 times faster than calling
+    `detect_operator` on each number (see benchmarks/bench_detect_operator.py).
+
+    Args:
+      numbers: iterable of phone numbers or NumPy array of strings
+      country: 2 letters country code (Default value = 'CM')
+
+    Returns:
+      list: the operator of each number (None when it is unknown), a NumPy array of objects for a NumPy array
+
+    """
+    prefixes = OPERATOR_PREFIXES.get(country)
+
+    if hasattr(numbers, 'dtype') and hasattr(numbers, 'astype'):
+        import numpy
+
+        numbers = numpy.asarray(numbers)
+        if prefixes is None or not numbers.size:
+            return numpy.full(numbers.shape, None, dtype=object)
+        found = numpy.empty(numbers.size, dtype=object)
+        found[:] = prefixes.match_many(numbers.astype(str).ravel().tolist())
+        return found.reshape(numbers.shape)
+
+    if prefixes is None:
+        return [None for _ in numbers]
+    return prefixes.match_many(numbers)
+
+
+def _json_dumps(data) -> bytes:
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _orjson_dumps(data) -> bytes:
+    import orjson
+
+    return orjson.dumps(data)
+
+
+JSON_ENCODERS = {
+    'json': _json_dumps,
+    'orjson': _orjson_dumps,
+}
+
+
+def encode_json(data) -> bytes:
+    """Serialize data to compact JSON bytes with the encoder configured in `mesomb.json_encoder`
+
+    The standard library encoder is used by default. Set `mesomb.json_encoder` to 'orjson' to use orjson when it is
+    installed (it writes non-ASCII characters as UTF-8 instead of escaping them) or to any callable returning bytes.
 
     Args:
-      phone: 
-      country:  (Default value = 'CM')
+      data: the data to serialize
 
     Returns:
+      bytes
 
     """
-    OPERATOR_REGEX = {
-        'MTN': r'^(237)?(67|65[0-4]|68[0-3])',
-        'ORANGE': r'^(237)?(69|65[5-9])',
-        'NEXTTEL': r'^(237)?(66)',
-        'YOOMEE': r'^(237)?(242)',
-        'CAMTEL': r'^(237)?(233|222|243|62)',
-        'MESOMB': r'^7',
-    }
-    for operator, regex in OPERATOR_REGEX.items():
-        if re.match(regex, phone):
-            return operator
+    encoder = mesomb.json_encoder
+    if not callable(encoder):
+        encoder = JSON_ENCODERS[encoder]
+    return encoder(data)
@@ -20,6 +20,11 @@ setup(
     url='https://github.com/hachther/mesomb-python-client.git',
     download_url='https://pypi.org/project/pymesomb/',
     install_requires=['requests'],
+    extras_require={
+        'async': ['httpx'],
+        'parquet': ['pyarrow'],
+        'numpy': ['numpy'],
+    },
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',
@@ -0,0 +1,35 @@
+import json
+
+import requests
+
+APPLICATION = {
+    'key': '2bb525516ff374bb52545bf22ae4da7d655ba9fd', 'logo': None, 'balances': [], 'countries': ['CM'],
+    'description': None, 'is_live': False, 'name': 'Test', 'security': {}, 'status': 'ACTIVE', 'url': None,
+}
+
+TRANSACTION = {
+    'pk': 'a4bd7d2b-e7ac-40ce-b1e1-9b1b9e5e1a1c', 'status': 'SUCCESS', 'type': 'COLLECT', 'amount': 98, 'fees': 2,
+    'b_party': '237670000000', 'message': None, 'service': 'MTN', 'reference': '1', 'ts': '2025-02-10T10:08:31Z',
+    'country': 'CM', 'currency': 'XAF', 'fin_trx_id': 'MTN1', 'trxamount': 100, 'location': None, 'customer': None,
+    'products': [],
+}
+
+# response of MeSomb to a collect or a deposit
+TRANSACTION_RESPONSE = {
+    'success': True, 'message': 'Success', 'redirect': None, 'reference': '1', 'status': 'SUCCESS',
+    'transaction': TRANSACTION,
+}
+
+
+def make_transaction_response(reference, **fields):
+    """Response of MeSomb to a collect or a deposit with the transaction ID `reference`"""
+    return dict(TRANSACTION_RESPONSE, reference=reference, transaction=dict(TRANSACTION, reference=reference, **fields))
+
+
+def make_response(status_code=200, content=b'{}', headers=None):
+    """Response of MeSomb with a raw `content` or data sent as JSON"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content if isinstance(content, bytes) else json.dumps(content).encode()
+    response.headers.update(headers or {})
+    return response
@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+
+import httpx
+
+from pymesomb import mesomb
+from pymesomb.async_operations import AsyncPaymentOperation, AsyncWalletOperation
+from pymesomb.exceptions import InvalidClientRequestException
+from pymesomb.models import Application, Transaction, TransactionResponse
+from tests.helpers import TRANSACTION, TRANSACTION_RESPONSE
+
+
+class AsyncOperationTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.application_key = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+        self.requests = []
+
+    def handler(self, request: httpx.Request):
+        self.requests.append(request)
+        if request.url.path.endswith('/payment/collect/'):
+            return httpx.Response(200, json=TRANSACTION_RESPONSE)
+        if request.url.path.endswith('/payment/status/'):
+            return httpx.Response(200, json={'key': self.application_key, 'name': 'Test', 'countries': ['CM'],
+                                             'balances': [{'country': 'CM', 'provider': 'MTN', 'value': 10}]})
+        if request.url.path.endswith('/payment/transactions/check/'):
+            return httpx.Response(200, json=[TRANSACTION])
+        return httpx.Response(400, json={'detail': 'Invalid request', 'code': 'invalid'})
+
+    def operation(self, klass=AsyncPaymentOperation):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return klass(self.application_key, self.access_key, self.secret_key, client=client)
+
+    def test_make_collect(self):
+        async def run():
+            async with self.operation() as operation:
+                return await operation.make_collect(amount=100, service='MTN', payer='670000000', trx_id='1')
+
+        response = asyncio.run(run())
+        self.assertIsInstance(response, TransactionResponse)
+        self.assertTrue(response.is_transaction_success())
+        request = self.requests[0]
+        self.assertEqual(request.headers['X-MeSomb-TrxID'], '1')
+        self.assertEqual(request.headers['X-MeSomb-Application'], self.application_key)
+        self.assertTrue(request.headers['Authorization'].startswith('HMAC-SHA1 Credential='))
+
+    def test_concurrent_requests(self):
+        async def run():
+            operation = self.operation()
+            return await asyncio.gather(operation.get_status(), operation.check_transactions(['1']))
+
+        application, transactions = asyncio.run(run())
+        self.assertIsInstance(application, Application)
+        self.assertEqual(application.get_balance(), 10)
+        self.assertIsInstance(transactions[0], Transaction)
+
+    def test_client_error(self):
+        async def run():
+            return await self.operation(AsyncWalletOperation).get_wallet(1)
+
+        with self.assertRaises(InvalidClientRequestException):
+            asyncio.run(run())
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+import httpx
+import requests
+
+from pymesomb import mesomb
+from pymesomb.async_operations import AsyncPaymentOperation
+from pymesomb.exceptions import InvalidClientRequestException
+from pymesomb.operations import PaymentOperation, FundraisingOperation
+from tests.helpers import TRANSACTION_RESPONSE
+
+
+CONTRIBUTION = {
+    'success': True, 'message': 'Success', 'status': 'SUCCESS',
+    'contribution': {
+        'pk': 'a4bd7d2b-e7ac-40ce-b1e1-9b1b9e5e1a1c', 'status': 'SUCCESS', 'type': 'COLLECT', 'amount': 100,
+        'fees': 0, 'b_party': '237690000000', 'message': None, 'service': 'ORANGE', 'reference': '1',
+        'ts': '2025-02-10T10:08:31Z', 'country': 'CM', 'currency': 'XAF', 'fin_trx_id': 'OM1', 'trxamount': 100,
+        'location': None, 'contributor': None,
+    },
+}
+
+
+class AutoServiceTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.application_key = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+        self.bodies = []
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        self.bodies.append(json.loads(data))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(CONTRIBUTION if 'contribute' in url else TRANSACTION_RESPONSE).encode()
+        return response
+
+    def test_resolve_service(self):
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key)
+
+        self.assertEqual(operation.resolve_service('auto', '+237 677 55 92 30'), ('MTN', '677559230'))
+        self.assertEqual(operation.resolve_service('auto', '00237 655 00 00 00'), ('ORANGE', '655000000'))
+        self.assertEqual(operation.resolve_service('auto', '660000000'), ('NEXTTEL', '660000000'))
+        self.assertEqual(operation.resolve_service('ORANGE', '+237 677 55 92 30'), ('ORANGE', '+237 677 55 92 30'))
+        for number in ['620000000', '700000', '123', '+33612345678', 'abc', '', '6775', '+237 6775',
+                       '677559230123456', '2376775592']:
+            with self.assertRaises(InvalidClientRequestException):
+                operation.resolve_service('auto', number)
+        with self.assertRaises(InvalidClientRequestException):
+            operation.resolve_service('auto', '771234567', 'SN')
+
+    def test_make_collect_auto(self):
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key)
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request) as request:
+            operation.make_collect(amount=100, service='auto', payer='+237 677 55 92 30')
+            operation.make_deposit(amount=100, service='auto', receiver='237690090980')
+            operation.purchase_airtime(amount=100, service='auto', receiver='655000000', merchant='MTN')
+
+            with self.assertRaises(InvalidClientRequestException) as context:
+                operation.make_collect(amount=100, service='auto', payer='222000000')
+            self.assertEqual(context.exception.code, 'unsupported-number')
+            self.assertEqual(request.call_count, 3)
+
+        self.assertEqual([(body['service'], body.get('payer', body.get('receiver'))) for body in self.bodies],
+                         [('MTN', '677559230'), ('ORANGE', '690090980'), ('ORANGE', '655000000')])
+
+    def test_make_contribution_auto(self):
+        operation = FundraisingOperation('fe8c2445810f4caa95c9778d51580163', self.access_key, self.secret_key)
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            operation.make_contribution(amount=100, service='auto', payer='690000000', anonymous=True)
+
+        self.assertEqual((self.bodies[0]['service'], self.bodies[0]['payer']), ('ORANGE', '690000000'))
+
+    def test_async_make_collect_auto(self):
+        requests_sent = []
+
+        def handler(request):
+            requests_sent.append(json.loads(request.content))
+            return httpx.Response(200, json=TRANSACTION_RESPONSE)
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            operation = AsyncPaymentOperation(self.application_key, self.access_key, self.secret_key, client=client)
+            await operation.make_collect(amount=100, service='auto', payer='+237677559230')
+            with self.assertRaises(InvalidClientRequestException):
+                await operation.make_collect(amount=100, service='auto', payer='+33612345678')
+
+        asyncio.run(run())
+        self.assertEqual([(body['service'], body['payer']) for body in requests_sent], [('MTN', '677559230')])
@@ -0,0 +1,115 @@
+import json
+import math
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import requests
+
+from pymesomb import mesomb
+from pymesomb import batch as batch_module
+from pymesomb.batch import TransactionBatch
+from pymesomb.models import Transaction, WalletTransaction
+from pymesomb.operations import PaymentOperation
+
+
+def make_transaction(pk, service, status, amount, fees, ts):
+    return {
+        'pk': pk, 'status': status, 'type': 'COLLECT', 'amount': amount, 'fees': fees, 'b_party': '237670000000',
+        'message': None, 'service': service, 'reference': None, 'ts': ts, 'country': 'CM', 'currency': 'XAF',
+        'fin_trx_id': None, 'trxamount': None, 'location': None, 'customer': None, 'products': [],
+    }
+
+
+TRANSACTIONS = [
+    make_transaction('1', 'MTN', 'SUCCESS', 100, 2, '2025-02-10T10:08:31Z'),
+    make_transaction('2', 'ORANGE', 'SUCCESS', 200, None, '2025-02-10T10:30:00Z'),
+    make_transaction('3', 'MTN', 'FAILED', 300, 6, '2025-02-10T11:00:00Z'),
+    make_transaction('4', 'MTN', 'SUCCESS', 400, 8, '2025-02-11T09:00:00Z'),
+]
+
+WALLET_TRANSACTIONS = [
+    {'id': 1, 'status': 'SUCCESS', 'type': 'CREDIT', 'amount': 50, 'direction': 1, 'wallet': 228,
+     'balance_after': 150, 'date': '2025-02-10T10:08:31Z', 'country': 'CM', 'fin_trx_id': None},
+    {'id': 2, 'status': 'SUCCESS', 'type': 'DEBIT', 'amount': 20, 'direction': -1, 'wallet': 228,
+     'balance_after': None, 'date': '2025-02-10T11:08:31Z', 'country': 'CM', 'fin_trx_id': None},
+    {'id': 3, 'status': 'SUCCESS', 'type': 'CREDIT', 'amount': 70, 'direction': 1, 'wallet': 229,
+     'balance_after': 70, 'date': '2025-02-10T12:08:31Z', 'country': 'CM', 'fin_trx_id': None},
+]
+
+
+class PureTransactionBatchTest(unittest.TestCase):
+    use_numpy = False
+
+    def test_aggregations(self):
+        batch = TransactionBatch(TRANSACTIONS, use_numpy=self.use_numpy)
+        self.assertEqual(len(batch), 4)
+        self.assertEqual(batch.ids, ['1', '2', '3', '4'])
+        self.assertEqual(batch.column('service'), ['MTN', 'ORANGE', 'MTN', 'MTN'])
+        self.assertEqual(batch.column('timestamp')[0], 1739182111)
+        self.assertTrue(math.isnan(batch.column('fees')[1]))
+
+        self.assertEqual(batch.sum(), 1000)
+        self.assertEqual(batch.sum('fees'), 16)
+        self.assertEqual(batch.sum(by='service'), {'MTN': 800, 'ORANGE': 200})
+        self.assertEqual(batch.sum('fees', by='service'), {'MTN': 16, 'ORANGE': 0})
+        self.assertEqual(batch.sum(by=('service', 'status')),
+                         {('MTN', 'SUCCESS'): 500, ('ORANGE', 'SUCCESS'): 200, ('MTN', 'FAILED'): 300})
+        self.assertEqual(batch.count(by='status'), {'SUCCESS': 3, 'FAILED': 1})
+        self.assertEqual(batch.sum(every=86400), {(datetime(2025, 2, 10),): 600, (datetime(2025, 2, 11),): 400})
+        self.assertEqual(batch.count('service', every=3600), {
+            ('MTN', datetime(2025, 2, 10, 10)): 1, ('ORANGE', datetime(2025, 2, 10, 10)): 1,
+            ('MTN', datetime(2025, 2, 10, 11)): 1, ('MTN', datetime(2025, 2, 11, 9)): 1,
+        })
+
+    def test_filter(self):
+        batch = TransactionBatch(TRANSACTIONS, use_numpy=self.use_numpy)
+        success = batch.filter(status='SUCCESS', since=datetime(2025, 2, 10, 10, 10))
+        self.assertEqual(success.ids, ['2', '4'])
+        self.assertEqual(success.sum(), 600)
+        self.assertEqual(batch.filter(service=['ORANGE', 'AIRTEL']).ids, ['2'])
+        self.assertEqual(batch.filter(until=datetime(2025, 2, 10, 11)).ids, ['1', '2'])
+        self.assertEqual(batch.filter(status='PENDING').sum(), 0)
+        self.assertEqual(batch.filter([True, False, False, True]).count(by='status'), {'SUCCESS': 2})
+
+        transaction = success[1]
+        self.assertIsInstance(transaction, Transaction)
+        self.assertEqual(transaction.pk, '4')
+        self.assertEqual([transaction.pk for transaction in success], ['2', '4'])
+
+    def test_wallet_transactions(self):
+        batch = TransactionBatch(WALLET_TRANSACTIONS, WalletTransaction, use_numpy=self.use_numpy)
+        self.assertEqual(batch.ids, [1, 2, 3])
+        self.assertEqual(batch.count(by='wallet'), {228: 2, 229: 1})
+        self.assertEqual(batch.sum(by=('wallet', 'direction')), {(228, 1): 50, (228, -1): 20, (229, 1): 70})
+        self.assertEqual(batch.sum('balance_after'), 220)
+        self.assertEqual(batch.filter(direction=1, wallet=228).ids, [1])
+        self.assertIsInstance(batch[0], WalletTransaction)
+
+
+@unittest.skipIf(batch_module.numpy is None, 'numpy is not installed')
+class NumpyTransactionBatchTest(PureTransactionBatchTest):
+    use_numpy = True
+
+    def test_arrays(self):
+        batch = TransactionBatch(TRANSACTIONS)
+        self.assertIsInstance(batch.columns['amount'], batch_module.numpy.ndarray)
+
+
+class RawTransactionsTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+
+    def test_raw_transactions(self):
+        def request(method, url, data=None, headers=None, timeout=None):
+            response = requests.Response()
+            response.status_code = 200
+            response._content = json.dumps(TRANSACTIONS).encode()
+            return response
+
+        operation = PaymentOperation('2bb525516ff374bb52545bf22ae4da7d655ba9fd', 'c6c40b76-8119-4e93-81bf-bfb55417b392',
+                                     'fe8c2445-810f-4caa-95c9-778d51580163')
+        with mock.patch.object(requests.Session, 'request', side_effect=request):
+            items = operation.with_response_mode('raw').get_transactions(['4', '1'])
+        self.assertEqual([item['pk'] for item in items], ['4', '1', '2', '3'])
+        self.assertEqual(TransactionBatch(items).sum(by='status'), {'SUCCESS': 700, 'FAILED': 300})
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+
+import httpx
+import requests
+
+from pymesomb import mesomb
+from pymesomb.async_operations import AsyncPaymentOperation
+from pymesomb.exceptions import InvalidClientRequestException
+from pymesomb.models import TransactionResponse
+from pymesomb.operations import PaymentOperation
+from tests.helpers import make_response, make_transaction_response
+
+
+class BulkCollectTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.application_key = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+
+    def test_make_collect_many(self):
+        lock = threading.Lock()
+        state = {'running': 0, 'max': 0}
+
+        def request(method, url, data=None, headers=None, timeout=None):
+            with lock:
+                state['running'] += 1
+                state['max'] = max(state['max'], state['running'])
+            try:
+                if json.loads(data)['amount'] == 0:
+                    return make_response(400, b'{"detail": "Invalid amount", "code": "invalid-amount"}')
+                return make_response(200, make_transaction_response(headers['X-MeSomb-TrxID']))
+            finally:
+                with lock:
+                    state['running'] -= 1
+
+        specs = [{'amount': 100, 'service': 'MTN', 'payer': '670000000', 'trx_id': f'T{i}'} for i in range(20)]
+        specs.append({'amount': 100, 'service': 'MTN', 'payer': '670000000', 'trx_id': 'T1'})
+        specs.append({'amount': 0, 'service': 'MTN', 'payer': '670000000'})
+        specs.append({'amount': 100, 'service': 'MTN', 'payer': '670000000'})
+
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key)
+        with mock.patch.object(requests.Session, 'request', side_effect=request):
+            results = dict(operation.make_collect_many(iter(specs), concurrency=4))
+
+        self.assertEqual(sorted(results), list(range(len(specs))))
+        self.assertLessEqual(state['max'], 4)
+        for index in range(20):
+            self.assertIsInstance(results[index], TransactionResponse)
+            self.assertEqual(results[index].reference, f'T{index}')
+        self.assertIsInstance(results[20], InvalidClientRequestException)
+        self.assertIsInstance(results[21], InvalidClientRequestException)
+        self.assertEqual(results[22].reference, specs[22]['trx_id'])
+
+    def test_make_collect_many_auto(self):
+        bodies = []
+
+        def request(method, url, data=None, headers=None, timeout=None):
+            bodies.append(json.loads(data))
+            return make_response(200, make_transaction_response(headers['X-MeSomb-TrxID']))
+
+        specs = [
+            {'amount': 100, 'service': 'auto', 'payer': '+237 677 55 92 30', 'trx_id': 'T0'},
+            {'amount': 100, 'service': 'auto', 'payer': '690090980', 'trx_id': 'T1'},
+            {'amount': 100, 'service': 'auto', 'payer': '620000000', 'trx_id': 'T2'},
+            {'amount': 100, 'service': 'auto', 'payer': '+33612345678', 'trx_id': 'T3'},
+        ]
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key)
+        with mock.patch.object(requests.Session, 'request', side_effect=request):
+            results = dict(operation.make_collect_many(specs, concurrency=2))
+
+        self.assertIsInstance(results[0], TransactionResponse)
+        self.assertIsInstance(results[1], TransactionResponse)
+        self.assertEqual(results[2].code, 'unsupported-number')
+        self.assertEqual(results[3].code, 'unsupported-number')
+        self.assertEqual([(spec['service'], spec['payer']) for spec in specs[:2]],
+                         [('MTN', '677559230'), ('ORANGE', '690090980')])
+        self.assertEqual(sorted((body['service'], body['payer']) for body in bodies),
+                         [('MTN', '677559230'), ('ORANGE', '690090980')])
+
+    def test_service_concurrency(self):
+        lock = threading.Lock()
+        running, peaks = {}, {}
+
+        def request(method, url, data=None, headers=None, timeout=None):
+            service = json.loads(data)['service']
+            with lock:
+                running[service] = running.get(service, 0) + 1
+                peaks[service] = max(peaks.get(service, 0), running[service])
+            time.sleep(0.01)
+            with lock:
+                running[service] -= 1
+            return make_response(200, make_transaction_response(headers['X-MeSomb-TrxID']))
+
+        specs = [{'amount': 100, 'service': 'auto', 'payer': '670000000' if i % 3 else '690000000'}
+                 for i in range(24)]
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key)
+        with mock.patch.object(requests.Session, 'request', side_effect=request):
+            results = dict(operation.make_collect_many(specs, concurrency=6, service_concurrency=2))
+
+        self.assertEqual(len(results), 24)
+        self.assertTrue(all(isinstance(result, TransactionResponse) for result in results.values()))
+        self.assertEqual(peaks, {'MTN': 2, 'ORANGE': 2})
+
+    def test_async_service_concurrency(self):
+        running, peaks = {}, {}
+
+        async def handler(request):
+            service = json.loads(request.content)['service']
+            running[service] = running.get(service, 0) + 1
+            peaks[service] = max(peaks.get(service, 0), running[service])
+            await asyncio.sleep(0.01)
+            running[service] -= 1
+            return httpx.Response(200, json=make_transaction_response(request.headers['X-MeSomb-TrxID']))
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            operation = AsyncPaymentOperation(self.application_key, self.access_key, self.secret_key, client=client)
+            specs = [{'amount': 100, 'service': 'MTN' if i % 3 else 'ORANGE', 'payer': '670000000'}
+                     for i in range(24)]
+            return [item async for item in operation.make_collect_many(specs, concurrency=8, service_concurrency=3)]
+
+        self.assertEqual(len(asyncio.run(run())), 24)
+        self.assertEqual(peaks, {'MTN': 3, 'ORANGE': 3})
+
+    def test_async_make_collect_many(self):
+        def handler(request):
+            return httpx.Response(200, json=make_transaction_response(request.headers['X-MeSomb-TrxID']))
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            operation = AsyncPaymentOperation(self.application_key, self.access_key, self.secret_key, client=client)
+            specs = ({'amount': 100, 'service': 'MTN', 'payer': '670000000', 'trx_id': f'T{i}'} for i in range(50))
+            return [item async for item in operation.make_collect_many(specs, concurrency=8)]
+
+        results = dict(asyncio.run(run()))
+        self.assertEqual(len(results), 50)
+        self.assertTrue(all(results[index].reference == f'T{index}' for index in results))
+
+    def test_async_invalid_spec(self):
+        def handler(request):
+            return httpx.Response(200, json=make_transaction_response(request.headers['X-MeSomb-TrxID']))
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            operation = AsyncPaymentOperation(self.application_key, self.access_key, self.secret_key, client=client)
+            specs = [{'amount': 100, 'service': 'MTN', 'payer': '670000000', 'trx_id': f'T{i}'} for i in range(4)]
+            specs[1]['unknown'] = True
+            return [item async for item in operation.make_collect_many(specs, concurrency=2)]
+
+        results = dict(asyncio.run(run()))
+        self.assertIsInstance(results.pop(1), TypeError)
+        self.assertEqual({index: result.reference for index, result in results.items()}, {0: 'T0', 2: 'T2', 3: 'T3'})
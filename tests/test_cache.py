@@ -0,0 +1,221 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+import httpx
+import requests
+
+from pymesomb import mesomb
+from pymesomb.async_operations import AsyncPaymentOperation
+from pymesomb.cache import TTLCache, MISSING
+from pymesomb.operations import PaymentOperation, WalletOperation
+from tests.helpers import APPLICATION, TRANSACTION_RESPONSE
+
+
+class TTLCacheTest(unittest.TestCase):
+    def test_ttl_and_lru(self):
+        cache = TTLCache(ttl=10, maxsize=2, ttls={'short': 1})
+        with mock.patch('time.monotonic', return_value=100):
+            cache.set('a', 1)
+            cache.set('b', 2)
+            cache.set('short', 3)
+        self.assertEqual(len(cache), 2)
+        with mock.patch('time.monotonic', return_value=101):
+            self.assertIs(cache.get('a'), MISSING)
+            self.assertEqual(cache.get('b'), 2)
+            self.assertIsNone(cache.get('short', None))
+        with mock.patch('time.monotonic', return_value=110):
+            self.assertIs(cache.get('b'), MISSING)
+        self.assertEqual(cache.stats, {'hits': 1, 'stale_hits': 0, 'misses': 3, 'size': 0})
+
+    def test_stale_while_revalidate(self):
+        cache = TTLCache(ttl=10, max_stale=60)
+        loader = mock.Mock(side_effect=[1, 2, 3])
+        with mock.patch('time.monotonic', return_value=100):
+            self.assertEqual(cache.get_or_load('key', loader), 1)
+        with mock.patch('time.monotonic', return_value=120), mock.patch('threading.Thread') as thread:
+            self.assertEqual(cache.get_or_load('key', loader), 1)
+            thread.assert_called_once()
+            cache._refresh(*thread.call_args.kwargs['args'])
+            self.assertEqual(cache.get_or_load('key', loader), 2)
+        with mock.patch('time.monotonic', return_value=1000):
+            self.assertEqual(cache.get_or_load('key', loader), 3)
+        self.assertEqual(cache.stats, {'hits': 1, 'stale_hits': 1, 'misses': 2, 'size': 1})
+
+    def test_invalidated_value_is_not_cached(self):
+        cache = TTLCache()
+
+        def loader():
+            cache.invalidate('key')
+            return 1
+
+        self.assertEqual(cache.get_or_load('key', loader), 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_written_value_is_not_overwritten_by_load(self):
+        cache = TTLCache()
+
+        def loader():
+            # written while the value is loaded, the loaded value may be older
+            cache.update('key', lambda value: value + 1)
+            return 1
+
+        self.assertEqual(cache.get_or_load('key', loader), 1)
+        self.assertIs(cache.get('key'), MISSING)
+
+        def loader():
+            cache.set('key', 2)
+            return 1
+
+        self.assertEqual(cache.get_or_load('key', loader), 1)
+        self.assertEqual(cache.get('key'), 2)
+
+    def test_write_of_other_key_keeps_load(self):
+        cache = TTLCache()
+
+        def loader():
+            cache.set('other', 2)
+            cache.invalidate('another')
+            return 1
+
+        self.assertEqual(cache.get_or_load('key', loader), 1)
+        self.assertEqual(cache.get('key'), 1)
+        self.assertEqual(cache.get('other'), 2)
+
+        def loader():
+            cache.clear()
+            return 1
+
+        self.assertEqual(cache.get_or_load('new', loader), 1)
+        self.assertIs(cache.get('new'), MISSING)
+        # the versions are only kept while a load is in flight
+        self.assertEqual((cache._versions, cache._loading), ({}, {}))
+
+
+class StatusCacheTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.application_key = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+        self.urls = []
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        self.urls.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(APPLICATION if method == 'GET' else TRANSACTION_RESPONSE).encode()
+        return response
+
+    def test_status_cache(self):
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key,
+                                     status_cache=TTLCache(ttl=60))
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            self.assertEqual(operation.get_status().name, 'Test')
+            self.assertIs(operation.get_status(), operation.get_status())
+            self.assertEqual(len(self.urls), 1)
+
+            operation.make_deposit(amount=100, service='MTN', receiver='670000000')
+            operation.get_status()
+        self.assertEqual([url.rsplit('/', 2)[1] for url in self.urls], ['status', 'deposit', 'status'])
+
+    def test_async_status_cache(self):
+        urls = []
+
+        def handler(request: httpx.Request):
+            urls.append(str(request.url))
+            return httpx.Response(200, json=APPLICATION if request.method == 'GET' else TRANSACTION_RESPONSE)
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncPaymentOperation(self.application_key, self.access_key, self.secret_key, client=client,
+                                             status_cache=TTLCache(ttl=60)) as operation:
+                await operation.get_status()
+                await operation.get_status()
+                await operation.make_collect(amount=100, service='MTN', payer='670000000')
+                return await operation.get_status()
+
+        self.assertEqual(asyncio.run(run()).name, 'Test')
+        self.assertEqual([url.rsplit('/', 2)[1] for url in urls], ['status', 'collect', 'status'])
+
+
+WALLET = {
+    'id': 228, 'number': '1', 'country': 'CM', 'status': 'ACTIVE', 'last_activity': None, 'balance': 100,
+    'first_name': 'John', 'last_name': 'Doe', 'email': None, 'phone_number': '+237677550000', 'gender': 'MAN',
+}
+
+
+def make_wallet_transaction(wallet, balance_after):
+    return {'id': 1, 'status': 'SUCCESS', 'type': 'CREDIT', 'amount': 50, 'direction': 1, 'wallet': wallet,
+            'balance_after': balance_after, 'date': '2025-02-10T10:08:31Z', 'country': 'CM', 'fin_trx_id': None}
+
+
+class WalletCacheTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.cache = TTLCache(ttl=60, maxsize=100)
+        self.operation = WalletOperation('a1dc7a7391c538788043', 'c6c40b76-8119-4e93-81bf-bfb55417b392',
+                                         'fe8c2445-810f-4caa-95c9-778d51580163', wallet_cache=self.cache)
+        self.requests = []
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        self.requests.append((method, url.split('/api/v1.1/')[1]))
+        if url.endswith('/adjust/'):
+            balance_after = 150 if json.loads(data)['direction'] == 1 else None
+            content = make_wallet_transaction(228, balance_after)
+        elif url.endswith('/transfer/'):
+            content = make_wallet_transaction(228, 120)
+        elif method == 'DELETE':
+            content = None
+        else:
+            content = WALLET
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(content).encode()
+        return response
+
+    def get_count(self):
+        return sum(1 for method, _ in self.requests if method == 'GET')
+
+    def test_wallet_cache(self):
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            self.assertEqual(self.operation.get_wallet(228).balance, 100)
+            self.assertEqual(self.operation.get_wallet(228).balance, 100)
+            self.assertEqual(self.get_count(), 1)
+
+            self.operation.add_money(228, 50)
+            self.assertEqual(self.operation.get_wallet(228).balance, 150)
+            self.operation.transfert_money(228, 229, 30)
+            self.assertEqual(self.operation.get_wallet(228).balance, 120)
+            self.assertEqual(self.get_count(), 1)
+
+            self.operation.remove_money(228, 10)
+            self.operation.get_wallet(228)
+            self.assertEqual(self.get_count(), 2)
+
+            self.operation.delete_wallet(228)
+            self.operation.get_wallet(228)
+            self.assertEqual(self.get_count(), 3)
+
+            self.operation.update_wallet(228, last_name='Doe', phone_number='+237677550000', gender='MAN')
+            self.operation.get_wallet(228)
+            self.assertEqual(self.get_count(), 3)
+
+        self.assertEqual(self.cache.stats, {'hits': 4, 'stale_hits': 0, 'misses': 3, 'size': 1})
+
+    def test_wallet_changed_while_loaded(self):
+        state = {'credited': False}
+
+        def request(method, url, data=None, headers=None, timeout=None):
+            if method == 'GET' and not state['credited']:
+                # the wallet is credited after MeSomb read it for get_wallet
+                state['credited'] = True
+                self.operation.add_money(228, 50)
+            return self.request(method, url, data, headers, timeout)
+
+        with mock.patch.object(requests.Session, 'request', side_effect=request):
+            self.assertEqual(self.operation.get_wallet(228).balance, 100)
+            self.assertEqual(len(self.cache), 0)
+            self.operation.get_wallet(228)
+            self.assertEqual(self.get_count(), 2)
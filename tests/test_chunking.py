@@ -0,0 +1,104 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+from urllib.parse import urlsplit, parse_qs
+
+import httpx
+import requests
+
+from pymesomb import mesomb
+from pymesomb.async_operations import AsyncPaymentOperation
+from pymesomb.exceptions import DeadlineExceededException
+from pymesomb.operations import PaymentOperation, FundraisingOperation
+from tests.helpers import TRANSACTION
+
+
+def get_ids(url):
+    ids = parse_qs(urlsplit(url).query)['ids']
+    return ids if len(ids) > 1 else ids[0].split(',')
+
+
+def lookup(url):
+    # MeSomb returns the transactions found in its own order
+    return [dict(TRANSACTION, pk=id) for id in reversed(get_ids(url)) if not id.startswith('unknown')]
+
+
+class ChunkingTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.application_key = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+        self.urls = []
+        self.lock = threading.Lock()
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        with self.lock:
+            self.urls.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(lookup(url)).encode()
+        return response
+
+    def test_split_by_count(self):
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key, max_ids=10)
+        ids = [f'id{i}' for i in range(35)]
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            transactions = operation.check_transactions(ids + ['unknown', 'id3'])
+
+        self.assertEqual([transaction.pk for transaction in transactions], ids)
+        self.assertEqual(sorted(len(get_ids(url)) for url in self.urls), [6, 10, 10, 10])
+
+    def test_split_by_url_length(self):
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key, max_url_length=300)
+        ids = [f'{i:036d}' for i in range(20)]
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            transactions = operation.get_transactions(ids)
+
+        self.assertEqual([transaction.pk for transaction in transactions], ids)
+        self.assertGreater(len(self.urls), 1)
+        self.assertTrue(all(len(url) <= 300 for url in self.urls))
+        self.assertEqual(sorted(id for url in self.urls for id in get_ids(url)), ids)
+
+    def test_single_and_empty_lookup(self):
+        operation = FundraisingOperation('fund', self.access_key, self.secret_key)
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            self.assertEqual(operation.get_contributions([]), [])
+            self.assertEqual(len(operation.check_contributions(['a', 'b'], source='EXTERNAL')), 2)
+
+        self.assertEqual(self.urls, ['http://127.0.0.1:8000/api/v1.1/fundraising/contributions/check/'
+                                     '?ids=a,b&source=EXTERNAL'])
+
+    def test_async_split(self):
+        urls = []
+
+        def handler(request: httpx.Request):
+            urls.append(str(request.url))
+            return httpx.Response(200, json=lookup(str(request.url)))
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncPaymentOperation(self.application_key, self.access_key, self.secret_key, client=client,
+                                             max_ids=3) as operation:
+                return await operation.check_transactions([f'id{i}' for i in range(7)])
+
+        transactions = asyncio.run(run())
+        self.assertEqual([transaction.pk for transaction in transactions], [f'id{i}' for i in range(7)])
+        self.assertEqual(len(urls), 3)
+
+    def test_deadline_of_whole_lookup(self):
+        def request(method, url, data=None, headers=None, timeout=None):
+            time.sleep(0.05)
+            return self.request(method, url, data, headers, timeout)
+
+        # one connection, the chunks are sent one after the other
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key, max_ids=1,
+                                     pool_maxsize=1)
+        with mock.patch.object(requests.Session, 'request', side_effect=request):
+            self.assertEqual(len(operation.check_transactions(['a', 'b'], deadline=1)), 2)
+            with self.assertRaises(DeadlineExceededException):
+                operation.check_transactions([f'id{i}' for i in range(8)], deadline=0.12)
+        self.assertLess(len(self.urls), 8)
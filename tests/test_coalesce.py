@@ -0,0 +1,113 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import httpx
+import requests
+
+from pymesomb import mesomb
+from pymesomb.async_operations import AsyncPaymentOperation
+from pymesomb.coalesce import SingleFlight
+from pymesomb.exceptions import DeadlineExceededException
+from pymesomb.operations import PaymentOperation
+from tests.helpers import APPLICATION
+
+
+class SingleFlightTest(unittest.TestCase):
+    def test_shared_exception(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError('failed')
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, 'key', fail)
+            started.wait()
+            follower = executor.submit(flight.do, 'key', fail)
+            self.assertRaises(ValueError, leader.result)
+            self.assertRaises(ValueError, follower.result)
+        self.assertEqual(flight.shared, 1)
+        self.assertEqual(flight.do('key', lambda: 1), 1)
+
+    def test_follower_timeout(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def slow():
+            started.set()
+            time.sleep(0.2)
+            return 1
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(flight.do, 'key', slow)
+            started.wait()
+            self.assertRaises(DeadlineExceededException, flight.do, 'key', slow, 0.01)
+            self.assertEqual(leader.result(), 1)
+
+
+class CoalesceTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.application_key = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+        self.urls = []
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        self.urls.append(url)
+        time.sleep(0.1)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(APPLICATION).encode()
+        return response
+
+    def test_coalesce(self):
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key, coalesce=True)
+        barrier = threading.Barrier(8)
+
+        def get_status():
+            barrier.wait()
+            return operation.get_status()
+
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = [future.result() for future in [executor.submit(get_status) for _ in range(8)]]
+
+            self.assertEqual(len(self.urls), 1)
+            self.assertTrue(all(result is results[0] for result in results))
+
+            # calls made after the result is delivered are sent again
+            operation.get_status()
+            self.assertEqual(len(self.urls), 2)
+
+    def test_not_coalesced(self):
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key)
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(lambda _: operation.get_status(), range(4)))
+        self.assertEqual(len(self.urls), 4)
+
+    def test_async_coalesce(self):
+        urls = []
+
+        async def handler(request: httpx.Request):
+            urls.append(str(request.url))
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=APPLICATION)
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncPaymentOperation(self.application_key, self.access_key, self.secret_key, client=client,
+                                             coalesce=True) as operation:
+                return await asyncio.gather(*[operation.get_status() for _ in range(5)])
+
+        results = asyncio.run(run())
+        self.assertEqual(len(urls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
@@ -0,0 +1,112 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from urllib.parse import urlsplit, parse_qs
+
+import requests
+
+from pymesomb import mesomb
+from pymesomb.exceptions import ServerException
+from pymesomb.export import export_transactions
+from pymesomb.operations import WalletOperation
+from pymesomb.retry import NO_RETRY
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+def make_transaction(id):
+    return {'id': id, 'status': 'SUCCESS', 'type': 'CREDIT', 'amount': 10, 'direction': 1, 'wallet': 7,
+            'balance_after': 10.0 * id, 'date': '2025-02-10T10:08:31Z', 'country': 'CM', 'fin_trx_id': None,
+            'extra': {'ignored': True}}
+
+
+class ExportTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.operation = WalletOperation('a1dc7a7391c538788043', 'c6c40b76-8119-4e93-81bf-bfb55417b392',
+                                         'fe8c2445-810f-4caa-95c9-778d51580163', read_retry=NO_RETRY)
+        self.directory = tempfile.TemporaryDirectory()
+        self.pages = []
+        self.fail_on = None
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        page = int(parse_qs(urlsplit(url).query)['page'][0])
+        self.pages.append(page)
+        response = requests.Response()
+        if page == self.fail_on:
+            response.status_code = 500
+            response._content = b'Error'
+            return response
+        response.status_code = 200
+        response._content = json.dumps({
+            'count': 7, 'next': f'{url}&next' if page < 4 else None, 'previous': None,
+            'results': [make_transaction(id) for id in range(page * 2 - 1, min(7, page * 2) + 1)],
+        }).encode()
+        return response
+
+    def export(self, path, **kwargs):
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            return export_transactions(self.operation, path, **kwargs)
+
+    def test_export_ndjson(self):
+        path = os.path.join(self.directory.name, 'ledger.ndjson')
+        self.assertEqual(self.export(path, wallet=7), 7)
+        with open(path) as file:
+            rows = [json.loads(line) for line in file]
+        self.assertEqual(rows, [make_transaction(id) for id in range(1, 8)])
+        self.assertEqual(self.pages, [1, 2, 3, 4])
+
+    def test_resume_csv(self):
+        path = os.path.join(self.directory.name, 'ledger.csv')
+        self.fail_on = 3
+        with self.assertRaises(ServerException):
+            self.export(path)
+
+        self.fail_on = None
+        self.pages = []
+        self.assertEqual(self.export(path), 7)
+        self.assertEqual(self.pages, [3, 4])
+        with open(path, newline='') as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual([row['id'] for row in rows], [str(id) for id in range(1, 8)])
+        self.assertEqual(list(rows[0]), ['id', 'status', 'type', 'amount', 'direction', 'wallet', 'balance_after',
+                                         'date', 'country', 'fin_trx_id'])
+
+        # a finished export starts again from the beginning
+        self.pages = []
+        self.assertEqual(self.export(path), 7)
+        self.assertEqual(self.pages, [1, 2, 3, 4])
+
+    def test_checkpoint_synced(self):
+        path = os.path.join(self.directory.name, 'ledger.ndjson')
+        synced = []
+        real_fsync = os.fsync
+
+        def fsync(fd):
+            synced.append(os.fstat(fd).st_ino)
+            return real_fsync(fd)
+
+        with mock.patch('os.fsync', side_effect=fsync):
+            self.export(path)
+
+        # the rows of each page are synced before the state, itself synced before replacing the previous one
+        data, state = os.stat(path).st_ino, os.stat(f'{path}.state').st_ino
+        self.assertEqual(synced[::2], [data] * 5)
+        self.assertNotIn(data, synced[1::2])
+        self.assertEqual(synced[-1], state)
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_export_parquet(self):
+        path = os.path.join(self.directory.name, 'ledger.parquet')
+        self.assertEqual(self.export(path, batch_size=3), 7)
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(table.column('id').to_pylist(), list(range(1, 8)))
@@ -0,0 +1,89 @@
+import json
+import unittest
+from datetime import datetime
+from unittest import mock
+from urllib.parse import urlsplit, parse_qs
+
+import requests
+
+from pymesomb import mesomb
+from pymesomb.ledger import WalletLedger
+from pymesomb.operations import WalletOperation
+
+WALLET = {
+    'id': 7, 'number': '1', 'country': 'CM', 'status': 'ACTIVE', 'last_activity': '2025-02-10T10:08:31Z',
+    'balance': 60, 'first_name': 'John', 'last_name': 'Doe', 'email': None, 'phone_number': '+237670000000',
+    'gender': 'MAN',
+}
+
+
+def make_transaction(id, status='SUCCESS'):
+    return {'id': id, 'status': status, 'type': 'CREDIT', 'amount': 10, 'direction': 1, 'wallet': 7,
+            'balance_after': 10.0 * id, 'date': f'2025-02-{id:02d}T10:00:00Z', 'country': 'CM',
+            'fin_trx_id': f'FIN{id}'}
+
+
+class LedgerTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.operation = WalletOperation('a1dc7a7391c538788043', 'c6c40b76-8119-4e93-81bf-bfb55417b392',
+                                         'fe8c2445-810f-4caa-95c9-778d51580163')
+        self.transactions = {id: make_transaction(id) for id in range(1, 6)}
+        self.ascending = False
+        self.urls = []
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        self.urls.append(url)
+        query = parse_qs(urlsplit(url).query)
+        if '/wallets/' in url:
+            content = {'count': 1, 'next': None, 'previous': None, 'results': [WALLET]}
+        elif '/search/' in url:
+            content = [self.transactions[int(id)] for id in query['ids']]
+        else:
+            page = int(query['page'][0])
+            items = sorted(self.transactions.values(), key=lambda item: item['id'], reverse=not self.ascending)
+            content = {'count': len(items), 'next': f'{url}&next' if page * 2 < len(items) else None,
+                       'previous': None, 'results': items[(page - 1) * 2:page * 2]}
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(content).encode()
+        return response
+
+    def pages(self):
+        return [int(parse_qs(urlsplit(url).query)['page'][0]) for url in self.urls if '/transactions/?' in url]
+
+    def test_incremental_sync(self):
+        self.transactions[5] = make_transaction(5, 'PENDING')
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request), \
+                WalletLedger(self.operation, ':memory:') as ledger:
+            self.assertEqual(ledger.sync(), (1, 5))
+            self.assertEqual(ledger.get_mark('transactions'), 5)
+            self.assertEqual(self.pages(), [1, 2, 3])
+
+            self.urls = []
+            self.transactions[5] = make_transaction(5)
+            self.transactions.update({id: make_transaction(id) for id in (6, 7)})
+            # pages 1 and 2 hold the new transactions, page 2 reaches the high-water mark
+            self.assertEqual(ledger.sync_transactions(), 4)
+            self.assertEqual(self.pages(), [1, 2])
+            self.assertEqual(ledger.get_mark('transactions'), 7)
+            self.assertEqual(ledger.get_transaction(5).status, 'SUCCESS')
+
+            self.assertEqual(ledger.get_wallet(7).last_activity, datetime(2025, 2, 10, 10, 8, 31))
+            self.assertIsNone(ledger.get_transaction(8))
+            self.assertEqual([t.id for t in ledger.find_transactions(fin_trx_id='FIN3')], [3])
+            self.assertEqual([t.id for t in ledger.find_transactions(wallet=7, since=datetime(2025, 2, 6))], [6, 7])
+            self.assertEqual(ledger.get_balance_history(7, until=datetime(2025, 2, 3)),
+                             [(datetime(2025, 2, 1, 10), 10.0), (datetime(2025, 2, 2, 10), 20.0)])
+
+    def test_ascending_listing(self):
+        self.ascending = True
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request), \
+                WalletLedger(self.operation, ':memory:') as ledger:
+            self.assertEqual(ledger.sync_transactions(), 5)
+            self.urls = []
+            self.transactions.update({id: make_transaction(id) for id in (6, 7, 8)})
+            ledger.sync_transactions()
+            # the two full pages already stored are skipped
+            self.assertEqual(self.pages(), [1, 3, 4])
+            self.assertEqual(len(ledger.find_transactions()), 8)
@@ -0,0 +1,100 @@
+import asyncio
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from urllib.parse import urlsplit, parse_qs
+
+import httpx
+import requests
+
+from pymesomb import mesomb
+from pymesomb.async_operations import AsyncPaymentOperation
+from pymesomb.loader import TransactionLoader, AsyncTransactionLoader
+from pymesomb.operations import PaymentOperation
+from pymesomb.retry import NO_RETRY
+from tests.helpers import TRANSACTION
+
+
+def lookup(url):
+    ids = parse_qs(urlsplit(url).query)['ids']
+    return [dict(TRANSACTION, pk=id) for id in reversed(ids) if not id.startswith('unknown')]
+
+
+class TransactionLoaderTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.application_key = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+        self.urls = []
+        self.lock = threading.Lock()
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        with self.lock:
+            self.urls.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(lookup(url)).encode()
+        return response
+
+    def operation(self):
+        return PaymentOperation(self.application_key, self.access_key, self.secret_key, read_retry=NO_RETRY)
+
+    def test_batch_window(self):
+        barrier = threading.Barrier(20)
+
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request), \
+                TransactionLoader(self.operation(), wait=0.2) as loader:
+            def get(id):
+                barrier.wait()
+                return loader.get(id)
+
+            with ThreadPoolExecutor(max_workers=20) as executor:
+                ids = [f'pk{i % 15}' for i in range(19)] + ['unknown']
+                transactions = list(executor.map(get, ids))
+
+        self.assertEqual(len(self.urls), 1)
+        self.assertEqual(len(parse_qs(urlsplit(self.urls[0]).query)['ids']), 16)
+        self.assertEqual([transaction.pk for transaction in transactions[:-1]], ids[:-1])
+        self.assertIsNone(transactions[-1])
+
+    def test_max_batch(self):
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            with TransactionLoader(self.operation(), wait=10, max_batch=3) as loader:
+                futures = loader.load_many(f'pk{i}' for i in range(7))
+                self.assertEqual(futures[0].result(1).pk, 'pk0')
+                self.assertEqual(futures[5].result(1).pk, 'pk5')
+            # the last id is sent when the loader is closed
+            self.assertEqual(futures[6].result().pk, 'pk6')
+
+        self.assertEqual(sorted(len(parse_qs(urlsplit(url).query)['ids']) for url in self.urls), [1, 3, 3])
+
+    def test_error(self):
+        with mock.patch.object(requests.Session, 'request', side_effect=requests.ConnectionError('down')), \
+                TransactionLoader(self.operation(), wait=0) as loader:
+            future = loader.load('pk1')
+            self.assertRaises(requests.ConnectionError, future.result)
+
+    def test_async_loader(self):
+        urls = []
+
+        def handler(request: httpx.Request):
+            urls.append(str(request.url))
+            return httpx.Response(200, json=lookup(str(request.url)))
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncPaymentOperation(self.application_key, self.access_key, self.secret_key,
+                                             client=client) as operation:
+                loader = AsyncTransactionLoader(operation, max_batch=4)
+                results = await asyncio.gather(*[loader.get(f'pk{i % 6}') for i in range(8)], loader.get('unknown'))
+                await loader.close()
+                return results
+
+        transactions = asyncio.run(run())
+        self.assertEqual([transaction.pk for transaction in transactions[:-1]], [f'pk{i % 6}' for i in range(8)])
+        self.assertIsNone(transactions[-1])
+        # pk0 and pk1 asked again after the first batch was sent are sent with the next one
+        self.assertEqual(sorted(len(parse_qs(urlsplit(url).query)['ids']) for url in urls), [1, 4, 4])
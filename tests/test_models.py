@@ -0,0 +1,91 @@
+import copy
+import pickle
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from pymesomb import mesomb, models
+from pymesomb.models import TransactionResponse, Transaction, Wallet, WalletTransaction, ATransaction, parse_datetime
+from tests import helpers
+
+TRANSACTION = dict(helpers.TRANSACTION, location={'town': 'Douala', 'region': 'Littoral', 'country': 'CM'},
+                   customer={'last_name': 'Doe', 'first_name': 'John'}, products=[{'id': '1', 'name': 'Book'}])
+
+WALLET = {
+    'id': 228, 'number': '1', 'country': 'CM', 'status': 'ACTIVE', 'last_activity': '2025-02-10T10:08:31Z',
+    'balance': 100, 'first_name': 'John', 'last_name': 'Doe', 'email': None, 'phone_number': '+237677550000',
+    'gender': 'MAN',
+}
+
+
+class ModelsTest(unittest.TestCase):
+    def test_slots(self):
+        for name in ('Location', 'Customer', 'Product', 'ATransaction', 'Transaction', 'TransactionResponse',
+                     'ApplicationBalance', 'Application', 'WalletTransaction', 'APaginated', 'Wallet',
+                     'PaginatedWallets', 'PaginatedWalletTransactions', 'Contribution', 'ContributionResponse'):
+            self.assertNotIn('__dict__', dir(getattr(models, name)), name)
+
+    def test_transaction(self):
+        response = TransactionResponse({'success': True, 'message': 'Success', 'redirect': None, 'reference': '1',
+                                        'status': 'SUCCESS', 'transaction': TRANSACTION})
+        transaction = response.transaction
+        self.assertIsInstance(transaction, ATransaction)
+        self.assertFalse(hasattr(transaction, '__dict__'))
+        self.assertEqual(transaction.location.town, 'Douala')
+        self.assertEqual(transaction.customer.last_name, 'Doe')
+        self.assertEqual(transaction.products[0].category, 'category')
+        self.assertEqual(response.get_data()['transaction'], TRANSACTION)
+        with self.assertRaises(AttributeError):
+            transaction.unknown = 1
+
+        transaction.status = 'FAILED'
+        self.assertTrue(transaction.is_failed())
+        restored = pickle.loads(pickle.dumps(response))
+        self.assertEqual(restored.transaction.date, transaction.date)
+        self.assertEqual(restored.transaction.status, 'FAILED')
+
+    def test_copy(self):
+        wallet = Wallet(WALLET)
+        copied = copy.copy(wallet)
+        copied.balance = 50
+        self.assertEqual((wallet.balance, copied.balance, copied.last_activity), (100, 50, wallet.last_activity))
+        self.assertEqual(str(copied), '1')
+
+    def test_parse_datetime(self):
+        self.assertEqual(parse_datetime('2025-02-10T10:08:31Z'), datetime(2025, 2, 10, 10, 8, 31))
+        self.assertEqual(models._from_fields('2025-02-10T10:08:31Z'), datetime(2025, 2, 10, 10, 8, 31))
+        self.assertEqual(parse_datetime('2025-2-10T10:08:31Z'), datetime(2025, 2, 10, 10, 8, 31))
+        for value in ('2025-02-30T10:08:31Z', '+025-02-10T10:08:31Z', '2025-02-10 10:08:31Z', '2025-02-10T10:08:31'):
+            self.assertRaises(ValueError, parse_datetime, value)
+        self.assertRaises(ValueError, models._from_fields, '+025-02-10T10:08:31Z')
+
+    def test_lazy(self):
+        with mock.patch.object(models, 'parse_datetime', wraps=parse_datetime) as parse:
+            transaction = Transaction(TRANSACTION, lazy=True)
+            self.assertEqual(transaction.status, 'SUCCESS')
+            parse.assert_not_called()
+
+            self.assertEqual(transaction.date, datetime(2025, 2, 10, 10, 8, 31))
+            self.assertIs(transaction.location, transaction.location)
+            self.assertEqual(transaction.date, datetime(2025, 2, 10, 10, 8, 31))
+            parse.assert_called_once()
+        self.assertEqual(transaction.customer.first_name, 'John')
+        self.assertEqual(transaction.products[0].name, 'Book')
+
+        transaction = pickle.loads(pickle.dumps(Transaction(TRANSACTION, lazy=True)))
+        self.assertEqual(transaction.location.town, 'Douala')
+        transaction.date = None
+        self.assertIsNone(transaction.date)
+
+    def test_lazy_mode(self):
+        with mock.patch.object(mesomb, 'lazy_models', True):
+            transaction = WalletTransaction({'id': 1, 'status': 'SUCCESS', 'type': 'CREDIT', 'amount': 50,
+                                             'direction': 1, 'wallet': 228, 'date': 'invalid', 'country': 'CM',
+                                             'fin_trx_id': None})
+            wallet = Wallet(WALLET)
+        # invalid dates are only detected on access in lazy mode
+        self.assertRaises(ValueError, getattr, transaction, 'date')
+        self.assertEqual(wallet.last_activity, datetime(2025, 2, 10, 10, 8, 31))
+        self.assertRaises(ValueError, WalletTransaction, {'id': 1, 'status': 'SUCCESS', 'type': 'CREDIT',
+                                                          'amount': 50, 'direction': 1, 'wallet': 228,
+                                                          'date': 'invalid', 'country': 'CM', 'fin_trx_id': None})
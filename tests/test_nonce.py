@@ -0,0 +1,85 @@
+import os
+import string
+import threading
+import unittest
+
+from pymesomb import mesomb
+from pymesomb.nonce import RandomNonceProvider, UniqueNonceProvider, generate_nonce
+from pymesomb.utils import RandomGenerator
+
+
+class NonceTest(unittest.TestCase):
+    def test_random_nonce(self):
+        provider = RandomNonceProvider(buffer_size=64)
+
+        nonces = [provider(40) for _ in range(1000)]
+        self.assertTrue(all(len(nonce) == 40 and not nonce.strip(string.ascii_letters + string.digits)
+                            for nonce in nonces))
+        self.assertEqual(len(set(nonces)), len(nonces))
+        self.assertEqual(len(provider(500)), 500)
+        self.assertEqual(provider(0), '')
+        # all the characters are used
+        self.assertEqual(set(''.join(nonces)), set(string.ascii_letters + string.digits))
+
+    def test_threads(self):
+        provider = RandomNonceProvider(buffer_size=256)
+        nonces = []
+
+        def generate():
+            nonces.extend([provider(32) for _ in range(2000)])
+
+        threads = [threading.Thread(target=generate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(nonces)), 16000)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'fork is not available')
+    def test_fork(self):
+        provider = RandomNonceProvider()
+        unique = UniqueNonceProvider(node='n1')
+        provider(), unique()
+
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            os.write(write, (provider() + unique()).encode())
+            os._exit(0)
+        os.close(write)
+        with os.fdopen(read) as child:
+            nonces = child.read()
+        os.waitpid(pid, 0)
+
+        self.assertEqual(len(nonces), 80)
+        self.assertNotEqual(nonces[:40], provider())
+        self.assertNotEqual(nonces[40:][8:14], unique()[8:14])
+
+    def test_unique_nonce(self):
+        provider = UniqueNonceProvider(node='host1')
+
+        nonces = [provider(40) for _ in range(1000)]
+        self.assertEqual(len(set(nonces)), len(nonces))
+        self.assertTrue(all(len(nonce) == 40 and nonce[8:13] == 'host1' for nonce in nonces))
+        # the counter differs for the nonces of the same millisecond
+        self.assertEqual(len({nonce[:21] for nonce in nonces}), len(nonces))
+        self.assertEqual(len(provider(21)), 21)
+        with self.assertRaises(AssertionError):
+            provider(20)
+        with self.assertRaises(AssertionError):
+            UniqueNonceProvider(node='host-1')
+        self.assertEqual(len(UniqueNonceProvider().node), 6)
+
+    def test_generate_nonce(self):
+        self.assertEqual(len(generate_nonce()), 40)
+        self.assertEqual(len(RandomGenerator.nonce(32)), 32)
+        try:
+            mesomb.nonce_provider = 'unique'
+            self.assertEqual(len(generate_nonce()), 40)
+            mesomb.nonce_provider = lambda length: 'n' * length
+            self.assertEqual(generate_nonce(8), 'nnnnnnnn')
+            self.assertEqual(RandomGenerator.nonce(), 'n' * 40)
+        finally:
+            mesomb.nonce_provider = 'random'
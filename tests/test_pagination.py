@@ -0,0 +1,97 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+from urllib.parse import urlsplit, parse_qs
+
+import httpx
+import requests
+
+from pymesomb import mesomb
+from pymesomb.async_operations import AsyncWalletOperation
+from pymesomb.operations import WalletOperation
+
+WALLET = {
+    'number': '1', 'country': 'CM', 'status': 'ACTIVE', 'last_activity': None, 'balance': 0, 'first_name': 'John',
+    'last_name': 'Doe', 'email': None, 'phone_number': '+237670000000', 'gender': 'MAN',
+}
+
+
+def get_page(url, count=5, size=2):
+    query = parse_qs(urlsplit(url).query)
+    page = int(query['page'][0])
+    ids = range((page - 1) * size + 1, min(count, page * size) + 1)
+    return {
+        'count': count,
+        'next': url.replace(f'page={page}', f'page={page + 1}') if page * size < count else None,
+        'previous': None,
+        'results': [dict(WALLET, id=id) for id in ids],
+    }
+
+
+class PaginationTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.provider_key = 'a1dc7a7391c538788043'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+        self.operation = WalletOperation(self.provider_key, self.access_key, self.secret_key)
+        self.urls = []
+        self.lock = threading.Lock()
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        with self.lock:
+            self.urls.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(get_page(url)).encode()
+        return response
+
+    def test_iter_wallets(self):
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            self.assertEqual([wallet.id for wallet in self.operation.iter_wallets()], [1, 2, 3, 4, 5])
+        self.assertEqual(len(self.urls), 3)
+
+    def test_parallel_pages(self):
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            wallets = self.operation.iter_wallets(prefetch=8)
+            self.assertEqual(next(wallets).id, 1)
+            # the remaining pages are requested in the background as soon as the count is known
+            for _ in range(100):
+                if len(self.urls) == 3:
+                    break
+                time.sleep(0.01)
+            self.assertEqual(len(self.urls), 3)
+            self.assertEqual([wallet.id for wallet in wallets], [2, 3, 4, 5])
+
+    def test_iter_transactions(self):
+        def request(method, url, data=None, headers=None, timeout=None):
+            self.urls.append(url)
+            response = requests.Response()
+            response.status_code = 200
+            data = get_page(url, count=3)
+            data['results'] = [{
+                'id': item['id'], 'status': 'SUCCESS', 'type': 'CREDIT', 'amount': 10, 'direction': 1, 'wallet': 7,
+                'balance_after': 10, 'date': '2025-02-10T10:08:31Z', 'country': 'CM', 'fin_trx_id': None,
+            } for item in data['results']]
+            response._content = json.dumps(data).encode()
+            return response
+
+        with mock.patch.object(requests.Session, 'request', side_effect=request):
+            transactions = list(self.operation.iter_transactions(wallet=7))
+        self.assertEqual([transaction.id for transaction in transactions], [1, 2, 3])
+        self.assertTrue(all('wallet=7' in url for url in self.urls))
+
+    def test_async_iter_wallets(self):
+        def handler(request: httpx.Request):
+            return httpx.Response(200, json=get_page(str(request.url), count=7))
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncWalletOperation(self.provider_key, self.access_key, self.secret_key,
+                                            client=client) as operation:
+                return [wallet.id async for wallet in operation.iter_wallets(prefetch=4)]
+
+        self.assertEqual(asyncio.run(run()), [1, 2, 3, 4, 5, 6, 7])
@@ -0,0 +1,156 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import requests
+
+from pymesomb import mesomb
+from pymesomb.operations import PaymentOperation
+from pymesomb.payout import PayoutEngine, read_payouts, IN_DOUBT, REJECTED, SUCCESS, DUPLICATED
+from pymesomb.retry import NO_RETRY
+from tests.helpers import TRANSACTION, make_response, make_transaction_response
+
+
+class PayoutTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.directory = tempfile.TemporaryDirectory()
+        self.journal = os.path.join(self.directory.name, 'journal.sqlite')
+        self.operation = PaymentOperation('2bb525516ff374bb52545bf22ae4da7d655ba9fd',
+                                          'c6c40b76-8119-4e93-81bf-bfb55417b392',
+                                          'fe8c2445-810f-4caa-95c9-778d51580163', write_retry=NO_RETRY)
+        self.deposits = []
+        self.known = {}
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        if '/transactions/check/' in url:
+            trx_id = url.split('ids=')[1].split('&')[0]
+            return make_response(200, [self.known[trx_id]] if trx_id in self.known else [])
+
+        trx_id = headers['X-MeSomb-TrxID']
+        self.deposits.append(trx_id)
+        receiver = json.loads(data)['receiver']
+        if receiver == 'timeout':
+            self.known[trx_id] = dict(TRANSACTION, reference=trx_id)
+            raise requests.ReadTimeout('read')
+        if receiver == 'invalid':
+            return make_response(400, {'detail': 'Invalid receiver', 'code': 'invalid-receiver'})
+        return make_response(200, make_transaction_response(trx_id))
+
+    def test_read_payouts(self):
+        path = os.path.join(self.directory.name, 'payouts.csv')
+        with open(path, 'w') as file:
+            file.write('trx_id,receiver,amount,service,country,customer\nP1,670000000,100,MTN,,\n'
+                       'P2,690000000,50,ORANGE,CM,"{""first_name"": ""John""}"\n')
+        self.assertEqual(list(read_payouts(path)), [
+            {'trx_id': 'P1', 'receiver': '670000000', 'amount': '100', 'service': 'MTN'},
+            {'trx_id': 'P2', 'receiver': '690000000', 'amount': '50', 'service': 'ORANGE', 'country': 'CM',
+             'customer': {'first_name': 'John'}},
+        ])
+
+        path = os.path.join(self.directory.name, 'payouts.ndjson')
+        with open(path, 'w') as file:
+            file.write('{"receiver": "670000000", "amount": 100, "service": "MTN"}\n\n')
+        self.assertEqual(list(read_payouts(path)), [{'receiver': '670000000', 'amount': 100, 'service': 'MTN'}])
+
+    def test_run_and_resume(self):
+        items = [
+            {'receiver': '670000000', 'amount': '100', 'service': 'MTN'},
+            {'receiver': 'timeout', 'amount': '100', 'service': 'MTN'},
+            {'receiver': 'invalid', 'amount': '100', 'service': 'MTN'},
+        ]
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            with PayoutEngine(self.operation, self.journal, concurrency=2, prefix='payroll') as engine:
+                results = {trx_id: status for trx_id, status, _ in engine.run(items)}
+                self.assertEqual(results, {'payroll-0': SUCCESS, 'payroll-1': IN_DOUBT, 'payroll-2': REJECTED})
+
+            with PayoutEngine(self.operation, self.journal, prefix='payroll') as engine:
+                results = {trx_id: status for trx_id, status, _ in engine.run(items)}
+                self.assertEqual(results, {'payroll-1': SUCCESS})
+                self.assertEqual(engine.journal.summary(), {SUCCESS: 2, REJECTED: 1})
+
+        self.assertEqual(self.deposits, ['payroll-0', 'payroll-1', 'payroll-2'])
+
+    def test_trx_id_required(self):
+        with PayoutEngine(self.operation, self.journal) as engine:
+            with self.assertRaises(ValueError):
+                list(engine.run([{'receiver': '670000000', 'amount': 100, 'service': 'MTN'}]))
+
+    def test_duplicated_trx_id(self):
+        items = [
+            {'trx_id': 'T1', 'receiver': 'timeout', 'amount': 100, 'service': 'MTN'},
+            {'trx_id': 'T1', 'receiver': '670000000', 'amount': 100, 'service': 'MTN'},
+            {'trx_id': 'T2', 'receiver': '670000000', 'amount': 100, 'service': 'MTN'},
+        ]
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            with PayoutEngine(self.operation, self.journal, concurrency=4) as engine:
+                results = [(trx_id, status) for trx_id, status, _ in engine.run(items)]
+
+        self.assertEqual(sorted(results), [('T1', DUPLICATED), ('T1', IN_DOUBT), ('T2', SUCCESS)])
+        self.assertEqual(sorted(self.deposits), ['T1', 'T2'])
+
+    def test_deposit_not_retried(self):
+        # with retries, the refusal of the retry would hide that the first attempt may have moved the money
+        operation = PaymentOperation('2bb525516ff374bb52545bf22ae4da7d655ba9fd', 'c6c40b76-8119-4e93-81bf-bfb55417b392',
+                                     'fe8c2445-810f-4caa-95c9-778d51580163')
+        responses = [requests.ReadTimeout('read'), make_response(404, {'detail': 'Not found', 'code': 'not-found'})]
+
+        def request(method, url, data=None, headers=None, timeout=None):
+            self.deposits.append(headers['X-MeSomb-TrxID'])
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        with mock.patch.object(requests.Session, 'request', side_effect=request), mock.patch('time.sleep'):
+            with PayoutEngine(operation, self.journal) as engine:
+                items = [{'trx_id': 'T1', 'receiver': '670000000', 'amount': 100, 'service': 'MTN'}]
+                results = [(trx_id, status) for trx_id, status, _ in engine.run(items)]
+                self.assertEqual(engine.journal.get_status('T1'), IN_DOUBT)
+
+        self.assertEqual(results, [('T1', IN_DOUBT)])
+        self.assertEqual(self.deposits, ['T1'])
+        self.assertIsNot(operation.write_retry, NO_RETRY)
+
+    def test_journal_without_run(self):
+        connection = sqlite3.connect(self.journal)
+        connection.execute('CREATE TABLE payouts (trx_id TEXT PRIMARY KEY, status TEXT NOT NULL, pk TEXT, '
+                           'detail TEXT, updated REAL NOT NULL)')
+        connection.execute("INSERT INTO payouts VALUES ('T1', 'IN_DOUBT', NULL, NULL, 0)")
+        connection.commit()
+        connection.close()
+
+        items = [{'trx_id': 'T1', 'receiver': '670000000', 'amount': 100, 'service': 'MTN'}] * 2
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            with PayoutEngine(self.operation, self.journal) as engine:
+                results = [(trx_id, status) for trx_id, status, _ in engine.run(items)]
+
+        self.assertEqual(sorted(results), [('T1', DUPLICATED), ('T1', SUCCESS)])
+        self.assertEqual(self.deposits, ['T1'])
+
+    def test_auto_service(self):
+        bodies = []
+
+        def request(method, url, data=None, headers=None, timeout=None):
+            if data:
+                bodies.append(json.loads(data))
+            return self.request(method, url, data, headers, timeout)
+
+        items = [
+            {'trx_id': 'A1', 'receiver': '+237 677 55 92 30', 'amount': 100, 'service': 'auto'},
+            {'trx_id': 'A2', 'receiver': '6775', 'amount': 100, 'service': 'auto'},
+        ]
+        with mock.patch.object(requests.Session, 'request', side_effect=request):
+            with PayoutEngine(self.operation, self.journal) as engine:
+                results = {trx_id: status for trx_id, status, _ in engine.run(items)}
+                self.assertEqual(engine.journal.get_status('A2'), REJECTED)
+
+        self.assertEqual(results, {'A1': SUCCESS, 'A2': REJECTED})
+        self.assertEqual(self.deposits, ['A1'])
+        self.assertEqual((bodies[0]['service'], bodies[0]['receiver']), ('MTN', '677559230'))
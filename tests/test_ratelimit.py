@@ -0,0 +1,84 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import requests
+
+from pymesomb import mesomb
+from pymesomb.exceptions import DeadlineExceededException
+from pymesomb.operations import PaymentOperation
+from pymesomb.ratelimit import RateLimiter
+
+
+class RateLimiterTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.application_key = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+
+    def test_burst_then_rate(self):
+        limiter = RateLimiter(rate=10, burst=2)
+        with mock.patch('time.monotonic', return_value=100):
+            self.assertEqual([limiter.reserve('app') for _ in range(4)], [0, 0, 0.1, 0.2])
+            self.assertEqual(limiter.reserve('other'), 0)
+        with mock.patch('time.monotonic', return_value=100.4):
+            self.assertEqual(limiter.reserve('app'), 0)
+
+    def test_max_wait(self):
+        limiter = RateLimiter(rate=1, burst=1, limits={'fast': (100, 10)})
+        with mock.patch('time.monotonic', return_value=100):
+            self.assertEqual(limiter.reserve('app'), 0)
+            self.assertIsNone(limiter.reserve('app', max_wait=0.5))
+            self.assertEqual(limiter.reserve('app', max_wait=1), 1)
+            self.assertEqual([limiter.reserve('fast') for _ in range(10)], [0] * 10)
+
+    def test_shared_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'buckets.json')
+            first, second = RateLimiter(rate=10, burst=1, path=path), RateLimiter(rate=10, burst=1, path=path)
+            with mock.patch('time.time', return_value=100):
+                self.assertEqual(first.reserve('app'), 0)
+                self.assertAlmostEqual(second.reserve('app'), 0.1)
+
+    def test_acquire_async(self):
+        limiter = RateLimiter(rate=1000, burst=1)
+
+        async def run():
+            return await asyncio.gather(*[limiter.acquire_async('app') for _ in range(5)])
+
+        self.assertEqual(asyncio.run(run()), [True] * 5)
+
+    def test_acquire_async_shared_file(self):
+        threads = []
+
+        def reserve_shared(*args):
+            threads.append(threading.current_thread())
+            return 0
+
+        async def run():
+            return await asyncio.gather(*[limiter.acquire_async('app') for _ in range(3)])
+
+        with tempfile.TemporaryDirectory() as directory:
+            limiter = RateLimiter(rate=1000, burst=1, path=os.path.join(directory, 'buckets.json'))
+            with mock.patch.object(limiter, '_reserve_shared', side_effect=reserve_shared):
+                self.assertEqual(asyncio.run(run()), [True] * 3)
+
+        # the file is never locked on the thread of the event loop
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def test_operation_uses_limiter(self):
+        limiter = RateLimiter(rate=1, burst=1)
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key, rate_limiter=limiter)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'[]'
+        with mock.patch.object(requests.Session, 'request', return_value=response) as request:
+            operation.check_transactions(['1'])
+            with self.assertRaises(DeadlineExceededException):
+                operation.check_transactions(['1'], deadline=0.5)
+        self.assertEqual(request.call_count, 1)
@@ -0,0 +1,90 @@
+import threading
+import unittest
+from unittest import mock
+
+from pymesomb import mesomb
+from pymesomb.exceptions import DeadlineExceededException
+from pymesomb.models import Transaction
+from pymesomb.operations import PaymentOperation
+from pymesomb.reconciler import TransactionReconciler
+from tests.helpers import TRANSACTION
+
+
+class ReconcilerTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.operation = PaymentOperation('2bb525516ff374bb52545bf22ae4da7d655ba9fd',
+                                          'c6c40b76-8119-4e93-81bf-bfb55417b392',
+                                          'fe8c2445-810f-4caa-95c9-778d51580163')
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def check_transactions(self, ids, source='MESOMB'):
+        with self.lock:
+            self.calls.append(list(ids))
+            checks = sum(1 for call in self.calls for id in call if id == 'slow')
+        transactions = []
+        for id in ids:
+            if id == 'success':
+                transactions.append(Transaction(dict(TRANSACTION, pk=id, status='SUCCESS')))
+            elif id == 'failed':
+                transactions.append(Transaction(dict(TRANSACTION, pk=id, status='FAILED')))
+            elif id == 'slow':
+                transactions.append(Transaction(dict(TRANSACTION, pk=id, status='SUCCESS' if checks >= 3 else
+                                                     'PENDING')))
+            elif id == 'pending':
+                transactions.append(Transaction(dict(TRANSACTION, pk=id, status='PENDING')))
+        return transactions
+
+    def test_resolve_in_batches(self):
+        done = []
+        with mock.patch.object(self.operation, 'check_transactions', side_effect=self.check_transactions):
+            with TransactionReconciler(self.operation, min_interval=0.01, max_interval=0.02) as reconciler:
+                futures = reconciler.track_many(['success', 'failed', 'slow'])
+                reconciler.track('success', callback=done.append)
+                self.assertEqual(futures[0].result(5).status, 'SUCCESS')
+                self.assertEqual(futures[1].result(5).status, 'FAILED')
+                self.assertEqual(futures[2].result(5).status, 'SUCCESS')
+                self.assertEqual(len(reconciler), 0)
+
+        self.assertEqual(done, [futures[0]])
+        self.assertEqual(sorted(self.calls[0]), ['failed', 'slow', 'success'])
+        self.assertEqual(sum(call.count('slow') for call in self.calls), 3)
+
+    def test_timeout_and_errors(self):
+        def check_transactions(ids, source='MESOMB'):
+            if not self.calls:
+                self.calls.append(ids)
+                raise ConnectionError('reset')
+            return self.check_transactions(ids, source)
+
+        with mock.patch.object(self.operation, 'check_transactions', side_effect=check_transactions):
+            with TransactionReconciler(self.operation, min_interval=0.01, timeout=0.1) as reconciler:
+                success = reconciler.track('success')
+                pending = reconciler.track('pending')
+                self.assertEqual(success.result(5).status, 'SUCCESS')
+                with self.assertRaises(DeadlineExceededException):
+                    pending.result(5)
+
+    def test_stop_cancels_pending(self):
+        reconciler = TransactionReconciler(self.operation, min_interval=60)
+        reconciler.start()
+        future = reconciler.track('pending')
+        reconciler.stop()
+        self.assertTrue(future.cancelled())
+
+    def test_intervals(self):
+        reconciler = TransactionReconciler(self.operation, min_interval=1, max_interval=10, factor=2)
+        self.assertEqual([reconciler.get_interval(attempt) for attempt in range(6)], [1, 2, 4, 8, 10, 10])
+
+        reconciler = TransactionReconciler(self.operation, min_interval=0.5, max_interval=60, factor=1.5)
+        self.assertEqual(reconciler.get_interval(1100), 60)
+
+    def test_unexpected_error(self):
+        # raw responses instead of models
+        with mock.patch.object(self.operation, 'check_transactions', return_value=[{'pk': 'success'}]):
+            with TransactionReconciler(self.operation, min_interval=0.01) as reconciler:
+                future = reconciler.track('success')
+                with self.assertRaises(AttributeError):
+                    future.result(5)
+                self.assertEqual(len(reconciler), 0)
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+import httpx
+import requests
+
+from pymesomb import mesomb
+from pymesomb.async_operations import AsyncPaymentOperation
+from pymesomb.cache import TTLCache
+from pymesomb.models import TransactionResponse, Wallet
+from pymesomb.operations import PaymentOperation, WalletOperation
+from tests.helpers import TRANSACTION, TRANSACTION_RESPONSE
+
+
+WALLET = {
+    'id': 228, 'number': '1', 'country': 'CM', 'status': 'ACTIVE', 'last_activity': None, 'balance': 100,
+    'first_name': 'John', 'last_name': 'Doe', 'email': None, 'phone_number': '+237677550000', 'gender': 'MAN',
+}
+
+WALLET_TRANSACTION = {
+    'id': 1, 'status': 'SUCCESS', 'type': 'CREDIT', 'amount': 50, 'direction': 1, 'wallet': 228,
+    'balance_after': 150, 'date': '2025-02-10T10:08:31Z', 'country': 'CM', 'fin_trx_id': None,
+}
+
+
+class ResponseModeTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.application_key = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+        self.provider_key = 'a1dc7a7391c538788043'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+        self.urls = []
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        self.urls.append(url)
+        if '/adjust/' in url:
+            content = WALLET_TRANSACTION
+        elif '/wallets/?page=' in url:
+            content = {'count': 2, 'next': None, 'previous': None, 'results': [WALLET, dict(WALLET, id=229)]}
+        elif '/wallets/' in url:
+            content = WALLET
+        elif '/transactions/' in url:
+            content = [TRANSACTION]
+        else:
+            content = TRANSACTION_RESPONSE
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(content).encode()
+        return response
+
+    def test_raw_mode(self):
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key, response_mode='raw')
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            response = operation.make_collect(amount=100, service='MTN', payer='670000000')
+            transactions = operation.get_transactions(['a4bd7d2b-e7ac-40ce-b1e1-9b1b9e5e1a1c'])
+        self.assertEqual(response, TRANSACTION_RESPONSE)
+        self.assertEqual(transactions, [TRANSACTION])
+        self.assertRaises(AssertionError, PaymentOperation, self.application_key, self.access_key, self.secret_key,
+                          response_mode='json')
+
+    def test_with_response_mode(self):
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key,
+                                     status_cache=TTLCache(ttl=60))
+        raw = operation.with_response_mode('raw')
+        self.assertIs(raw.session, operation.session)
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            self.assertIsInstance(raw.make_deposit(amount=100, service='MTN', receiver='670000000'), dict)
+            self.assertIsInstance(operation.make_deposit(amount=100, service='MTN', receiver='670000000'),
+                                  TransactionResponse)
+        self.assertEqual(operation.response_mode, 'model')
+
+        raw.close()
+        self.assertIsNotNone(operation._session)
+
+    def test_wallet_cache(self):
+        operation = WalletOperation(self.provider_key, self.access_key, self.secret_key,
+                                    wallet_cache=TTLCache(ttl=60))
+        raw = operation.with_response_mode('raw')
+        with mock.patch.object(requests.Session, 'request', side_effect=self.request):
+            self.assertIsInstance(operation.get_wallet(228), Wallet)
+            self.assertEqual(raw.get_wallet(228), WALLET)
+            # the cached wallet can not be patched from a raw transaction, it is loaded again
+            self.assertEqual(raw.add_money(228, 50), WALLET_TRANSACTION)
+            self.assertIsInstance(operation.get_wallet(228), Wallet)
+            self.assertEqual([wallet['id'] for wallet in raw.iter_wallets()], [228, 229])
+        self.assertEqual([url.split('/api/v1.1/')[1] for url in self.urls], [
+            'wallet/wallets/228/', 'wallet/wallets/228/', 'wallet/wallets/228/adjust/', 'wallet/wallets/228/',
+            'wallet//wallets/?page=1',
+        ])
+
+    def test_async_raw_mode(self):
+        def handler(request: httpx.Request):
+            return httpx.Response(200, json=TRANSACTION_RESPONSE)
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncPaymentOperation(self.application_key, self.access_key, self.secret_key,
+                                             client=client) as operation:
+                raw = operation.with_response_mode('raw')
+                self.assertIs(raw.client, client)
+                return (await raw.make_collect(amount=100, service='MTN', payer='670000000'),
+                        await operation.make_collect(amount=100, service='MTN', payer='670000000'))
+
+        raw, model = asyncio.run(run())
+        self.assertEqual(raw, TRANSACTION_RESPONSE)
+        self.assertIsInstance(model, TransactionResponse)
@@ -0,0 +1,75 @@
+import unittest
+from unittest import mock
+
+import requests
+
+from pymesomb import mesomb
+from pymesomb.exceptions import ServerException, InvalidClientRequestException, ServiceNotFoundException
+from pymesomb.operations import PaymentOperation
+from pymesomb.retry import RetryPolicy, parse_retry_after
+from tests.helpers import make_response
+
+
+class RetryTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.application_key = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+        self.operation = PaymentOperation(self.application_key, self.access_key, self.secret_key,
+                                          read_retry=RetryPolicy(total=3, jitter=False, statuses=(500, 503)),
+                                          write_retry=RetryPolicy(total=1, jitter=False))
+
+    def test_retry_post_with_same_nonce_and_trx_id(self):
+        sent = []
+
+        def request(method, url, data=None, headers=None, timeout=None):
+            sent.append(dict(headers))
+            if len(sent) == 1:
+                raise requests.ConnectionError('reset')
+            return make_response(400, b'{"detail": "Invalid amount", "code": "invalid-amount"}')
+
+        with mock.patch.object(requests.Session, 'request', side_effect=request), \
+                mock.patch('time.sleep') as sleep:
+            with self.assertRaises(InvalidClientRequestException):
+                self.operation.make_deposit(amount=5, service='MTN', receiver='670000000', nonce='nonce', trx_id='1')
+
+        self.assertEqual(len(sent), 2)
+        sleep.assert_called_once_with(0.5)
+        for headers in sent:
+            self.assertEqual(headers['x-mesomb-nonce'], 'nonce')
+            self.assertEqual(headers['X-MeSomb-TrxID'], '1')
+
+    def test_write_retry_limit(self):
+        response = make_response(503, b'Unavailable')
+        with mock.patch.object(requests.Session, 'request', return_value=response) as request, mock.patch('time.sleep'):
+            with self.assertRaises(ServerException):
+                self.operation.make_deposit(amount=5, service='MTN', receiver='670000000')
+        self.assertEqual(request.call_count, 2)
+
+    def test_read_retry_respects_retry_after(self):
+        responses = [make_response(503, b'Unavailable', {'Retry-After': '7'}), make_response(500, b'Error'),
+                     make_response(200, b'[]')]
+        with mock.patch.object(requests.Session, 'request', side_effect=responses) as request, \
+                mock.patch('time.sleep') as sleep:
+            self.assertEqual(self.operation.check_transactions(['1']), [])
+        self.assertEqual(request.call_count, 3)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [7, 1])
+
+    def test_client_errors_are_not_retried(self):
+        response = make_response(404, b'{"detail": "Not found", "code": "not-found"}')
+        with mock.patch.object(requests.Session, 'request', return_value=response) as request:
+            with self.assertRaises(ServiceNotFoundException):
+                self.operation.get_status()
+        self.assertEqual(request.call_count, 1)
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+        self.assertEqual([policy.get_backoff(attempt) for attempt in range(5)], [0.5, 1, 2, 3, 3])
+        jittered = RetryPolicy(backoff_factor=0.5, max_backoff=3)
+        self.assertTrue(all(0 <= jittered.get_backoff(2) <= 2 for _ in range(100)))
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after('12'), 12)
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0)
+        self.assertEqual(parse_retry_after('soon'), 0)
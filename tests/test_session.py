@@ -0,0 +1,47 @@
+import unittest
+from unittest import mock
+
+import requests
+
+from pymesomb import mesomb
+from pymesomb.operations import PaymentOperation, WalletOperation
+from tests.helpers import make_response
+
+
+class SessionTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.application_key = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+
+    def test_session_is_reused_between_requests(self):
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key)
+        with mock.patch.object(requests.Session, 'request', return_value=make_response(content=b'[]')) as request:
+            operation.get_transactions(['1'])
+            session = operation.session
+            operation.check_transactions(['1'])
+        self.assertIs(operation.session, session)
+        self.assertEqual(request.call_count, 2)
+
+    def test_pool_configuration(self):
+        operation = WalletOperation(self.application_key, self.access_key, self.secret_key, pool_maxsize=50,
+                                    keep_alive=False)
+        adapter = operation.session.get_adapter(mesomb.host)
+        self.assertEqual(adapter._pool_maxsize, 50)
+        self.assertEqual(operation.session.headers['Connection'], 'close')
+
+    def test_context_manager_closes_owned_session(self):
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key)
+        with mock.patch.object(operation.session, 'close') as close:
+            with operation:
+                pass
+        close.assert_called_once_with()
+        self.assertIsNone(operation._session)
+
+    def test_shared_session_is_not_closed(self):
+        session = requests.Session()
+        with mock.patch.object(session, 'close') as close:
+            with PaymentOperation(self.application_key, self.access_key, self.secret_key, session=session):
+                pass
+            close.assert_not_called()
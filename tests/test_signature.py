@@ -0,0 +1,83 @@
+import json
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import requests
+
+from pymesomb import mesomb
+from pymesomb.exceptions import InvalidClientRequestException
+from pymesomb.operations import PaymentOperation
+from pymesomb.signature import Signature, Signer
+
+
+class SignatureTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.application_key = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+        self.credentials = {'access_key': self.access_key, 'secret_key': self.secret_key}
+        self.date = datetime(2025, 2, 10, 10, 8, 31)
+
+    def test_sign_request_with_bytes_body(self):
+        body = {'amount': 100, 'service': 'MTN', 'payer': '670000000', 'fees': True}
+        url = 'http://127.0.0.1:8000/api/v1.1/payment/collect/'
+        self.assertEqual(
+            Signature.sign_request('payment', 'POST', url, self.date, 'nonce', self.credentials,
+                                   {'content-type': 'application/json'}, body),
+            Signature.sign_request('payment', 'POST', url, self.date, 'nonce', self.credentials,
+                                   {'content-type': 'application/json'},
+                                   json.dumps(body, separators=(',', ':')).encode()),
+        )
+
+    def test_signer_matches_sign_request(self):
+        signer = Signer('payment', self.access_key, self.secret_key)
+        cases = [
+            ('GET', 'http://127.0.0.1:8000/api/v1.1/payment/status/', None, None),
+            ('GET', 'http://127.0.0.1:8000/api/v1.1/payment/transactions/?ids=a&ids=b c&source=MESOMB', None, None),
+            ('GET', 'http://127.0.0.1:8000/api/v1.1/payment/transactions/check/?ids=a,b&source=MESOMB', None, None),
+            ('POST', 'http://127.0.0.1:8000/api/v1.1/payment/collect/', {'content-type': 'application/json'},
+             {'amount': 100, 'service': 'MTN', 'payer': '670000000'}),
+        ]
+        for date in [self.date, datetime(2025, 2, 11, 0, 0, 1), self.date]:
+            for method, url, headers, body in cases:
+                self.assertEqual(
+                    signer.sign(method, url, date, 'nonce', dict(headers) if headers else None, body),
+                    Signature.sign_request('payment', method, url, date, 'nonce', self.credentials,
+                                           dict(headers) if headers else None, body),
+                )
+
+        # keys longer than the SHA-1 block are hashed first
+        for secret_key in ['', 'k' * 64, 'k' * 65]:
+            signer = Signer('payment', self.access_key, secret_key)
+            credentials = {'access_key': self.access_key, 'secret_key': secret_key}
+            self.assertEqual(signer.sign('GET', cases[0][1], self.date, 'nonce'),
+                             Signature.sign_request('payment', 'GET', cases[0][1], self.date, 'nonce', credentials))
+
+    def test_signed_body_is_sent_body(self):
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key)
+        response = requests.Response()
+        response.status_code = 400
+        response._content = b'{"detail": "Invalid amount", "code": "invalid-amount"}'
+        with mock.patch.object(requests.Session, 'request', return_value=response) as request, \
+                mock.patch.object(operation.signer, 'sign', wraps=operation.signer.sign) as sign:
+            with self.assertRaises(InvalidClientRequestException):
+                operation.make_collect(amount=5, service='MTN', payer='670000000', nonce='nonce', trx_id='1')
+
+        data = request.call_args.kwargs['data']
+        self.assertEqual(sign.call_args.kwargs['body'], data)
+        self.assertEqual(json.loads(data), {
+            'amount': 5, 'payer': '670000000', 'fees': True, 'service': 'MTN', 'country': 'CM', 'currency': 'XAF',
+            'amount_currency': 'XAF', 'conversion': False,
+        })
+        self.assertEqual(request.call_args.kwargs['headers']['Content-Type'], 'application/json')
+        self.assertEqual(request.call_args.kwargs['headers']['X-MeSomb-TrxID'], '1')
+
+    def test_custom_json_encoder(self):
+        encoder = mock.Mock(return_value=b'{"amount":5}')
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key)
+        with mock.patch.object(mesomb, 'json_encoder', encoder):
+            _, _, data = operation.prepare_request('POST', 'payment/collect/', self.date, 'nonce', {'amount': 5})
+        encoder.assert_called_once_with({'amount': 5})
+        self.assertEqual(data, b'{"amount":5}')
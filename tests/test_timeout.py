@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+import requests
+
+from pymesomb import mesomb
+from pymesomb.async_operations import AsyncPaymentOperation
+from pymesomb.exceptions import (APIException, ConnectTimeoutException, ReadTimeoutException,
+                                 DeadlineExceededException)
+from pymesomb.operations import PaymentOperation, WalletOperation
+from pymesomb.retry import RetryPolicy, NO_RETRY
+
+
+class TimeoutTest(unittest.TestCase):
+    def setUp(self):
+        mesomb.host = 'http://127.0.0.1:8000'
+        self.application_key = '2bb525516ff374bb52545bf22ae4da7d655ba9fd'
+        self.access_key = 'c6c40b76-8119-4e93-81bf-bfb55417b392'
+        self.secret_key = 'fe8c2445-810f-4caa-95c9-778d51580163'
+
+    def test_default_and_per_call_timeouts(self):
+        operation = PaymentOperation(self.application_key, self.access_key, self.secret_key, connect_timeout=3,
+                                     read_timeout=20)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'[]'
+        with mock.patch.object(requests.Session, 'request', return_value=response) as request:
+            operation.check_transactions(['1'])
+            self.assertEqual(request.call_args.kwargs['timeout'], (3, 20))
+            operation.check_transactions(['1'], timeout=5)
+            self.assertEqual(request.call_args.kwargs['timeout'], (5, 5))
+            operation.check_transactions(['1'], timeout=(1, 2))
+            self.assertEqual(request.call_args.kwargs['timeout'], (1, 2))
+
+    def test_timeout_exceptions(self):
+        operation = WalletOperation(self.application_key, self.access_key, self.secret_key, read_retry=NO_RETRY)
+        with mock.patch.object(requests.Session, 'request', side_effect=requests.ConnectTimeout('connect')):
+            with self.assertRaises(ConnectTimeoutException):
+                operation.get_wallet(1)
+        with mock.patch.object(requests.Session, 'request', side_effect=requests.ReadTimeout('read')):
+            with self.assertRaises(ReadTimeoutException) as context:
+                operation.get_wallet(1)
+        self.assertIsInstance(context.exception, APIException)
+        with mock.patch.object(requests.Session, 'request', side_effect=requests.ConnectionError('refused')):
+            with self.assertRaises(requests.ConnectionError):
+                operation.get_wallet(1)
+
+    def test_deadline_stops_retries(self):
+        operation = WalletOperation(self.application_key, self.access_key, self.secret_key,
+                                    read_retry=RetryPolicy(total=10, backoff_factor=1, jitter=False))
+        with mock.patch.object(requests.Session, 'request', side_effect=requests.ReadTimeout('read')) as request, \
+                mock.patch('time.sleep') as sleep:
+            with self.assertRaises(DeadlineExceededException):
+                operation.get_wallet(1, deadline=1.5)
+        self.assertEqual(request.call_count, 2)
+        sleep.assert_called_once_with(1)
+        self.assertLessEqual(request.call_args.kwargs['timeout'][1], 1.5)
+
+    def test_expired_deadline(self):
+        operation = WalletOperation(self.application_key, self.access_key, self.secret_key)
+        with mock.patch.object(requests.Session, 'request') as request:
+            with self.assertRaises(DeadlineExceededException):
+                operation.get_wallet(1, deadline=0)
+        request.assert_not_called()
+
+    def test_async_read_timeout(self):
+        def handler(request):
+            raise httpx.ReadTimeout('read', request=request)
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            operation = AsyncPaymentOperation(self.application_key, self.access_key, self.secret_key, client=client,
+                                              read_retry=NO_RETRY)
+            return await operation.get_status(timeout=1)
+
+        with self.assertRaises(ReadTimeoutException):
+            asyncio.run(run())
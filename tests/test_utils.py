@@ -8,4 +8,73 @@ class UtilTest(unittest.TestCase):
         self.assertEqual(detect_operator('677559230'), 'MTN')
         self.assertEqual(detect_operator('237677559230'), 'MTN')
         self.assertEqual(detect_operator('690090980'), 'ORANGE')
-        self.assertEqual(detect_operator('237690090980'), 'ORANGE')
\ No newline at end of file
+        self.assertEqual(detect_operator('237690090980'), 'ORANGE')
+
+    def test_operator_prefixes(self):
+        import itertools
+        import re
+
+        from pymesomb.utils import detect_operator, detect_operators
+
+        regexes = {
+            'MTN': r'^(237)?(67|65[0-4]|68[0-3])',
+            'ORANGE': r'^(237)?(69|65[5-9])',
+            'NEXTTEL': r'^(237)?(66)',
+            'YOOMEE': r'^(237)?(242)',
+            'CAMTEL': r'^(237)?(233|222|243|62)',
+            'MESOMB': r'^7',
+        }
+
+        def detect(phone):
+            for operator, regex in regexes.items():
+                if re.match(regex, phone):
+                    return operator
+
+        numbers = [''.join(digits) for length in range(6) for digits in itertools.product('0123456789', repeat=length)]
+        numbers += ['+237677559230', '237', 'MTN']
+        expected = [detect(phone) for phone in numbers]
+        self.assertEqual([detect_operator(phone) for phone in numbers], expected)
+        self.assertEqual(detect_operators(numbers), expected)
+        self.assertEqual(detect_operators(iter(reversed(numbers))), expected[::-1])
+
+    def test_detect_operators(self):
+        from pymesomb.utils import OperatorPrefixes, OPERATOR_PREFIXES, detect_operator, detect_operators, \
+            register_operator_prefixes
+
+        self.assertEqual(detect_operators(['677559230', '237690090980', '620000000', '700000', '123']),
+                         ['MTN', 'ORANGE', 'CAMTEL', 'MESOMB', None])
+        self.assertIsNone(detect_operator('771234567', 'SN'))
+        self.assertEqual(detect_operators(['771234567'], 'SN'), [None])
+
+        register_operator_prefixes('SN', OperatorPrefixes('221', [('ORANGE', ('77', '78')), ('FREE', ('76',))]))
+        try:
+            self.assertEqual(detect_operators(['771234567', '221761234567', '701234567'], 'SN'),
+                             ['ORANGE', 'FREE', None])
+        finally:
+            del OPERATOR_PREFIXES['SN']
+
+    def test_detect_operators_numpy(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest('numpy is not installed')
+
+        from pymesomb.utils import detect_operators
+
+        operators = detect_operators(numpy.array([['677559230', '237690090980'], ['123', '']]))
+        self.assertEqual(operators.shape, (2, 2))
+        self.assertEqual(operators.tolist(), [['MTN', 'ORANGE'], [None, None]])
+
+    def test_normalize_msisdn(self):
+        from pymesomb.utils import normalize_msisdn
+
+        self.assertEqual(normalize_msisdn('+237 677 55 92 30'), '677559230')
+        self.assertEqual(normalize_msisdn('00237677559230'), '677559230')
+        self.assertEqual(normalize_msisdn('237677559230'), '677559230')
+        self.assertEqual(normalize_msisdn('(677) 55-92.30'), '677559230')
+        self.assertEqual(normalize_msisdn('2376775592'), '2376775592')
+        self.assertIsNone(normalize_msisdn('+33612345678'))
+        self.assertIsNone(normalize_msisdn('+237'))
+        self.assertIsNone(normalize_msisdn('67755923O'))
+        self.assertIsNone(normalize_msisdn('６７７５５９２３０'))
+        self.assertEqual(normalize_msisdn('+221 77 123 45 67', 'SN'), '221771234567')